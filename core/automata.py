@@ -1,5 +1,54 @@
+import codecs
+from array import array
+from collections import deque
+
+from core.bitparallel_nfa import BitParallelNFA
+from core.compiled_automata import CompiledDFA
+from core.frozen_automata import EPSILON, FrozenAutomata
+from core.language_counting import WordCounter
+from core.lazy_dfa import LazyDFA
+from core.product_automata import DIFFERENCE, INTERSECTION, SINK_NAME, UNION, LazyProduct
+
+# Niveles de traza de la simulación
+TRACE_NONE = 'none'        # Sin historial ni copias
+TRACE_SUMMARY = 'summary'  # Solo la secuencia de estados, en arreglos compactos
+TRACE_FULL = 'full'        # Historial completo (estados y transiciones) para la GUI
+TRACE_LEVELS = (TRACE_NONE, TRACE_SUMMARY, TRACE_FULL)
+
+
+def _structural_attribute(name):
+    """Atributo cuyo reemplazo recalcula los datos derivados del autómata"""
+    private_name = '_' + name
+
+    def getter(self):
+        return getattr(self, private_name)
+
+    def setter(self, value):
+        setattr(self, private_name, value)
+        self.invalidate_caches()
+
+    return property(getter, setter)
+
+
 class Automata:
-    def __init__(self, states, alphabet, transitions, initial_state, final_states):
+    """
+    Autómata finito (AFD, AFN o AFN-ε) editable.
+
+    A partir de ``states``, ``alphabet``, ``transitions``, ``initial_state`` y
+    ``final_states`` se precalculan las ε-clausuras, los estados muertos y vistas
+    de conjunto del alfabeto y de los finales. Al asignar cualquiera de esos
+    atributos los datos derivados se recalculan solos; si se modifican en su
+    lugar (por ejemplo ``final_states.append(...)``), llame después a
+    ``invalidate_caches()``.
+    """
+    states = _structural_attribute('states')
+    alphabet = _structural_attribute('alphabet')
+    transitions = _structural_attribute('transitions')
+    initial_state = _structural_attribute('initial_state')
+    final_states = _structural_attribute('final_states')
+
+    def __init__(self, states, alphabet, transitions, initial_state, final_states,
+                 trace_level=TRACE_FULL):
         """
         Inicializa el autómata finito.
         
@@ -7,40 +56,214 @@ class Automata:
         :param alphabet: Alfabeto de símbolos (list)
         :param transitions: Diccionario de transiciones 
             formato: {estado_actual: {símbolo: [estados_destino]}}
+            El símbolo 'ε' denota transiciones vacías.
         :param initial_state: Estado inicial (str)
         :param final_states: Estados finales (list)
+        :param trace_level: Nivel de traza: 'none', 'summary' o 'full' (str)
         """
-        self.states = states
-        self.alphabet = alphabet
-        self.transitions = transitions
-        self.initial_state = initial_state
-        self.final_states = final_states
-        self.current_states = {initial_state}
-        self.history = []
-        
+        self._states = states
+        self._alphabet = alphabet
+        self._transitions = transitions
+        self._initial_state = initial_state
+        self._final_states = final_states
+        self.invalidate_caches()
+        self.set_trace_level(trace_level)
+
+    def invalidate_caches(self):
+        """
+        Recalcula los datos derivados de la estructura del autómata (ε-clausuras,
+        estados muertos y vistas de conjunto). Se llama sola al asignar un atributo
+        estructural; llámela a mano tras modificar uno en su lugar.
+        """
+        # Vistas de conjunto para las comprobaciones de pertenencia de cada paso
+        self._alphabet_set = frozenset(self._alphabet)
+        self._final_set = frozenset(self._final_states)
+        self.epsilon_closures = self._compute_epsilon_closures()
+        # Estados desde los que ya no se puede aceptar: permiten terminar antes
+        self._dead_states = self.dead_states()
+        self._state_ids = None
+        self._state_names = None
+
+    def _compute_epsilon_closures(self):
+        """
+        Precalcula la ε-clausura de cada estado una sola vez.
+
+        Las componentes fuertemente conexas del grafo de transiciones ε se obtienen
+        con el algoritmo de Tarjan (iterativo), que las emite en orden topológico
+        inverso; así la clausura de cada componente es la unión de sus miembros y
+        de las clausuras ya calculadas de sus sucesoras. Todos los estados de una
+        componente comparten el mismo ``frozenset``.
+
+        :return: Dict {estado: frozenset(clausura)} o None si no hay transiciones ε
+        """
+        graph = {state: trans[EPSILON] for state, trans in self.transitions.items()
+                 if trans.get(EPSILON)}
+        if not graph:
+            return None
+
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        component_of = {}
+        closures = []
+        counter = 0
+
+        for root in graph:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(graph.get(root, ())))]
+            while work:
+                state, successors = work[-1]
+                advanced = False
+                for dest_state in successors:
+                    if dest_state not in index:
+                        index[dest_state] = lowlink[dest_state] = counter
+                        counter += 1
+                        stack.append(dest_state)
+                        on_stack.add(dest_state)
+                        work.append((dest_state, iter(graph.get(dest_state, ()))))
+                        advanced = True
+                        break
+                    if dest_state in on_stack:
+                        lowlink[state] = min(lowlink[state], index[dest_state])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[state])
+                if lowlink[state] == index[state]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member == state:
+                            break
+                    # Las componentes sucesoras ya están cerradas (orden topológico inverso)
+                    closure = set(members)
+                    for member in members:
+                        for dest_state in graph.get(member, ()):
+                            if dest_state in component_of:
+                                closure |= closures[component_of[dest_state]]
+                    closure = frozenset(closure)
+                    for member in members:
+                        component_of[member] = len(closures)
+                    closures.append(closure)
+
+        return {state: closures[component] for state, component in component_of.items()}
+
+    def epsilon_closure(self, states):
+        """
+        Obtiene la ε-clausura de un conjunto de estados usando las clausuras precalculadas.
+
+        :param states: Iterable de estados
+        :return: Conjunto de estados alcanzables mediante transiciones ε (set)
+        """
+        closures = self.epsilon_closures
+        if closures is None:
+            return set(states)
+        closure = set()
+        for state in states:
+            closure |= closures.get(state, {state})
+        return closure
+
+    def set_trace_level(self, trace_level):
+        """
+        Cambia el nivel de traza y reinicia el autómata.
+
+        - 'none': no se guarda historial ni se copian conjuntos.
+        - 'summary': solo se guarda la secuencia de estados como índices enteros en
+          ``state_trace``; ``state_trace_offsets`` delimita el conjunto de cada paso.
+        - 'full': se guarda el historial completo en ``history`` (usado por la GUI).
+
+        :param trace_level: Nivel de traza (str)
+        :raises ValueError: Si el nivel no es válido
+        """
+        if trace_level not in TRACE_LEVELS:
+            raise ValueError(f"Nivel de traza inválido: '{trace_level}'. Use uno de {TRACE_LEVELS}")
+        self.trace_level = trace_level
+        self.reset()
+
     def reset(self):
         """Reinicia el autómata al estado inicial"""
-        self.current_states = {self.initial_state}
+        self.current_states = self.epsilon_closure([self.initial_state])
         self.history = []
+        self.state_trace = array('i')
+        self.state_trace_offsets = array('i', [0])
+        if self.trace_level == TRACE_SUMMARY:
+            self._record_summary(self.current_states)
+
+    def _record_summary(self, states):
+        """Añade un conjunto de estados a la traza compacta como índices enteros"""
+        if self._state_ids is None:
+            self._state_names = list(self.states)
+            self._state_ids = {state: i for i, state in enumerate(self._state_names)}
+        state_ids = self._state_ids
+        for state in states:
+            state_id = state_ids.get(state)
+            if state_id is None:
+                state_id = state_ids[state] = len(self._state_names)
+                self._state_names.append(state)
+            self.state_trace.append(state_id)
+        self.state_trace_offsets.append(len(self.state_trace))
+
+    def get_state_trace(self):
+        """
+        Decodifica la traza compacta del nivel 'summary'.
+
+        :return: Lista con el conjunto de estados (frozenset) tras cada paso,
+            empezando por el conjunto inicial
+        """
+        names = self._state_names
+        offsets = self.state_trace_offsets
+        return [frozenset(names[state_id] for state_id in self.state_trace[offsets[i]:offsets[i + 1]])
+                for i in range(len(offsets) - 1)]
         
     def step(self, symbol):
         """
         Realiza un paso de simulación con el símbolo dado.
+
+        El conjunto de estados resultante es el mismo en todos los niveles de
+        traza; solo el nivel 'full' calcula y registra las transiciones usadas (en
+        los demás se devuelve una lista vacía).
         
         :param symbol: Símbolo de entrada
         :return: Tupla (estados_actuales, transiciones_usadas)
         """
-        if symbol not in self.alphabet:
+        if symbol not in self._alphabet_set:
             raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+        # Referencia local: ``transitions`` es una propiedad y esto corre por cada símbolo
+        transitions = self._transitions
+
+        if self.trace_level != TRACE_FULL:
+            new_states = set()
+            for state in self.current_states:
+                if state in transitions and symbol in transitions[state]:
+                    new_states.update(transitions[state][symbol])
+            if self.epsilon_closures is not None:
+                new_states = self.epsilon_closure(new_states)
+            if self.trace_level == TRACE_SUMMARY:
+                self._record_summary(new_states)
+            self.current_states = new_states
+            return new_states, []
             
         new_states = set()
         used_transitions = []
         
         for state in self.current_states:
-            if state in self.transitions and symbol in self.transitions[state]:
-                for dest_state in self.transitions[state][symbol]:
+            if state in transitions and symbol in transitions[state]:
+                for dest_state in transitions[state][symbol]:
                     new_states.add(dest_state)
                     used_transitions.append((state, symbol, dest_state))
+        if self.epsilon_closures is not None:
+            new_states = self.epsilon_closure(new_states)
         
         self.history.append({
             'input': symbol,
@@ -54,12 +277,728 @@ class Automata:
         
     def is_accepted(self):
         """Verifica si el estado actual es de aceptación"""
-        return any(state in self.final_states for state in self.current_states)
+        return not self._final_set.isdisjoint(self.current_states)
         
     def simulate(self, input_string):
-        """Simula una cadena completa de entrada"""
+        """
+        Simula una cadena completa de entrada
+
+        La simulación se detiene en cuanto todos los estados actuales están
+        muertos (no pueden alcanzar un estado final): la cadena ya es rechazada y
+        el resto de la entrada no se examina.
+        """
         self.reset()
+        dead_states = self._dead_states
         for symbol in input_string:
             self.step(symbol)
+            if self.current_states <= dead_states:
+                return False
+        return self.is_accepted()
+
+    def trim(self):
+        """
+        Elimina los estados inútiles: los inalcanzables desde el estado inicial
+        (recorrido en anchura hacia adelante) y los que no pueden alcanzar ningún
+        estado final (recorrido en anchura sobre las transiciones inversas).
+
+        El estado inicial se conserva siempre, aunque el lenguaje sea vacío.
+
+        :return: Nueva instancia de Automata recortada
+        """
+        all_transitions = self._transitions
+        reachable = {self.initial_state}
+        worklist = deque([self.initial_state])
+        while worklist:
+            state = worklist.popleft()
+            for dest_states in all_transitions.get(state, {}).values():
+                for dest_state in dest_states:
+                    if dest_state not in reachable:
+                        reachable.add(dest_state)
+                        worklist.append(dest_state)
+
+        useful = reachable - self._dead_states
+        useful.add(self.initial_state)
+
+        transitions = {}
+        for state, trans in all_transitions.items():
+            if state not in useful:
+                continue
+            kept = {}
+            for symbol, dest_states in trans.items():
+                dest_states = [dest_state for dest_state in dest_states if dest_state in useful]
+                if dest_states:
+                    kept[symbol] = dest_states
+            if kept:
+                transitions[state] = kept
+
+        states = [state for state in self.states if state in useful]
+        if self.initial_state not in states:
+            states.insert(0, self.initial_state)
+        return Automata(
+            states=states,
+            alphabet=list(self.alphabet),
+            transitions=transitions,
+            initial_state=self.initial_state,
+            final_states=[state for state in self.final_states if state in useful],
+            trace_level=self.trace_level
+        )
+
+    def dead_states(self):
+        """
+        Calcula los estados desde los que no se puede alcanzar ningún estado final.
+
+        :return: Conjunto de estados muertos (frozenset)
+        """
+        reverse = {}
+        for state, trans in self.transitions.items():
+            for dest_states in trans.values():
+                for dest_state in dest_states:
+                    reverse.setdefault(dest_state, set()).add(state)
+
+        live = set(self.final_states)
+        worklist = deque(live)
+        while worklist:
+            state = worklist.popleft()
+            for prev_state in reverse.get(state, ()):
+                if prev_state not in live:
+                    live.add(prev_state)
+                    worklist.append(prev_state)
+
+        all_states = set(self.states) | set(self.transitions) | set(reverse) | {self.initial_state}
+        return frozenset(all_states - live)
+
+    def feed(self, chunk):
+        """
+        Procesa un fragmento de entrada sin guardar historial.
+
+        Solo se conserva el conjunto de estados vivos actual, de modo que la memoria
+        es constante sin importar la longitud total de la entrada. Los estados
+        muertos se descartan en cada paso; cuando no queda ninguno vivo la cadena
+        ya no puede aceptarse y el resto de la entrada no se examina.
+        Llame a ``reset()`` antes de empezar una nueva entrada.
+
+        :param chunk: Fragmento de la entrada (str)
+        :return: True si quedan estados vivos tras el fragmento
+        """
+        dead_states = self._dead_states
+        current_states = self.current_states - dead_states
+        alphabet = self._alphabet_set
+        transitions = self._transitions
+
+        for symbol in chunk:
+            if not current_states:
+                break
+            if symbol not in alphabet:
+                raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+            new_states = set()
+            for state in current_states:
+                if state in transitions and symbol in transitions[state]:
+                    new_states.update(transitions[state][symbol])
+            if self.epsilon_closures is not None:
+                new_states = self.epsilon_closure(new_states)
+            current_states = new_states - dead_states
+
+        self.current_states = current_states
+        return bool(current_states)
+
+    def accepts_stream(self, source, chunk_size=65536):
+        """
+        Evalúa una entrada arbitrariamente larga en memoria constante.
+
+        :param source: Objeto archivo (con ``read``) o iterable de fragmentos.
+            Los fragmentos ``bytes`` se decodifican como UTF-8 de forma incremental.
+        :param chunk_size: Tamaño de lectura para objetos archivo (int)
+        :return: True si la entrada completa es aceptada
+        """
+        if hasattr(source, 'read'):
+            chunks = iter(lambda: source.read(chunk_size), source.read(0))
+        else:
+            chunks = source
+
+        self.reset()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        for chunk in chunks:
+            if isinstance(chunk, (bytes, bytearray)):
+                chunk = decoder.decode(chunk)
+            if not self.feed(chunk):
+                return False
+        self.feed(decoder.decode(b'', final=True))
         return self.is_accepted()
-    
\ No newline at end of file
+
+    def is_deterministic(self):
+        """
+        Verifica si cada par (estado, símbolo) tiene como máximo un estado destino
+        y no hay transiciones ε
+        """
+        return self.epsilon_closures is None and all(
+            len(dest_states) <= 1
+            for trans in self.transitions.values()
+            for dest_states in trans.values())
+
+    def compile(self):
+        """
+        Compila el autómata determinista a una tabla de transiciones plana.
+
+        Los estados y símbolos se internan como enteros densos, de modo que
+        evaluar una cadena cuesta un acceso a la tabla por carácter en lugar de
+        búsquedas en diccionarios y copias de historial.
+
+        :return: Instancia de CompiledDFA
+        :raises ValueError: Si el autómata no es determinista (ver ``determinize``)
+        """
+        return CompiledDFA.from_frozen(self.freeze())
+
+    def freeze(self):
+        """
+        Obtiene una representación inmutable e internada del autómata.
+
+        Los nombres de estados y símbolos se convierten en enteros densos y las
+        estructuras en tuplas y ``frozenset``; la instancia es hashable y expone
+        ``content_hash``, un SHA-256 estable de su contenido. Los motores
+        (``compile``, ``lazy_dfa``, ``bit_parallel``) se construyen a partir de ella.
+
+        :return: Instancia de FrozenAutomata
+        """
+        return FrozenAutomata.from_automata(self)
+
+    @classmethod
+    def from_frozen(cls, frozen):
+        """
+        Reconstruye un Automata editable a partir de su forma congelada.
+
+        :param frozen: Instancia de FrozenAutomata
+        :return: Nueva instancia de Automata
+        """
+        states = frozen.states
+        transitions = {}
+        for q, row in enumerate(frozen.transitions):
+            trans = {frozen.alphabet[a]: [states[p] for p in dest_states]
+                     for a, dest_states in enumerate(row) if dest_states}
+            if frozen.epsilon_transitions is not None and frozen.epsilon_transitions[q]:
+                trans[EPSILON] = [states[p] for p in frozen.epsilon_transitions[q]]
+            if trans:
+                transitions[states[q]] = trans
+        return cls(
+            states=list(states),
+            alphabet=list(frozen.alphabet),
+            transitions=transitions,
+            initial_state=states[frozen.initial_state],
+            final_states=[states[q] for q in sorted(frozen.final_states)]
+        )
+
+    @classmethod
+    def _restore(cls, states, alphabet, transitions, initial_state, final_states,
+                 epsilon_closures, dead_states):
+        """
+        Reconstruye un autómata ya validado junto con sus datos derivados, sin
+        volver a calcularlos (usado por la caché de core.machine_cache).
+
+        :param epsilon_closures: Dict {estado: frozenset(clausura)} o None
+        :param dead_states: Estados muertos (frozenset)
+        :return: Nueva instancia de Automata
+        """
+        automata = cls.__new__(cls)
+        automata._states = states
+        automata._alphabet = alphabet
+        automata._transitions = transitions
+        automata._initial_state = initial_state
+        automata._final_states = final_states
+        automata._alphabet_set = frozenset(alphabet)
+        automata._final_set = frozenset(final_states)
+        automata.epsilon_closures = epsilon_closures
+        automata._dead_states = dead_states
+        automata._state_ids = None
+        automata._state_names = None
+        automata.set_trace_level(TRACE_FULL)
+        return automata
+
+    def accepts_many(self, strings):
+        """
+        Evalúa un lote de cadenas sobre la tabla compilada del autómata.
+
+        Los AFN se determinizan antes de compilar. Para lotes repetidos conviene
+        llamar una vez a ``compile()`` y reutilizar ``CompiledDFA.accepts_many``.
+
+        :param strings: Iterable de cadenas
+        :return: Vector booleano de NumPy (o lista de bool si NumPy no está instalado)
+        """
+        dfa = self if self.is_deterministic() else self.determinize()
+        return dfa.compile().accepts_many(strings)
+
+    def lazy_dfa(self, cache_size=4096):
+        """
+        Crea un simulador que determiniza el autómata bajo demanda.
+
+        Las transiciones entre conjuntos de estados se memorizan en una caché LRU
+        acotada, de modo que un AFN alcanza velocidad de AFD una vez caliente.
+
+        :param cache_size: Número máximo de transiciones memorizadas (int)
+        :return: Instancia de LazyDFA
+        """
+        return LazyDFA(self.freeze(), cache_size)
+
+    def bit_parallel(self):
+        """
+        Crea un simulador de AFN basado en máscaras de bits.
+
+        Cada paso se resuelve con operaciones OR sobre enteros en lugar de
+        recorrer un conjunto de nombres de estado, lo que conviene para AFN con
+        muchos estados y mucho no determinismo.
+
+        :return: Instancia de BitParallelNFA
+        """
+        return BitParallelNFA(self.freeze())
+
+    def _frozen_dfa(self):
+        """Forma congelada del autómata, determinizándolo antes si hace falta"""
+        return (self if self.is_deterministic() else self.determinize()).freeze()
+
+    def count_accepted(self, n, method='auto'):
+        """
+        Cuenta las cadenas aceptadas de longitud exactamente ``n`` sin enumerarlas.
+
+        Usa programación dinámica vectorizada sobre un vector de conteos por estado
+        y, para ``n`` muy grande, exponenciación de la matriz de transición por
+        cuadrados repetidos. Los AFN se determinizan antes para no contar caminos
+        repetidos.
+
+        :param n: Longitud (int)
+        :param method: 'auto', 'dp' o 'matrix' (str)
+        :return: Número de cadenas aceptadas (int)
+        """
+        return WordCounter(self._frozen_dfa()).count(n, method)
+
+    def accepted_length_profile(self, max_n):
+        """
+        Cuenta las cadenas aceptadas de cada longitud entre 0 y ``max_n``.
+
+        :param max_n: Longitud máxima (int)
+        :return: Lista de conteos, uno por longitud
+        """
+        return WordCounter(self._frozen_dfa()).length_profile(max_n)
+
+    def sample_accepted(self, n, k=1, seed=None):
+        """
+        Extrae ``k`` cadenas aceptadas de longitud ``n`` uniformemente al azar.
+
+        Usa una tabla de conteos por longitud en lugar de muestreo por rechazo,
+        por lo que funciona igual de bien con lenguajes muy dispersos.
+
+        :param n: Longitud de las cadenas (int)
+        :param k: Número de muestras (int)
+        :param seed: Semilla del generador aleatorio (opcional)
+        :return: Lista de k cadenas
+        :raises ValueError: Si no hay cadenas aceptadas de longitud n
+        """
+        return WordCounter(self._frozen_dfa()).sample(n, k, seed)
+
+    def iter_accepted(self, max_len=None):
+        """
+        Genera las cadenas aceptadas en orden shortlex (por longitud y luego
+        lexicográfico según el orden de los símbolos).
+
+        Se hace un recorrido en anchura por niveles sobre pares (conjunto de
+        estados, prefijo). Los estados muertos se podan antes de empezar, de modo
+        que cada prefijo de la frontera tiene al menos una continuación aceptada y
+        la memoria queda acotada por el tamaño de la frontera.
+
+        :param max_len: Longitud máxima de las cadenas (int o None para no limitar)
+        :return: Generador de cadenas
+        """
+        frozen = self.freeze()
+        dead_states = self.dead_states()
+        live = frozenset(q for q, state in enumerate(frozen.states) if state not in dead_states)
+        symbols = sorted(range(len(frozen.alphabet)), key=lambda a: frozen.alphabet[a])
+        successors = {}
+
+        def successor(states, a):
+            key = (states, a)
+            if key not in successors:
+                dest_states = set()
+                for q in states:
+                    dest_states.update(frozen.transitions[q][a])
+                successors[key] = frozen.closure(dest_states) & live
+            return successors[key]
+
+        start = frozen.closure([frozen.initial_state]) & live
+        frontier = [(start, "")] if start else []
+        length = 0
+        while frontier:
+            for states, prefix in frontier:
+                if not frozen.final_states.isdisjoint(states):
+                    yield prefix
+            if max_len is not None and length >= max_len:
+                return
+            next_frontier = []
+            for states, prefix in frontier:
+                for a in symbols:
+                    dest_states = successor(states, a)
+                    if dest_states:
+                        next_frontier.append((dest_states, prefix + frozen.alphabet[a]))
+            frontier = next_frontier
+            length += 1
+
+    def iter_rejected(self, max_len=None):
+        """
+        Genera las cadenas rechazadas en orden shortlex, enumerando las aceptadas
+        por el complemento del autómata (ver ``iter_accepted``).
+
+        :param max_len: Longitud máxima de las cadenas (int o None para no limitar)
+        :return: Generador de cadenas
+        """
+        return self.complement().iter_accepted(max_len)
+
+    def _product(self, other, operation, materialize):
+        """Construye el producto perezoso con otro autómata y lo materializa si se pide"""
+        left = self if self.is_deterministic() else self.determinize()
+        right = other if other.is_deterministic() else other.determinize()
+        product = LazyProduct(left.freeze(), right.freeze(), operation)
+        if not materialize:
+            return product
+        return Automata.from_frozen(product.materialize())
+
+    def intersect(self, other, materialize=True):
+        """
+        Autómata que reconoce la intersección de ambos lenguajes.
+
+        El producto se construye bajo demanda: solo se exploran los pares de estados
+        alcanzables desde el par inicial.
+
+        :param other: Otra instancia de Automata
+        :param materialize: Si es False, devuelve el LazyProduct sin materializar
+        :return: Instancia de Automata (o LazyProduct)
+        """
+        return self._product(other, INTERSECTION, materialize)
+
+    def union(self, other, materialize=True):
+        """
+        Autómata que reconoce la unión de ambos lenguajes (ver ``intersect``).
+
+        :param other: Otra instancia de Automata
+        :param materialize: Si es False, devuelve el LazyProduct sin materializar
+        :return: Instancia de Automata (o LazyProduct)
+        """
+        return self._product(other, UNION, materialize)
+
+    def difference(self, other, materialize=True):
+        """
+        Autómata que reconoce las cadenas de este lenguaje que no están en ``other``
+        (ver ``intersect``).
+
+        :param other: Otra instancia de Automata
+        :param materialize: Si es False, devuelve el LazyProduct sin materializar
+        :return: Instancia de Automata (o LazyProduct)
+        """
+        return self._product(other, DIFFERENCE, materialize)
+
+    def complement(self):
+        """
+        Autómata que reconoce el complemento del lenguaje sobre el mismo alfabeto.
+
+        Se determiniza el autómata, se completa con un estado sumidero (si hace
+        falta) y se intercambian los estados finales y no finales.
+
+        :return: Nueva instancia de Automata
+        """
+        dfa = self if self.is_deterministic() else self.determinize()
+        alphabet = [symbol for symbol in dfa.alphabet if symbol != EPSILON]
+        states = list(dfa.states)
+        for state in [dfa.initial_state] + list(dfa.transitions):
+            if state not in states:
+                states.append(state)
+
+        sink = SINK_NAME
+        while sink in states:
+            sink += "'"
+        dfa_transitions = dfa.transitions
+        transitions = {}
+        needs_sink = False
+        for state in states:
+            trans = {}
+            state_transitions = dfa_transitions.get(state, {})
+            for symbol in alphabet:
+                dest_states = state_transitions.get(symbol)
+                if dest_states:
+                    trans[symbol] = [dest_states[0]]
+                else:
+                    trans[symbol] = [sink]
+                    needs_sink = True
+            transitions[state] = trans
+        if needs_sink:
+            states.append(sink)
+            transitions[sink] = {symbol: [sink] for symbol in alphabet}
+
+        final_states = set(dfa.final_states)
+        return Automata(
+            states=states,
+            alphabet=alphabet,
+            transitions=transitions,
+            initial_state=dfa.initial_state,
+            final_states=[state for state in states if state not in final_states]
+        )
+
+    def equivalent(self, other):
+        """
+        Comprueba si ambos autómatas reconocen el mismo lenguaje.
+
+        :param other: Otra instancia de Automata
+        :return: True si los lenguajes coinciden (ver ``counterexample`` para
+            obtener una cadena que los distinga)
+        """
+        return self.counterexample(other) is None
+
+    def counterexample(self, other):
+        """
+        Busca una cadena aceptada por uno solo de los dos autómatas.
+
+        Usa el algoritmo de Hopcroft–Karp: se recorren pares de estados desde el
+        par inicial y se fusionan con una estructura unión-búsqueda (con compresión
+        de caminos), de modo que cada par de clases se visita una vez, en tiempo
+        casi lineal, sin minimizar ni construir el producto completo. Los AFN se
+        determinizan antes. El primer par con distinta aceptación produce un
+        contraejemplo: la cadena que lleva hasta él desde el par inicial.
+
+        :param other: Otra instancia de Automata
+        :return: El contraejemplo (str) o None si los lenguajes coinciden
+        """
+        left = self._frozen_dfa()
+        right = other._frozen_dfa()
+        alphabet = left.alphabet + tuple(symbol for symbol in right.alphabet
+                                         if symbol not in left.symbol_index)
+
+        # Nodos de la unión-búsqueda: estados del primero, su sumidero, estados del
+        # segundo y su sumidero
+        left_sink = len(left.states)
+        offset = left_sink + 1
+        right_sink = offset + len(right.states)
+        parent = list(range(right_sink + 1))
+
+        def find(node):
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            while parent[node] != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        def step(frozen, state, symbol, sink, base):
+            if state == sink:
+                return sink
+            a = frozen.symbol_index.get(symbol)
+            dest_states = frozen.transitions[state - base][a] if a is not None else ()
+            return dest_states[0] + base if dest_states else sink
+
+        def accepting(frozen, state, sink, base):
+            return state != sink and state - base in frozen.final_states
+
+        start = (left.initial_state, right.initial_state + offset)
+        parent[find(start[1])] = find(start[0])
+        came_from = {start: None}
+        worklist = deque([start])
+        while worklist:
+            pair = worklist.popleft()
+            p, q = pair
+            if accepting(left, p, left_sink, 0) != accepting(right, q, right_sink, offset):
+                word = []
+                while came_from[pair] is not None:
+                    pair, symbol = came_from[pair]
+                    word.append(symbol)
+                return "".join(reversed(word))
+            for symbol in alphabet:
+                dest = (step(left, p, symbol, left_sink, 0), step(right, q, symbol, right_sink, offset))
+                root_p, root_q = find(dest[0]), find(dest[1])
+                if root_p != root_q:
+                    parent[root_q] = root_p
+                    came_from[dest] = (pair, symbol)
+                    worklist.append(dest)
+        return None
+
+    def determinize(self, max_states=None):
+        """
+        Convierte el autómata en un AFD equivalente mediante construcción de subconjuntos.
+
+        Los subconjuntos alcanzables desde el estado inicial se exploran con una
+        lista de trabajo y se internan como ``frozenset``, nombrándose como
+        ``{q0,q1}``. El conjunto vacío no se materializa: las transiciones hacia él
+        se omiten, igual que en el resto del simulador.
+
+        El AFD resultante expone ``state_subsets``: un diccionario
+        {estado_nuevo: frozenset(estados_originales)}.
+
+        :param max_states: Número máximo de estados del AFD (int o None para no limitar)
+        :return: Nueva instancia de Automata determinista
+        :raises ValueError: Si se supera ``max_states``
+        """
+        order = {state: i for i, state in enumerate(self.states)}
+
+        def subset_name(subset):
+            members = sorted(subset, key=lambda state: (order.get(state, len(order)), state))
+            return "{" + ",".join(members) + "}"
+
+        start = frozenset(self.epsilon_closure([self.initial_state]))
+        names = {start: subset_name(start)}
+        worklist = deque([start])
+        transitions = {}
+        # Referencias locales para no pasar por las propiedades en el bucle interno
+        nfa_transitions = self._transitions
+        symbols = [symbol for symbol in self._alphabet if symbol != EPSILON]
+        epsilon_closure = self.epsilon_closure
+
+        while worklist:
+            subset = worklist.popleft()
+            subset_transitions = {}
+            for symbol in symbols:
+                dest = set()
+                for state in subset:
+                    if state in nfa_transitions and symbol in nfa_transitions[state]:
+                        dest.update(nfa_transitions[state][symbol])
+                if not dest:
+                    continue
+                dest = frozenset(epsilon_closure(dest))
+                if dest not in names:
+                    if max_states is not None and len(names) >= max_states:
+                        raise ValueError(
+                            f"La determinización supera el límite de {max_states} estados"
+                        )
+                    names[dest] = subset_name(dest)
+                    worklist.append(dest)
+                subset_transitions[symbol] = [names[dest]]
+            transitions[names[subset]] = subset_transitions
+
+        final_states = set(self.final_states)
+        dfa = Automata(
+            states=list(names.values()),
+            alphabet=list(self.alphabet),
+            transitions=transitions,
+            initial_state=names[start],
+            final_states=[name for subset, name in names.items() if not final_states.isdisjoint(subset)]
+        )
+        dfa.state_subsets = {name: subset for subset, name in names.items()}
+        return dfa
+
+    def minimize(self):
+        """
+        Obtiene el AFD mínimo equivalente mediante el algoritmo de Hopcroft.
+
+        Primero se determiniza el autómata si hace falta, se eliminan los estados
+        inalcanzables y se completa con un estado sumidero. Después se refina la
+        partición {finales, no finales} con una lista de trabajo de divisores
+        (bloque, símbolo) y un índice de transiciones inversas, en O(n log n).
+
+        Cada estado del AFD mínimo toma el nombre del primer estado original de su
+        clase, y ``state_subsets`` asocia cada uno con la clase que representa. La
+        clase del sumidero (estados muertos) no se materializa.
+
+        :return: Nueva instancia de Automata determinista y mínima
+        """
+        dfa = self if self.is_deterministic() else self.determinize()
+        alphabet = list(dfa.alphabet)
+
+        # Estados alcanzables desde el inicial, internados como enteros
+        dfa_transitions = dfa.transitions
+        index = {dfa.initial_state: 0}
+        names = [dfa.initial_state]
+        worklist = deque([dfa.initial_state])
+        while worklist:
+            state = worklist.popleft()
+            for dest_states in dfa_transitions.get(state, {}).values():
+                for dest_state in dest_states:
+                    if dest_state not in index:
+                        index[dest_state] = len(names)
+                        names.append(dest_state)
+                        worklist.append(dest_state)
+
+        # Completar con un sumidero y construir el índice inverso por símbolo
+        sink = len(names)
+        inverse = [[[] for _ in range(sink + 1)] for _ in alphabet]
+        delta = []
+        for q in range(sink + 1):
+            trans = dfa_transitions.get(names[q], {}) if q < sink else {}
+            row = []
+            for a, symbol in enumerate(alphabet):
+                dest_states = trans.get(symbol)
+                p = index[dest_states[0]] if dest_states else sink
+                row.append(p)
+                inverse[a][p].append(q)
+            delta.append(row)
+
+        final_states = set(dfa.final_states)
+        accepting = {q for q in range(sink) if names[q] in final_states}
+        rejecting = set(range(sink + 1)) - accepting
+        blocks = [block for block in (accepting, rejecting) if block]
+        block_of = [0] * (sink + 1)
+        for b, block in enumerate(blocks):
+            for q in block:
+                block_of[q] = b
+
+        splitters = []
+        if len(blocks) == 2:
+            smaller = 0 if len(blocks[0]) <= len(blocks[1]) else 1
+            splitters = [(smaller, a) for a in range(len(alphabet))]
+
+        while splitters:
+            b, a = splitters.pop()
+            # Estados que llegan al bloque divisor con el símbolo a, agrupados por bloque
+            touched = {}
+            for p in blocks[b]:
+                for q in inverse[a][p]:
+                    touched.setdefault(block_of[q], set()).add(q)
+
+            # Cada división cuesta O(|incoming|): la mitad que se queda con el número
+            # del bloque no se recorre y solo se reetiqueta la más pequeña
+            for y, incoming in touched.items():
+                block = blocks[y]
+                if len(incoming) == len(block):
+                    continue
+                if 2 * len(incoming) <= len(block):
+                    block.difference_update(incoming)
+                    new_block = incoming
+                else:
+                    # Aquí |block - incoming| < |incoming|
+                    new_block = block - incoming
+                    blocks[y] = incoming
+                new_id = len(blocks)
+                blocks.append(new_block)
+                for q in new_block:
+                    block_of[q] = new_id
+                # Si (y, c) ya estaba pendiente, ambas mitades deben serlo; si no,
+                # basta con la mitad más pequeña, que es siempre new_block
+                for c in range(len(alphabet)):
+                    splitters.append((new_id, c))
+
+        dead = block_of[sink]
+        order = {state: i for i, state in enumerate(dfa.states)}
+        representative = {}
+        for b, block in enumerate(blocks):
+            if b != dead:
+                members = sorted((names[q] for q in block),
+                                 key=lambda state: (order.get(state, len(order)), state))
+                representative[b] = members
+        initial_block = block_of[0]
+
+        transitions = {}
+        for b, members in representative.items():
+            q = index[members[0]]
+            trans = {}
+            for a, symbol in enumerate(alphabet):
+                target = block_of[delta[q][a]]
+                if target != dead:
+                    trans[symbol] = [representative[target][0]]
+            transitions[members[0]] = trans
+
+        if initial_block == dead:
+            # Lenguaje vacío: solo se conserva el estado inicial sin transiciones
+            representative = {dead: [dfa.initial_state]}
+            transitions = {dfa.initial_state: {}}
+
+        ordered = sorted(representative.values(),
+                         key=lambda members: (order.get(members[0], len(order)), members[0]))
+        minimal = Automata(
+            states=[members[0] for members in ordered],
+            alphabet=alphabet,
+            transitions=transitions,
+            initial_state=representative[initial_block][0],
+            final_states=[members[0] for members in ordered if members[0] in final_states]
+        )
+        minimal.state_subsets = {members[0]: frozenset(members) for members in ordered}
+        return minimal
@@ -0,0 +1,154 @@
+"""
+Evaluación por lotes de autómatas finitos desde la línea de comandos.
+
+Carga la máquina una sola vez, la compila y reparte las cadenas de entrada (una
+por línea) entre procesos trabajadores. Los resultados se escriben en el mismo
+orden que la entrada, con el formato ``cadena<TAB>1`` (aceptada) o ``cadena<TAB>0``.
+
+Si la máquina está en el formato binario con tabla AFD (ver core.binary_format),
+cada trabajador la proyecta en memoria por su cuenta en lugar de recibirla
+serializada, de modo que todos comparten las mismas páginas del archivo.
+
+Uso:
+    python -m core.batch dfa examples/ejemplo_automata.json entradas.txt
+"""
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from core import binary_format
+from core.file_handler import AutomataFileHandler
+
+# Motor compilado del proceso trabajador (lo asigna _init_worker)
+_engine = None
+
+
+def _init_worker(engine, binary_path=None):
+    """
+    Inicializador del proceso trabajador: recibe el motor compilado una sola vez
+    o, si se indica ``binary_path``, proyecta la tabla AFD del archivo binario
+    """
+    global _engine
+    _engine = AutomataFileHandler.load_compiled_dfa(binary_path) if binary_path else engine
+
+
+def _evaluate_chunk(lines):
+    """
+    Evalúa un bloque de cadenas con el motor del proceso.
+
+    Las cadenas con símbolos fuera del alfabeto no pertenecen al lenguaje y se
+    reportan como rechazadas.
+
+    :param lines: Lista de cadenas
+    :return: Lista de tuplas (cadena, aceptada, error o None)
+    """
+    results = []
+    for line in lines:
+        try:
+            results.append((line, _engine.accepts(line), None))
+        except ValueError as e:
+            results.append((line, False, str(e)))
+    return results
+
+
+def _read_chunks(file, chunk_size):
+    """Agrupa las líneas del archivo (sin el salto de línea final) en bloques"""
+    lines = (line.rstrip('\r\n') for line in file)
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _compile_automata(file_path):
+    """Carga el autómata (con la caché en disco), lo determiniza si hace falta y lo compila"""
+    automata = AutomataFileHandler.load_automata_from_file(file_path, use_cache=True)
+    if not automata.is_deterministic():
+        automata = automata.determinize()
+    return automata.compile()
+
+
+def _evaluate(engine, chunks, workers, binary_path=None):
+    """
+    Genera los resultados de cada bloque en el orden de entrada.
+
+    Se mantiene un número acotado de bloques en vuelo para que la memoria no
+    dependa del tamaño del archivo de entrada. Con ``binary_path`` los
+    trabajadores cargan la tabla proyectada en vez de recibir ``engine``.
+    """
+    if workers <= 1:
+        _init_worker(engine)
+        for chunk in chunks:
+            yield _evaluate_chunk(chunk)
+        return
+
+    initargs = (None, binary_path) if binary_path else (engine,)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=initargs) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_evaluate_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m core.batch',
+        description="Evalúa por lotes un archivo de cadenas contra un autómata."
+    )
+    subparsers = parser.add_subparsers(dest='machine', required=True)
+
+    dfa_parser = subparsers.add_parser(
+        'dfa', help="Autómata finito (los AFN se determinizan al cargarlos)"
+    )
+    dfa_parser.add_argument('machine_file', help="Archivo JSON o binario del autómata")
+    dfa_parser.add_argument('input_file', help="Archivo con una cadena por línea ('-' para la entrada estándar)")
+    dfa_parser.add_argument('-o', '--output', help="Archivo de salida (por defecto, la salida estándar)")
+    dfa_parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                            help="Número de procesos trabajadores (1 evalúa en el proceso actual)")
+    dfa_parser.add_argument('-c', '--chunk-size', type=int, default=10000,
+                            help="Cadenas por bloque enviado a cada trabajador")
+
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size debe ser al menos 1")
+
+    binary_path = None
+    try:
+        if binary_format.has_compiled_table(args.machine_file):
+            binary_path = args.machine_file
+            engine = AutomataFileHandler.load_compiled_dfa(binary_path)
+        else:
+            engine = _compile_automata(args.machine_file)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    input_file = sys.stdin if args.input_file == '-' else open(args.input_file, 'r', encoding='utf-8')
+    output_file = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        line_number = 0
+        for results in _evaluate(engine, _read_chunks(input_file, args.chunk_size), args.workers,
+                                 binary_path):
+            for line, accepted, error in results:
+                line_number += 1
+                if error:
+                    print(f"Línea {line_number}: {error}", file=sys.stderr)
+                output_file.write(f"{line}\t{int(accepted)}\n")
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+Formato binario versionado y proyectable en memoria (mmap) para autómatas finitos.
+
+Distribución del archivo (enteros little-endian, secciones alineadas a 8 bytes):
+
+    Cabecera       struct HEADER (ver abajo)
+    Cadenas        int32[num_states + num_symbols + 1] desplazamientos +
+                   bytes UTF-8 de los nombres de estados y luego de símbolos
+    Finales        int32[num_finals] índices de estados finales
+    CSR offsets    int32[num_states * (num_symbols + 1) + 1]; la columna extra
+                   de cada estado corresponde a las transiciones ε
+    CSR destinos   int32[num_targets]
+    Tabla AFD      (solo si FLAG_DFA) int32[(num_states + 1) * stride] con la
+                   distribución de CompiledDFA (desplazamientos de fila y
+                   sumidero al final) seguida de uint8[num_states + 1] banderas
+                   de aceptación
+
+Al cargar una tabla AFD con ``load_compiled``, los arreglos se envuelven con
+``memoryview`` sobre el mmap sin copiarlos, de modo que abrir una máquina grande
+cuesta milisegundos y los procesos que abren el mismo archivo comparten sus páginas.
+"""
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él, la tabla AFD se valida entrada a entrada
+    np = None
+
+from core.automata import Automata
+from core.compiled_automata import CompiledDFA
+from core.frozen_automata import FrozenAutomata
+
+MAGIC = b'AUTB'
+FORMAT_VERSION = 1
+FLAG_DFA = 1
+
+# magic, versión, banderas, estados, símbolos, inicial, finales, destinos CSR, bytes de cadenas
+HEADER = struct.Struct('<4sHHIIIIII')
+ALIGNMENT = 8
+
+
+def _padding(size):
+    return -size % ALIGNMENT
+
+
+def _int32_bytes(values):
+    data = array('i', values)
+    if data.itemsize != 4:
+        raise ValueError("El formato binario requiere enteros de 32 bits")
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return data.tobytes()
+
+
+def is_binary_file(file_path):
+    """Indica si el archivo comienza con la firma del formato binario"""
+    with open(file_path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def has_compiled_table(file_path):
+    """Indica si el archivo es binario e incluye una tabla AFD proyectable con ``load_compiled``"""
+    with open(file_path, 'rb') as file:
+        header = file.read(HEADER.size)
+    return (len(header) == HEADER.size and header.startswith(MAGIC)
+            and bool(HEADER.unpack(header)[2] & FLAG_DFA))
+
+
+def write_automata(automata, file_path):
+    """
+    Escribe un autómata finito en formato binario.
+
+    Los AFD incluyen además la tabla compilada, que ``load_compiled`` proyecta
+    en memoria sin copiarla.
+
+    :param automata: Instancia de Automata
+    :param file_path: Ruta del archivo de salida
+    """
+    with open(file_path, 'wb') as file:
+        file.write(dump_automata(automata))
+
+
+def dump_automata(automata):
+    """
+    Serializa un autómata finito en formato binario.
+
+    :param automata: Instancia de Automata
+    :return: Contenido del archivo binario (bytes)
+    """
+    frozen = automata.freeze()
+    names = [name.encode('utf-8') for name in frozen.states + frozen.alphabet]
+    string_offsets = [0]
+    for name in names:
+        string_offsets.append(string_offsets[-1] + len(name))
+    string_data = b''.join(names)
+
+    csr_offsets = [0]
+    csr_targets = []
+    for q, row in enumerate(frozen.transitions):
+        for dest_states in row:
+            csr_targets.extend(dest_states)
+            csr_offsets.append(len(csr_targets))
+        if frozen.epsilon_transitions is not None:
+            csr_targets.extend(frozen.epsilon_transitions[q])
+        csr_offsets.append(len(csr_targets))
+
+    compiled = CompiledDFA.from_frozen(frozen) if frozen.is_deterministic() else None
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, FLAG_DFA if compiled else 0,
+        len(frozen.states), len(frozen.alphabet), frozen.initial_state,
+        len(frozen.final_states), len(csr_targets), len(string_data)
+    )
+
+    sections = [
+        _int32_bytes(string_offsets) + string_data,
+        _int32_bytes(sorted(frozen.final_states)),
+        _int32_bytes(csr_offsets),
+        _int32_bytes(csr_targets),
+    ]
+    if compiled:
+        sections.append(_int32_bytes(compiled.table))
+        sections.append(bytes(compiled.final_flags))
+
+    parts = [header, b'\0' * _padding(HEADER.size)]
+    for section in sections:
+        parts.append(section)
+        parts.append(b'\0' * _padding(len(section)))
+    return b''.join(parts)
+
+
+class _LazyNames(Sequence):
+    """
+    Secuencia de nombres que se decodifican al accederse, sobre las vistas de
+    desplazamientos y bytes UTF-8 del archivo (sin copiarlas)
+    """
+    def __init__(self, offsets, data, start, count):
+        self._offsets = offsets
+        self._data = data
+        self._start = start
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Índice de nombre fuera de rango")
+        i = self._start + index
+        begin, end = self._offsets[i], self._offsets[i + 1]
+        if not 0 <= begin <= end <= len(self._data):
+            raise ValueError("El archivo binario contiene desplazamientos de nombres fuera de rango")
+        return str(self._data[begin:end], 'utf-8')
+
+
+class _Reader:
+    """Recorre las secciones de un búfer binario respetando la alineación"""
+    def __init__(self, buffer):
+        self.view = memoryview(buffer)
+        if len(self.view) < HEADER.size:
+            raise ValueError("El archivo binario está truncado")
+        (magic, version, self.flags, self.num_states, self.num_symbols, self.initial_state,
+         self.num_finals, self.num_targets, self.string_size) = HEADER.unpack_from(self.view)
+        if magic != MAGIC:
+            raise ValueError("El archivo no tiene el formato binario de autómatas")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Versión de formato binario no soportada: {version}")
+        self.position = HEADER.size + _padding(HEADER.size)
+
+    def take(self, size):
+        if self.position + size > len(self.view):
+            raise ValueError("El archivo binario está truncado")
+        chunk = self.view[self.position:self.position + size]
+        self.position += size
+        return chunk
+
+    def skip_padding(self, size):
+        self.position += _padding(size)
+
+    def int32_array(self, count, extra_bytes=0):
+        """Envuelve ``count`` enteros de 32 bits sin copiarlos (con copia si el host es big-endian)"""
+        chunk = self.take(count * 4)
+        self.skip_padding(count * 4 + extra_bytes)
+        if sys.byteorder != 'little':
+            data = array('i', chunk.tobytes())
+            data.byteswap()
+            return data
+        return chunk.cast('i')
+
+    def read_names(self, lazy_states=False):
+        """
+        Lee los nombres de estados y símbolos.
+
+        Con ``lazy_states`` los nombres de estados no se decodifican hasta que se
+        accede a ellos (``CompiledDFA.accepts`` nunca los usa); los símbolos se
+        decodifican siempre porque forman el índice del alfabeto.
+        """
+        total = self.num_states + self.num_symbols
+        offsets = self.take((total + 1) * 4)
+        if sys.byteorder != 'little':
+            offsets = array('i', offsets.tobytes())
+            offsets.byteswap()
+        else:
+            offsets = offsets.cast('i')
+        data = self.take(self.string_size)
+        self.skip_padding((total + 1) * 4 + self.string_size)
+        states = _LazyNames(offsets, data, 0, self.num_states)
+        alphabet = tuple(_LazyNames(offsets, data, self.num_states, self.num_symbols))
+        return (states if lazy_states else tuple(states)), alphabet
+
+
+def read_automata(file_path):
+    """
+    Lee un archivo binario como Automata editable (los datos se copian).
+
+    :param file_path: Ruta del archivo binario
+    :return: Instancia de Automata
+    """
+    with open(file_path, 'rb') as file:
+        return load_automata(file.read())
+
+
+def load_automata(data):
+    """
+    Reconstruye un Automata editable a partir del contenido de un archivo binario.
+
+    Solo se decodifican enteros y cadenas; un contenido malformado produce
+    ValueError, nunca la ejecución de código.
+
+    :param data: Contenido binario (bytes)
+    :return: Instancia de Automata
+    :raises ValueError: Si el contenido está truncado o no es válido
+    """
+    reader = _Reader(data)
+
+    states, alphabet = reader.read_names()
+    final_states = frozenset(reader.int32_array(reader.num_finals))
+    width = reader.num_symbols + 1
+    csr_offsets = reader.int32_array(reader.num_states * width + 1)
+    csr_targets = reader.int32_array(reader.num_targets)
+    num_states = reader.num_states
+    if (not 0 <= reader.initial_state < num_states
+            or any(not 0 <= q < num_states for q in final_states)
+            or any(not 0 <= q < num_states for q in csr_targets)
+            or any(not 0 <= offset <= reader.num_targets for offset in csr_offsets)):
+        raise ValueError("El archivo binario contiene índices fuera de rango")
+
+    transitions = []
+    epsilon_transitions = []
+    for q in range(reader.num_states):
+        base = q * width
+        transitions.append(tuple(
+            tuple(csr_targets[csr_offsets[base + a]:csr_offsets[base + a + 1]])
+            for a in range(reader.num_symbols)
+        ))
+        epsilon_transitions.append(
+            tuple(csr_targets[csr_offsets[base + width - 1]:csr_offsets[base + width]])
+        )
+
+    # Las ε-clausuras no se guardan: Automata las recalcula al construirse
+    frozen = FrozenAutomata(
+        states=states,
+        alphabet=alphabet,
+        transitions=tuple(transitions),
+        initial_state=reader.initial_state,
+        final_states=final_states,
+        epsilon_transitions=tuple(epsilon_transitions)
+    )
+    return Automata.from_frozen(frozen)
+
+
+def _valid_table(table, stride, num_states):
+    """
+    Comprueba que cada entrada de la tabla AFD sea el desplazamiento de una fila
+    existente (múltiplo de ``stride`` menor que ``(num_states + 1) * stride``)
+    """
+    limit = (num_states + 1) * stride
+    if np is not None:
+        entries = np.frombuffer(table, dtype=np.int32)
+        return not ((entries < 0) | (entries >= limit) | (entries % stride != 0)).any()
+    return not any(not 0 <= entry < limit or entry % stride for entry in table)
+
+
+def load_compiled(file_path):
+    """
+    Proyecta en memoria la tabla AFD de un archivo binario sin copiarla.
+
+    :param file_path: Ruta del archivo binario
+    :return: Instancia de CompiledDFA respaldada por el mmap del archivo
+    :raises ValueError: Si el archivo no contiene una tabla AFD o la tabla
+        contiene desplazamientos fuera de rango
+    """
+    with open(file_path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    reader = _Reader(mapping)
+    if not reader.flags & FLAG_DFA:
+        raise ValueError("El archivo binario no contiene una tabla AFD compilada")
+    states, alphabet = reader.read_names(lazy_states=True)
+    reader.int32_array(reader.num_finals)
+    reader.int32_array(reader.num_states * (reader.num_symbols + 1) + 1)
+    reader.int32_array(reader.num_targets)
+
+    stride = max(reader.num_symbols, 1)
+    table = reader.int32_array((reader.num_states + 1) * stride)
+    final_flags = reader.take(reader.num_states + 1)
+    if not 0 <= reader.initial_state <= reader.num_states or not _valid_table(table, stride, reader.num_states):
+        raise ValueError("El archivo binario contiene índices fuera de rango")
+    return CompiledDFA(states, alphabet, table, reader.initial_state, final_flags, buffer=mapping)
@@ -0,0 +1,123 @@
+class BitParallelNFA:
+    """
+    Ejecución de un AFN con conjuntos de estados representados como máscaras de bits.
+
+    A cada estado se le asigna un bit. Para cada símbolo se precalcula, por cada
+    fragmento de 8 bits de la máscara actual, una tabla de 256 entradas con la
+    unión de las máscaras sucesoras de los estados de ese fragmento. Así, un paso
+    de simulación se reduce a unas pocas operaciones OR sobre enteros de Python,
+    y la aceptación es ``mask & final_mask``. Las ε-clausuras precalculadas del
+    autómata se incorporan a las máscaras, por lo que no cuestan nada al ejecutar.
+    """
+    CHUNK_BITS = 8
+
+    def __init__(self, frozen):
+        """
+        :param frozen: Forma congelada del autómata (FrozenAutomata), determinista o no
+        """
+        self.frozen = frozen
+        self.states = frozen.states
+        self.alphabet = frozen.alphabet
+        self.initial_mask = self._mask_of(frozen.closure([frozen.initial_state]))
+        self.final_mask = self._mask_of(frozen.final_states)
+
+        # Máscara sucesora (ya cerrada bajo ε) por (estado, símbolo)
+        self.successor_masks = {}
+        for a, symbol in enumerate(self.alphabet):
+            self.successor_masks[symbol] = [
+                self._mask_of(frozen.closure(row[a])) if row[a] else 0
+                for row in frozen.transitions
+            ]
+
+        self.chunk_tables = {symbol: self._build_chunk_tables(masks)
+                             for symbol, masks in self.successor_masks.items()}
+
+    @staticmethod
+    def _mask_of(state_ids):
+        """Convierte un conjunto de índices de estado en una máscara de bits"""
+        mask = 0
+        for q in state_ids:
+            mask |= 1 << q
+        return mask
+
+    def _build_chunk_tables(self, masks):
+        """
+        Construye, para un símbolo, las tablas de sucesores por fragmento de 8 bits.
+
+        :param masks: Máscara sucesora de cada estado con el símbolo (list de int)
+        :return: Lista de tablas de 256 entradas, una por fragmento
+        """
+        chunk_size = 1 << self.CHUNK_BITS
+        # Rellenar hasta un múltiplo del fragmento con estados sin sucesores
+        masks = masks + [0] * (-len(masks) % self.CHUNK_BITS)
+        tables = []
+        for base in range(0, len(masks), self.CHUNK_BITS):
+            table = [0] * chunk_size
+            for byte in range(1, chunk_size):
+                lowest = byte & -byte
+                table[byte] = table[byte ^ lowest] | masks[base + lowest.bit_length() - 1]
+            tables.append(table)
+        return tables
+
+    def step(self, mask, symbol):
+        """
+        Calcula la máscara sucesora de ``mask`` con ``symbol``.
+
+        :param mask: Conjunto de estados actual como máscara de bits (int)
+        :param symbol: Símbolo de entrada
+        :return: Máscara de bits de los estados siguientes (int)
+        """
+        try:
+            tables = self.chunk_tables[symbol]
+        except KeyError:
+            raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto") from None
+        result = 0
+        chunk = 0
+        while mask:
+            byte = mask & 0xFF
+            if byte:
+                result |= tables[chunk][byte]
+            mask >>= self.CHUNK_BITS
+            chunk += 1
+        return result
+
+    def run(self, input_string):
+        """
+        Procesa la cadena completa desde el estado inicial. Si el conjunto de
+        estados queda vacío, el resto de la entrada no se examina.
+
+        :param input_string: Cadena de entrada
+        :return: Máscara de bits de los estados alcanzados (int)
+        """
+        chunk_tables = self.chunk_tables
+        mask = self.initial_mask
+        for symbol in input_string:
+            try:
+                tables = chunk_tables[symbol]
+            except KeyError:
+                raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto") from None
+            result = 0
+            chunk = 0
+            while mask:
+                byte = mask & 0xFF
+                if byte:
+                    result |= tables[chunk][byte]
+                mask >>= 8
+                chunk += 1
+            mask = result
+            if not mask:
+                break
+        return mask
+
+    def accepts(self, input_string):
+        """Indica si la cadena de entrada es aceptada"""
+        return bool(self.run(input_string) & self.final_mask)
+
+    def states_of(self, mask):
+        """
+        Decodifica una máscara de bits al conjunto de nombres de estado.
+
+        :param mask: Máscara de bits (int)
+        :return: Conjunto de estados (set)
+        """
+        return {state for i, state in enumerate(self.states) if mask >> i & 1}
@@ -0,0 +1,169 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él, accepts_many evalúa cadena a cadena
+    np = None
+
+
+class CompiledDFA:
+    """
+    Representación compilada de un Autómata Finito Determinista (AFD).
+
+    Los estados y los símbolos se internan como enteros densos y las transiciones
+    se guardan en una tabla plana ``array('i')`` de tamaño ``estados * símbolos``.
+    Cada entrada de la tabla almacena directamente el desplazamiento de la fila
+    destino (``estado * num_símbolos``), por lo que el bucle de ``accepts`` hace
+    un único acceso a la tabla por carácter.
+
+    Las transiciones ausentes apuntan a un estado sumidero implícito (el último
+    índice), que no es de aceptación y se transita a sí mismo.
+    """
+    def __init__(self, states, alphabet, table, initial_state, final_flags, buffer=None):
+        """
+        :param states: Nombres de los estados internados, en orden de índice (tuple)
+        :param alphabet: Símbolos internados, en orden de índice (tuple)
+        :param table: Tabla plana de desplazamientos de fila (array('i') o memoryview de int32)
+        :param initial_state: Índice del estado inicial (int)
+        :param final_flags: Bandera de aceptación por índice de estado (bytearray),
+            incluyendo el estado sumidero
+        :param buffer: Objeto que mantiene viva la memoria de ``table`` y
+            ``final_flags`` cuando son vistas (p. ej. el mmap de un archivo binario)
+        """
+        self.states = states
+        self.alphabet = alphabet
+        self.symbol_index = {symbol: i for i, symbol in enumerate(alphabet)}
+        # Con un alfabeto vacío se mantiene un paso de 1 para que las filas no colapsen
+        self.stride = max(len(alphabet), 1)
+        self.table = table
+        self.initial_state = initial_state
+        self.initial_row = initial_state * self.stride
+        self.final_flags = final_flags
+        self.sink = len(states)
+        self.buffer = buffer
+
+    @classmethod
+    def from_frozen(cls, frozen):
+        """
+        Compila la forma congelada de un autómata determinista.
+
+        :param frozen: Instancia de FrozenAutomata con como máximo un destino por
+            (estado, símbolo) y sin transiciones ε
+        :return: Instancia de CompiledDFA
+        :raises ValueError: Si el autómata no es determinista
+        """
+        if not frozen.is_deterministic():
+            raise ValueError("El autómata no es determinista; no se puede compilar como AFD (use determinize())")
+
+        stride = max(len(frozen.alphabet), 1)
+        sink = len(frozen.states)
+        table = array('i', [sink * stride]) * ((sink + 1) * stride)
+        for q, row in enumerate(frozen.transitions):
+            base = q * stride
+            for a, dest_states in enumerate(row):
+                if dest_states:
+                    table[base + a] = dest_states[0] * stride
+
+        final_flags = bytearray(sink + 1)
+        for q in frozen.final_states:
+            final_flags[q] = 1
+
+        return cls(frozen.states, frozen.alphabet, table, frozen.initial_state, final_flags)
+
+    @classmethod
+    def from_automata(cls, automata):
+        """
+        Compila un ``Automata`` determinista.
+
+        :param automata: Instancia de Automata
+        :return: Instancia de CompiledDFA
+        :raises ValueError: Si el autómata no es determinista
+        """
+        return cls.from_frozen(automata.freeze())
+
+    def accepts(self, input_string):
+        """
+        Indica si el AFD acepta la cadena de entrada.
+
+        :param input_string: Cadena (o iterable de símbolos) a evaluar
+        :return: True si la cadena es aceptada
+        :raises ValueError: Si aparece un símbolo fuera del alfabeto
+        """
+        table = self.table
+        symbol_index = self.symbol_index
+        row = self.initial_row
+        try:
+            for symbol in input_string:
+                row = table[row + symbol_index[symbol]]
+        except KeyError as e:
+            raise ValueError(f"Símbolo '{e.args[0]}' no está en el alfabeto") from None
+        return self.final_flags[row // self.stride] == 1
+
+    def accepts_many(self, strings, batch_size=65536):
+        """
+        Evalúa un lote de cadenas de una sola vez.
+
+        Con NumPy disponible, cada bloque de ``batch_size`` cadenas se codifica
+        como una matriz de símbolos rellenada más un vector de longitudes, y todo
+        el bloque avanza por la tabla del AFD con indexación avanzada, una columna
+        por paso de tiempo. El relleno usa una columna extra de la tabla que deja
+        cada estado en sí mismo. Sin NumPy se recurre a ``accepts`` por cadena.
+
+        :param strings: Iterable de cadenas
+        :param batch_size: Número de cadenas procesadas por bloque (int)
+        :return: Vector booleano de NumPy (o lista de bool sin NumPy)
+        :raises ValueError: Si aparece un símbolo fuera del alfabeto
+        """
+        strings = list(strings)
+        if np is None:
+            return [self.accepts(string) for string in strings]
+
+        num_states = self.sink + 1
+        num_symbols = len(self.alphabet)
+        width = num_symbols + 1
+        pad = num_symbols
+        # Tabla plana de desplazamientos de fila con una columna extra de relleno
+        # que deja cada estado en sí mismo
+        dense = np.empty((num_states, width), dtype=np.intp)
+        dense[:, :num_symbols] = (
+            np.frombuffer(self.table, dtype=np.int32).reshape(num_states, self.stride)[:, :num_symbols]
+            // self.stride
+        )
+        dense[:, pad] = np.arange(num_states)
+        flat = (dense * width).ravel()
+        final_flags = np.frombuffer(bytes(self.final_flags), dtype=np.uint8).astype(bool)
+
+        # Tabla de búsqueda de símbolo por punto de código; solo los símbolos de un
+        # carácter pueden aparecer al iterar una cadena. La última posición (-1)
+        # recoge cualquier punto de código fuera de rango.
+        single = {ord(symbol): i for i, symbol in enumerate(self.alphabet) if len(symbol) == 1}
+        lookup = np.full(max(single, default=-1) + 2, -1, dtype=np.intp)
+        for code, i in single.items():
+            lookup[code] = i
+        out_of_range = len(lookup) - 1
+
+        result = np.empty(len(strings), dtype=bool)
+        for start in range(0, len(strings), batch_size):
+            batch = strings[start:start + batch_size]
+            lengths = np.fromiter(map(len, batch), dtype=np.intp, count=len(batch))
+            codes = np.frombuffer("".join(batch).encode('utf-32-le'), dtype=np.uint32)
+            symbols = lookup[np.minimum(codes, out_of_range)]
+            if (symbols < 0).any():
+                bad = chr(int(codes[np.argmax(symbols < 0)]))
+                raise ValueError(f"Símbolo '{bad}' no está en el alfabeto")
+
+            # Matriz rellenada en orden temporal (una fila por paso) para que cada
+            # paso lea memoria contigua
+            max_length = int(lengths.max()) if len(batch) else 0
+            matrix = np.full((max_length, len(batch)), pad, dtype=np.intp)
+            if len(codes):
+                offsets = np.cumsum(lengths) - lengths
+                cols = np.repeat(np.arange(len(batch)), lengths)
+                rows = np.arange(len(codes)) - np.repeat(offsets, lengths)
+                matrix[rows, cols] = symbols
+
+            rows_offsets = np.full(len(batch), self.initial_state * width, dtype=np.intp)
+            for step in matrix:
+                rows_offsets = flat[rows_offsets + step]
+            result[start:start + len(batch)] = final_flags[rows_offsets // width]
+        return result
@@ -1,12 +1,33 @@
 import json
 from pathlib import Path
-from core.automata import Automata
+from core.automata import Automata, EPSILON
+from core import binary_format, machine_cache
 
 class AutomataFileHandler:
     @staticmethod
-    def load_automata_from_file(file_path: str) -> Automata:
-        """Carga un autómata desde un archivo JSON"""
+    def load_automata_from_file(file_path: str, use_cache: bool = False) -> Automata:
+        """
+        Carga un autómata desde un archivo JSON o binario (detectado por su firma).
+        Con ``use_cache`` se reutiliza el autómata ya validado, con sus ε-clausuras y
+        estados muertos, guardado en ``__automatacache__`` mientras el archivo no
+        cambie.
+        """
+        if not use_cache:
+            return AutomataFileHandler._parse_automata_file(file_path)
         try:
+            return machine_cache.load_cached(file_path, 'fa', AutomataFileHandler._parse_automata_file,
+                                             AutomataFileHandler._encode_cached,
+                                             AutomataFileHandler._decode_cached)
+        except OSError as e:
+            raise ValueError(f"Error al cargar el autómata: {str(e)}")
+
+    @staticmethod
+    def _parse_automata_file(file_path: str) -> Automata:
+        """Lee y valida el archivo fuente del autómata"""
+        try:
+            if binary_format.is_binary_file(file_path):
+                return binary_format.read_automata(file_path)
+
             with open(file_path, 'r', encoding='utf-8') as file:
                 data = json.load(file)
                 
@@ -16,6 +37,10 @@ class AutomataFileHandler:
                 if field not in data:
                     raise ValueError(f"El archivo JSON no contiene el campo requerido: {field}")
             
+            # 'ε' está reservado para las transiciones vacías
+            if EPSILON in data['alphabet']:
+                raise ValueError(f"El alfabeto no puede contener el símbolo reservado '{EPSILON}'")
+            
             return Automata(
                 states=data['states'],
                 alphabet=data['alphabet'],
@@ -29,12 +54,48 @@ class AutomataFileHandler:
         except Exception as e:
             raise ValueError(f"Error al cargar el autómata: {str(e)}")
     
+    @staticmethod
+    def _encode_cached(automata: Automata) -> bytes:
+        """Datos JSON del autómata y de sus datos derivados para la caché"""
+        closures = None
+        if automata.epsilon_closures is not None:
+            # Los estados de una misma componente comparten su clausura
+            index = {}
+            for closure in automata.epsilon_closures.values():
+                index.setdefault(closure, len(index))
+            closures = {
+                'sets': [list(closure) for closure in index],
+                'of': {state: index[closure] for state, closure in automata.epsilon_closures.items()}
+            }
+        data = {
+            'states': automata.states,
+            'alphabet': automata.alphabet,
+            'transitions': automata.transitions,
+            'initial_state': automata.initial_state,
+            'final_states': automata.final_states,
+            'epsilon_closures': closures,
+            'dead_states': list(automata._dead_states)
+        }
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _decode_cached(payload: bytes) -> Automata:
+        """Reconstruye el autómata de una entrada de la caché sin volver a validarlo"""
+        data = json.loads(payload)
+        closures = data['epsilon_closures']
+        if closures is not None:
+            sets = [frozenset(closure) for closure in closures['sets']]
+            closures = {state: sets[i] for state, i in closures['of'].items()}
+        return Automata._restore(data['states'], data['alphabet'], data['transitions'],
+                                 data['initial_state'], data['final_states'], closures,
+                                 frozenset(data['dead_states']))
+
     @staticmethod
     def save_automata_to_file(automata: Automata, file_path: str, name: str = ""):
         """Guarda un autómata en un archivo JSON"""
         data = {
             "name": name,
-            "type": "DFA",
+            "type": "DFA" if automata.is_deterministic() else "NFA",
             "states": automata.states,
             "alphabet": automata.alphabet,
             "transitions": automata.transitions,
@@ -43,4 +104,20 @@ class AutomataFileHandler:
         }
         
         with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=4)
\ No newline at end of file
+            json.dump(data, file, indent=4)
+
+    @staticmethod
+    def save_automata_to_binary(automata: Automata, file_path: str):
+        """Guarda un autómata en el formato binario compacto (proyectable con mmap)"""
+        binary_format.write_automata(automata, file_path)
+
+    @staticmethod
+    def load_compiled_dfa(file_path: str):
+        """
+        Carga la tabla AFD de un archivo binario proyectándola en memoria, sin copiarla.
+        Los procesos que abren el mismo archivo comparten sus páginas.
+        """
+        try:
+            return binary_format.load_compiled(file_path)
+        except OSError as e:
+            raise ValueError(f"Error al cargar el autómata: {str(e)}")
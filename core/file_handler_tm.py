@@ -1,4 +1,5 @@
 import json
+from core import machine_cache
 from core.turing_machine import TuringMachine
 
 class TuringMachineFileHandler:
@@ -6,16 +7,30 @@ class TuringMachineFileHandler:
     Maneja la carga y guardado de Máquinas de Turing desde/hacia archivos JSON.
     """
     @staticmethod
-    def load_turing_machine_from_file(file_path):
+    def load_turing_machine_from_file(file_path, use_cache=False):
         """
         Carga una Máquina de Turing desde un archivo JSON.
 
         Args:
             file_path (str): Ruta al archivo JSON.
+            use_cache (bool): Si es True, reutiliza la MT ya construida guardada en
+                ``__automatacache__`` mientras el archivo no cambie.
 
         Returns:
             TuringMachine: Una instancia de TuringMachine.
         """
+        if not use_cache:
+            return TuringMachineFileHandler._parse_turing_machine_file(file_path)
+        return machine_cache.load_cached(
+            file_path, 'tm', TuringMachineFileHandler._parse_turing_machine_file,
+            TuringMachineFileHandler._encode_turing_machine,
+            TuringMachineFileHandler._decode_turing_machine)
+
+    @staticmethod
+    def _parse_turing_machine_file(file_path):
+        """
+        Lee el archivo JSON y construye la Máquina de Turing.
+        """
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
@@ -33,6 +48,34 @@ class TuringMachineFileHandler:
 
         return TuringMachine(states, alphabet, tape_alphabet, transitions, initial_state, blank_symbol, final_states)
 
+    @staticmethod
+    def _encode_turing_machine(turing_machine):
+        """
+        Datos JSON de la MT para la caché. Las transiciones se guardan como
+        listas [estado, símbolo, pasos] para no tener que evaluar claves.
+        """
+        data = {
+            'states': list(turing_machine.states),
+            'alphabet': list(turing_machine.alphabet),
+            'tape_alphabet': list(turing_machine.tape_alphabet),
+            'transitions': [[state, symbol, [list(step) for step in steps]]
+                            for (state, symbol), steps in turing_machine.transitions.items()],
+            'initial_state': turing_machine.initial_state,
+            'blank_symbol': turing_machine.blank_symbol,
+            'final_states': list(turing_machine.final_states)
+        }
+        return json.dumps(data).encode('utf-8')
+
+    @staticmethod
+    def _decode_turing_machine(payload):
+        """Reconstruye la MT a partir de una entrada de la caché"""
+        data = json.loads(payload.decode('utf-8'))
+        transitions = {(state, symbol): [tuple(step) for step in steps]
+                       for state, symbol, steps in data['transitions']}
+        return TuringMachine(set(data['states']), set(data['alphabet']), set(data['tape_alphabet']),
+                             transitions, data['initial_state'], data['blank_symbol'],
+                             set(data['final_states']))
+
     @staticmethod
     def save_turing_machine_to_file(turing_machine, file_path):
         """
@@ -0,0 +1,180 @@
+import hashlib
+import json
+from types import MappingProxyType
+
+# Símbolo reservado para las transiciones vacías (ε) en el diccionario de transiciones
+EPSILON = 'ε'
+
+
+class FrozenAutomata:
+    """
+    Representación inmutable, compacta y hashable de un autómata finito.
+
+    Los nombres de estados y símbolos se internan como enteros densos (su posición
+    en ``states`` y ``alphabet``) y todas las estructuras son tuplas, ``frozenset``
+    o vistas de solo lectura. Los motores de ejecución, las cachés y los procesos
+    trabajadores pueden compartir una misma instancia sin volver a derivar tablas
+    de búsqueda.
+
+    Atributos:
+        states: Nombres de los estados por índice (tuple)
+        alphabet: Símbolos por índice, sin ε (tuple)
+        state_index / symbol_index: Nombre -> índice (mapeo de solo lectura)
+        transitions: ``transitions[q][a]`` es la tupla ordenada de destinos (tuple)
+        epsilon_transitions: Destinos ε por estado (tuple) o None si no hay
+        epsilon_closures: ε-clausura de cada estado (tuple de frozenset) o None
+        initial_state: Índice del estado inicial (int)
+        final_states: Índices de los estados finales (frozenset)
+        content_hash: SHA-256 del contenido canónico, independiente del orden (str),
+            calculado en el primer acceso
+    """
+    __slots__ = ('states', 'alphabet', 'state_index', 'symbol_index', 'transitions',
+                 'epsilon_transitions', 'epsilon_closures', 'initial_state',
+                 'final_states', '_content_hash')
+
+    def __init__(self, states, alphabet, transitions, initial_state, final_states,
+                 epsilon_transitions=None, epsilon_closures=None):
+        """
+        :param states: Nombres de los estados por índice (tuple)
+        :param alphabet: Símbolos por índice (tuple)
+        :param transitions: Destinos por [estado][símbolo] (tuple de tuple de tuple de int)
+        :param initial_state: Índice del estado inicial (int)
+        :param final_states: Índices de los estados finales (frozenset)
+        :param epsilon_transitions: Destinos ε por estado (tuple de tuple de int) o None
+        :param epsilon_closures: ε-clausuras por estado (tuple de frozenset) o None
+        """
+        values = {
+            'states': tuple(states),
+            'alphabet': tuple(alphabet),
+            'state_index': MappingProxyType({state: i for i, state in enumerate(states)}),
+            'symbol_index': MappingProxyType({symbol: i for i, symbol in enumerate(alphabet)}),
+            'transitions': transitions,
+            'epsilon_transitions': epsilon_transitions,
+            'epsilon_closures': epsilon_closures,
+            'initial_state': initial_state,
+            'final_states': frozenset(final_states),
+            # El hash se calcula en el primer acceso (ver content_hash)
+            '_content_hash': None,
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_automata(cls, automata):
+        """
+        Interna un ``Automata`` en su forma congelada.
+
+        :param automata: Instancia de Automata
+        :return: Instancia de FrozenAutomata
+        """
+        state_index = {}
+        for state in list(automata.states) + [automata.initial_state]:
+            state_index.setdefault(state, len(state_index))
+        for state, trans in automata.transitions.items():
+            state_index.setdefault(state, len(state_index))
+            for dest_states in trans.values():
+                for dest_state in dest_states:
+                    state_index.setdefault(dest_state, len(state_index))
+
+        alphabet = tuple(symbol for symbol in automata.alphabet if symbol != EPSILON)
+        states = tuple(state_index)
+        transitions = []
+        epsilon_transitions = []
+        for state in states:
+            trans = automata.transitions.get(state, {})
+            transitions.append(tuple(
+                tuple(sorted({state_index[dest_state] for dest_state in trans.get(symbol, ())}))
+                for symbol in alphabet
+            ))
+            epsilon_transitions.append(
+                tuple(sorted({state_index[dest_state] for dest_state in trans.get(EPSILON, ())}))
+            )
+
+        epsilon_closures = None
+        if automata.epsilon_closures is not None:
+            epsilon_closures = tuple(
+                frozenset(state_index[member] for member in automata.epsilon_closures.get(state, (state,)))
+                for state in states
+            )
+        else:
+            epsilon_transitions = None
+
+        return cls(
+            states=states,
+            alphabet=alphabet,
+            transitions=tuple(transitions),
+            initial_state=state_index[automata.initial_state],
+            final_states=frozenset(state_index[state] for state in automata.final_states
+                                   if state in state_index),
+            epsilon_transitions=tuple(epsilon_transitions) if epsilon_transitions is not None else None,
+            epsilon_closures=epsilon_closures
+        )
+
+    @property
+    def content_hash(self):
+        """SHA-256 del contenido canónico; se calcula la primera vez que se consulta"""
+        if self._content_hash is None:
+            object.__setattr__(self, '_content_hash', self._compute_content_hash())
+        return self._content_hash
+
+    def _compute_content_hash(self):
+        """SHA-256 del contenido en forma canónica (nombres ordenados)"""
+        states = self.states
+        edges = []
+        for q, row in enumerate(self.transitions):
+            for a, dest_states in enumerate(row):
+                edges.extend([states[q], self.alphabet[a], states[p]] for p in dest_states)
+        if self.epsilon_transitions is not None:
+            for q, dest_states in enumerate(self.epsilon_transitions):
+                edges.extend([states[q], EPSILON, states[p]] for p in dest_states)
+        canonical = {
+            'states': sorted(states),
+            'alphabet': sorted(self.alphabet),
+            'transitions': sorted(edges),
+            'initial_state': states[self.initial_state],
+            'final_states': sorted(states[q] for q in self.final_states),
+        }
+        data = json.dumps(canonical, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def closure(self, state_ids):
+        """
+        ε-clausura de un conjunto de índices de estado.
+
+        :param state_ids: Iterable de índices
+        :return: frozenset de índices
+        """
+        if self.epsilon_closures is None:
+            return frozenset(state_ids)
+        closures = self.epsilon_closures
+        result = set()
+        for q in state_ids:
+            result |= closures[q]
+        return frozenset(result)
+
+    def is_deterministic(self):
+        """Verifica que no haya transiciones ε ni más de un destino por (estado, símbolo)"""
+        return self.epsilon_closures is None and all(
+            len(dest_states) <= 1 for row in self.transitions for dest_states in row)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenAutomata es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenAutomata es inmutable")
+
+    def __reduce__(self):
+        return (FrozenAutomata, (self.states, self.alphabet, self.transitions, self.initial_state,
+                                 self.final_states, self.epsilon_transitions, self.epsilon_closures))
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenAutomata):
+            return NotImplemented
+        return self.content_hash == other.content_hash
+
+    def __hash__(self):
+        return hash(self.content_hash)
+
+    def __repr__(self):
+        return (f"FrozenAutomata(estados={len(self.states)}, símbolos={len(self.alphabet)}, "
+                f"hash={self.content_hash[:12]})")
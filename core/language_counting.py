@@ -0,0 +1,243 @@
+import random
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan listas de enteros de Python
+    np = None
+
+
+class WordCounter:
+    """
+    Conteo de cadenas aceptadas por longitud sobre un AFD.
+
+    El AFD se ve como una matriz de transición ``M`` donde ``M[q][p]`` es el número
+    de símbolos que llevan de ``q`` a ``p``. El número de cadenas aceptadas de
+    longitud ``n`` es ``e_inicial · M^n · f_finales``, que se calcula con
+    programación dinámica sobre un vector de conteos por estado (cada paso recorre
+    solo las aristas de ``M``) o, para ``n`` muy grande, con exponenciación de la
+    matriz densa por cuadrados repetidos.
+
+    Los conteos son exactos: con NumPy se usan arreglos ``int64`` mientras
+    ``|Σ|^n`` quepa en 63 bits y arreglos ``object`` (enteros de Python) a partir
+    de ahí.
+    """
+    def __init__(self, frozen):
+        """
+        :param frozen: Forma congelada (FrozenAutomata) de un AFD
+        :raises ValueError: Si el autómata no es determinista
+        """
+        if not frozen.is_deterministic():
+            raise ValueError("El conteo requiere un autómata determinista (use determinize())")
+        self.frozen = frozen
+        self.num_states = len(frozen.states)
+        self.num_symbols = len(frozen.alphabet)
+        # Filas dispersas: rows[q] = {p: número de símbolos de q a p}
+        self.rows = []
+        for row in frozen.transitions:
+            counts = {}
+            for dest_states in row:
+                if dest_states:
+                    counts[dest_states[0]] = counts.get(dest_states[0], 0) + 1
+            self.rows.append(counts)
+        self.num_edges = sum(len(counts) for counts in self.rows)
+
+    def _dtype_for(self, n):
+        """Tipo de NumPy capaz de representar sin desbordamiento conteos hasta |Σ|^n"""
+        if self.num_symbols <= 1 or n * (self.num_symbols - 1).bit_length() < 63:
+            return np.int64
+        return object
+
+    def _edge_arrays(self, dtype):
+        """Aristas de M como arreglos paralelos (origen, destino, multiplicidad)"""
+        src = np.array([q for q, counts in enumerate(self.rows) for _ in counts], dtype=np.intp)
+        dst = np.array([p for counts in self.rows for p in counts], dtype=np.intp)
+        mult = np.array([count for counts in self.rows for count in counts.values()], dtype=dtype)
+        return src, dst, mult
+
+    def _step_edges(self, counts, edges):
+        """Un paso de la programación dinámica hacia adelante con NumPy, O(|δ|)"""
+        src, dst, mult = edges
+        new_counts = np.zeros_like(counts)
+        np.add.at(new_counts, dst, counts[src] * mult)
+        return new_counts
+
+    def _matrix(self, dtype):
+        matrix = np.zeros((self.num_states, self.num_states), dtype=dtype)
+        for q, counts in enumerate(self.rows):
+            for p, count in counts.items():
+                matrix[q, p] = count
+        return matrix
+
+    def _final_vector(self, dtype):
+        vector = np.zeros(self.num_states, dtype=dtype)
+        for q in self.frozen.final_states:
+            vector[q] = 1
+        return vector
+
+    def _step_forward(self, counts):
+        """Un paso de la programación dinámica hacia adelante en Python puro"""
+        new_counts = [0] * self.num_states
+        rows = self.rows
+        for q, count in enumerate(counts):
+            if count:
+                for p, multiplicity in rows[q].items():
+                    new_counts[p] += count * multiplicity
+        return new_counts
+
+    def length_profile(self, max_n):
+        """
+        Cuenta las cadenas aceptadas de cada longitud entre 0 y ``max_n``.
+
+        :param max_n: Longitud máxima (int)
+        :return: Lista de conteos, uno por longitud
+        """
+        if max_n < 0:
+            raise ValueError("La longitud máxima no puede ser negativa")
+        finals = sorted(self.frozen.final_states)
+        profile = []
+        if np is not None:
+            dtype = self._dtype_for(max_n)
+            edges = self._edge_arrays(dtype)
+            counts = np.zeros(self.num_states, dtype=dtype)
+            counts[self.frozen.initial_state] = 1
+            for _ in range(max_n + 1):
+                profile.append(int(counts[finals].sum()) if finals else 0)
+                counts = self._step_edges(counts, edges)
+            return profile
+
+        counts = [0] * self.num_states
+        counts[self.frozen.initial_state] = 1
+        for _ in range(max_n + 1):
+            profile.append(sum(counts[q] for q in finals))
+            counts = self._step_forward(counts)
+        return profile
+
+    def _matrix_power_count(self, n):
+        """Conteo de longitud n con exponenciación de matrices por cuadrados repetidos"""
+        size = self.num_states
+        if np is not None:
+            dtype = self._dtype_for(n)
+            result = self._final_vector(dtype)
+            base = self._matrix(dtype)
+            while n:
+                if n & 1:
+                    result = base.dot(result)
+                n >>= 1
+                if n:
+                    base = base.dot(base)
+            return int(result[self.frozen.initial_state])
+
+        def multiply(a, b):
+            return [[sum(a[i][k] * b[k][j] for k in range(size) if a[i][k]) for j in range(size)]
+                    for i in range(size)]
+
+        base = [[self.rows[q].get(p, 0) for p in range(size)] for q in range(size)]
+        result = [1 if q in self.frozen.final_states else 0 for q in range(size)]
+        while n:
+            if n & 1:
+                result = [sum(base[q][p] * result[p] for p in range(size)) for q in range(size)]
+            n >>= 1
+            if n:
+                base = multiply(base, base)
+        return result[self.frozen.initial_state]
+
+    def count(self, n, method='auto'):
+        """
+        Cuenta las cadenas aceptadas de longitud exactamente ``n``.
+
+        :param n: Longitud (int)
+        :param method: 'dp' (programación dinámica, O(n·|δ|)), 'matrix'
+            (exponenciación, O(|Q|³·log n)) o 'auto' para elegir el más barato
+        :return: Número de cadenas aceptadas (int)
+        """
+        if n < 0:
+            raise ValueError("La longitud no puede ser negativa")
+        if method not in ('auto', 'dp', 'matrix'):
+            raise ValueError(f"Método inválido: '{method}'. Use 'auto', 'dp' o 'matrix'")
+        if method == 'auto':
+            dp_cost = n * max(self.num_edges, 1)
+            matrix_cost = self.num_states ** 3 * max(n.bit_length(), 1)
+            method = 'matrix' if matrix_cost < dp_cost else 'dp'
+        if method == 'matrix':
+            return self._matrix_power_count(n)
+        return self._dp_count(n)
+
+    def _dp_count(self, n):
+        """Conteo de longitud n con programación dinámica hacia adelante"""
+        finals = sorted(self.frozen.final_states)
+        if np is not None:
+            dtype = self._dtype_for(n)
+            edges = self._edge_arrays(dtype)
+            counts = np.zeros(self.num_states, dtype=dtype)
+            counts[self.frozen.initial_state] = 1
+            for _ in range(n):
+                counts = self._step_edges(counts, edges)
+            return int(counts[finals].sum()) if finals else 0
+
+        counts = [0] * self.num_states
+        counts[self.frozen.initial_state] = 1
+        for _ in range(n):
+            counts = self._step_forward(counts)
+        return sum(counts[q] for q in finals)
+
+    def count_table(self, n):
+        """
+        Tabla de conteos hacia atrás: ``table[k][q]`` es el número de cadenas de
+        longitud ``k`` aceptadas partiendo del estado ``q``, para k = 0..n.
+
+        :param n: Longitud máxima (int)
+        :return: Lista de n + 1 listas de enteros
+        """
+        if n < 0:
+            raise ValueError("La longitud no puede ser negativa")
+        final_states = self.frozen.final_states
+        table = [[1 if q in final_states else 0 for q in range(self.num_states)]]
+        rows = self.rows
+        for _ in range(n):
+            previous = table[-1]
+            table.append([sum(previous[p] * multiplicity for p, multiplicity in rows[q].items())
+                          for q in range(self.num_states)])
+        return table
+
+    def sample(self, n, k, seed=None):
+        """
+        Extrae ``k`` cadenas aceptadas de longitud ``n`` de forma uniforme.
+
+        Se precalcula la tabla de conteos una vez; cada muestra recorre el AFD
+        desde el estado inicial eligiendo cada símbolo con probabilidad
+        proporcional al número de cadenas aceptadas que completan el resto de la
+        longitud, en O(n·|Σ|) por muestra.
+
+        :param n: Longitud de las cadenas (int)
+        :param k: Número de muestras (int)
+        :param seed: Semilla del generador aleatorio (opcional)
+        :return: Lista de k cadenas
+        :raises ValueError: Si no hay cadenas aceptadas de longitud n
+        """
+        if k < 0:
+            raise ValueError("El número de muestras no puede ser negativo")
+        table = self.count_table(n)
+        initial_state = self.frozen.initial_state
+        if table[n][initial_state] == 0:
+            raise ValueError(f"No hay cadenas aceptadas de longitud {n}")
+
+        rng = random.Random(seed)
+        alphabet = self.frozen.alphabet
+        transitions = self.frozen.transitions
+        samples = []
+        for _ in range(k):
+            q = initial_state
+            symbols = []
+            for remaining in range(n - 1, -1, -1):
+                choice = rng.randrange(table[remaining + 1][q])
+                for a, dest_states in enumerate(transitions[q]):
+                    if not dest_states:
+                        continue
+                    weight = table[remaining][dest_states[0]]
+                    if choice < weight:
+                        symbols.append(alphabet[a])
+                        q = dest_states[0]
+                        break
+                    choice -= weight
+            samples.append("".join(symbols))
+        return samples
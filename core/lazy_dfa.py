@@ -0,0 +1,103 @@
+from collections import OrderedDict
+
+
+class LazyDFA:
+    """
+    Simulación de un AFN mediante construcción de subconjuntos bajo demanda.
+
+    Cada transición ``(frozenset(estados), símbolo) -> frozenset(siguientes)`` se
+    calcula la primera vez que se necesita y se memoriza en una caché LRU acotada.
+    Una vez caliente, cada símbolo cuesta una búsqueda en la caché, como en un AFD,
+    sin pagar por adelantado la determinización completa. Los conjuntos de estados
+    se representan con los índices enteros de la forma congelada del autómata.
+    """
+    def __init__(self, frozen, cache_size=4096):
+        """
+        :param frozen: Forma congelada del autómata (FrozenAutomata), determinista o no
+        :param cache_size: Número máximo de transiciones memorizadas (int)
+        """
+        if cache_size < 1:
+            raise ValueError("El tamaño de la caché debe ser al menos 1")
+        self.frozen = frozen
+        self.final_states = frozen.final_states
+        self.initial_states = frozen.closure([frozen.initial_state])
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def next_states(self, states, symbol):
+        """
+        Obtiene el conjunto sucesor de ``states`` con ``symbol``, usando la caché.
+
+        :param states: Conjunto actual de índices de estado (frozenset)
+        :param symbol: Símbolo de entrada
+        :return: Conjunto de índices de los estados siguientes (frozenset)
+        """
+        key = (states, symbol)
+        cache = self.cache
+        result = cache.get(key)
+        if result is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return result
+
+        a = self.frozen.symbol_index.get(symbol)
+        if a is None:
+            raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+        self.misses += 1
+        transitions = self.frozen.transitions
+        new_states = set()
+        for q in states:
+            new_states.update(transitions[q][a])
+        result = self.frozen.closure(new_states)
+
+        cache[key] = result
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return result
+
+    def run(self, input_string):
+        """
+        Procesa la cadena completa y devuelve el conjunto de estados alcanzado.
+
+        :param input_string: Cadena de entrada
+        :return: Conjunto de índices de los estados alcanzados (frozenset)
+        """
+        states = self.initial_states
+        for symbol in input_string:
+            states = self.next_states(states, symbol)
+        return states
+
+    def states_of(self, states):
+        """Decodifica un conjunto de índices a nombres de estado"""
+        return {self.frozen.states[q] for q in states}
+
+    def accepts(self, input_string):
+        """Indica si la cadena de entrada es aceptada"""
+        return not self.final_states.isdisjoint(self.run(input_string))
+
+    def hit_rate(self):
+        """Proporción de consultas resueltas desde la caché (0.0 si no hubo consultas)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self):
+        """
+        Estadísticas de la caché.
+
+        :return: Dict con 'hits', 'misses', 'size', 'max_size' y 'hit_rate'
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.cache),
+            'max_size': self.cache_size,
+            'hit_rate': self.hit_rate()
+        }
+
+    def clear_cache(self):
+        """Vacía la caché y reinicia los contadores"""
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,109 @@
+"""
+Caché en disco de máquinas cargadas, al estilo de ``__pycache__``.
+
+Junto a cada archivo fuente se guarda en ``__automatacache__/`` la máquina ya
+validada y normalizada. Las entradas contienen solo datos, nunca objetos
+serializados: JSON con la forma ya normalizada (y, en los AF, las ε-clausuras y
+los estados muertos), que se reconstruye sin volver a validar ni recalcular
+nada. Cada cargador aporta su par de funciones de codificación y decodificación.
+
+La caché es opcional (``use_cache=True`` en los cargadores): para máquinas
+pequeñas leer la entrada cuesta lo mismo que procesar la fuente, y solo compensa
+con máquinas grandes o cargadas muchas veces, como en core.batch.
+
+Cada entrada empieza con una cabecera fija (firma y clave SHA-256 calculada
+sobre el tipo de máquina, ``CACHE_FORMAT_VERSION`` y los bytes del archivo
+fuente) que se comprueba antes de decodificar nada: si el archivo cambia o el
+formato de la caché cambia, la clave deja de coincidir y la entrada se regenera
+y se sobrescribe.
+
+La caché es una optimización: cualquier error al leerla o escribirla (directorio
+de solo lectura, entrada corrupta o manipulada) se ignora y la máquina se carga
+desde la fuente.
+"""
+import hashlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+CACHE_DIR_NAME = '__automatacache__'
+# Se incrementa cuando cambia la forma de los datos guardados para invalidar
+# todas las entradas existentes
+CACHE_FORMAT_VERSION = 2
+ENTRY_MAGIC = b'AUTC'
+# Firma seguida de la clave en hexadecimal
+_HEADER_SIZE = len(ENTRY_MAGIC) + 64
+
+
+def cache_key(kind, source):
+    """
+    Clave de una entrada de la caché.
+
+    :param kind: Tipo de máquina ('fa', 'pda' o 'tm')
+    :param source: Contenido del archivo fuente (bytes)
+    :return: Resumen SHA-256 en hexadecimal (str)
+    """
+    digest = hashlib.sha256(f"{kind}:{CACHE_FORMAT_VERSION}:".encode('utf-8'))
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def cache_path(file_path, kind):
+    """Ruta de la entrada de caché de un archivo fuente"""
+    path = Path(file_path)
+    return path.parent / CACHE_DIR_NAME / f"{path.name}.{kind}.cache"
+
+
+def _read_entry(entry_path, key, decode):
+    """Decodifica la entrada solo si su cabecera lleva la clave esperada"""
+    try:
+        with open(entry_path, 'rb') as file:
+            if file.read(_HEADER_SIZE) != ENTRY_MAGIC + key.encode('ascii'):
+                return None
+            payload = file.read()
+    except OSError:
+        return None
+    try:
+        return decode(payload)
+    except (ValueError, TypeError, KeyError, IndexError, struct.error):
+        return None
+
+
+def _write_entry(entry_path, key, payload):
+    """Escribe la entrada de forma atómica (archivo temporal + os.replace)"""
+    try:
+        entry_path.parent.mkdir(exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=entry_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(ENTRY_MAGIC + key.encode('ascii'))
+                file.write(payload)
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError:
+        pass
+
+
+def load_cached(file_path, kind, loader, encode, decode):
+    """
+    Devuelve la máquina de ``file_path`` desde la caché o la carga con ``loader``.
+
+    :param file_path: Ruta del archivo fuente
+    :param kind: Tipo de máquina ('fa', 'pda' o 'tm'), parte de la clave
+    :param loader: Función que recibe ``file_path`` y devuelve la máquina
+    :param encode: Función que convierte la máquina en bytes de datos
+    :param decode: Función inversa de ``encode``; debe lanzar ValueError (o
+        TypeError/KeyError/IndexError) ante datos malformados
+    :return: La máquina cargada
+    """
+    with open(file_path, 'rb') as file:
+        key = cache_key(kind, file.read())
+    entry_path = cache_path(file_path, kind)
+    machine = _read_entry(entry_path, key, decode)
+    if machine is None:
+        machine = loader(file_path)
+        _write_entry(entry_path, key, encode(machine))
+    return machine
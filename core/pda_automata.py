@@ -43,6 +43,28 @@ class PushdownAutomata:
         self.current_configurations = [(self.initial_state, (self.initial_stack_symbol,))]
         self.history = []
 
+    @classmethod
+    def _restore(cls, states, input_alphabet, stack_alphabet, transitions,
+                 initial_state, initial_stack_symbol, final_states):
+        """
+        Reconstruye un AP ya validado con sus transiciones ya normalizadas, sin
+        volver a validarlas (usado por la caché de core.machine_cache).
+
+        :param transitions: Transiciones normalizadas (defaultdict(list))
+        :return: Nueva instancia de PushdownAutomata
+        """
+        pda = cls.__new__(cls)
+        pda.states = set(states)
+        pda.input_alphabet = set(input_alphabet)
+        pda.stack_alphabet = set(stack_alphabet)
+        pda.transitions = transitions
+        pda.initial_state = initial_state
+        pda.initial_stack_symbol = initial_stack_symbol
+        pda.final_states = set(final_states)
+        pda.current_configurations = [(initial_state, (initial_stack_symbol,))]
+        pda.history = []
+        return pda
+
     def _normalize_transitions(self, transitions_raw):
         """
         Normaliza el diccionario de transiciones en bruto a un formato más utilizable,
@@ -1,5 +1,7 @@
+import collections
 import json
 from pathlib import Path
+from core import machine_cache
 from core.pda_automata import PushdownAutomata
 
 class PDAFileHandler:
@@ -7,18 +9,42 @@ class PDAFileHandler:
     Gestiona la carga y guardado de Autómatas de Pila a/desde archivos JSON.
     """
     @staticmethod
-    def load_pda_from_file(file_path: str) -> PushdownAutomata:
+    def load_pda_from_file(file_path: str, use_cache: bool = False) -> PushdownAutomata:
         """
         Carga un Autómata de Pila desde un archivo JSON.
 
         :param file_path: Ruta al archivo JSON.
+        :param use_cache: Si es True, reutiliza el AP ya normalizado guardado en
+            ``__automatacache__`` mientras el archivo no cambie.
         :return: Una instancia de PushdownAutomata.
         :raises ValueError: Si el archivo es inválido o faltan campos requeridos.
         """
+        if not use_cache:
+            return PDAFileHandler._parse_pda_file(file_path)
+        try:
+            return machine_cache.load_cached(file_path, 'pda', PDAFileHandler._parse_pda_file,
+                                             PDAFileHandler._encode_pda, PDAFileHandler._decode_pda)
+        except OSError as e:
+            raise ValueError(f"Error al cargar el AP: {str(e)}")
+
+    @staticmethod
+    def _parse_pda_file(file_path: str) -> PushdownAutomata:
+        """
+        Lee, valida y normaliza el archivo JSON del Autómata de Pila.
+        """
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
                 data = json.load(file)
+            return PDAFileHandler._pda_from_data(data)
+        except json.JSONDecodeError:
+            raise ValueError("El archivo no es un JSON válido.")
 
+    @staticmethod
+    def _pda_from_data(data: dict) -> PushdownAutomata:
+        """
+        Valida y normaliza los datos JSON de un Autómata de Pila.
+        """
+        try:
             # Validar estructura básica para AP
             required_fields = [
                 'states', 'input_alphabet', 'stack_alphabet', 'transitions',
@@ -59,11 +85,33 @@ class PDAFileHandler:
                 final_states=data['final_states']
             )
 
-        except json.JSONDecodeError:
-            raise ValueError("El archivo no es un JSON válido.")
         except Exception as e:
             raise ValueError(f"Error al cargar el AP: {str(e)}")
 
+    @staticmethod
+    def _encode_pda(pda: PushdownAutomata) -> bytes:
+        """
+        Datos JSON del AP ya normalizado para la caché: las transiciones se
+        guardan como listas [estado, entrada, cima, destinos] con '' para ε.
+        """
+        data = [
+            list(pda.states), list(pda.input_alphabet), list(pda.stack_alphabet),
+            [[q, a, s_top, targets] for (q, a, s_top), targets in pda.transitions.items()],
+            pda.initial_state, pda.initial_stack_symbol, list(pda.final_states)
+        ]
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _decode_pda(payload: bytes) -> PushdownAutomata:
+        """Reconstruye el AP de una entrada de la caché sin volver a validarlo"""
+        states, input_alphabet, stack_alphabet, transitions, initial_state, \
+            initial_stack_symbol, final_states = json.loads(payload)
+        normalized = collections.defaultdict(list)
+        for q, a, s_top, targets in transitions:
+            normalized[(q, a, s_top)] = [(next_q, tuple(push_symbols)) for next_q, push_symbols in targets]
+        return PushdownAutomata._restore(states, input_alphabet, stack_alphabet, normalized,
+                                         initial_state, initial_stack_symbol, final_states)
+
     @staticmethod
     def save_pda_to_file(pda: PushdownAutomata, file_path: str, name: str = ""):
         """
@@ -73,6 +121,15 @@ class PDAFileHandler:
         :param file_path: Ruta al archivo JSON.
         :param name: Nombre opcional para el autómata.
         """
+        data = PDAFileHandler._pda_to_data(pda, name)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, indent=4)
+
+    @staticmethod
+    def _pda_to_data(pda: PushdownAutomata, name: str = "") -> dict:
+        """
+        Convierte un Autómata de Pila en datos serializables en JSON.
+        """
         # Convertir transiciones (cuyas claves son tuplas) a un formato serializable en JSON (cuyas claves son strings)
         serializable_transitions = {}
         for (q, a, s_top), targets in pda.transitions.items():
@@ -100,6 +157,4 @@ class PDAFileHandler:
             "initial_stack_symbol": pda.initial_stack_symbol,
             "final_states": sorted(list(pda.final_states))
         }
-
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=4)
+        return data
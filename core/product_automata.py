@@ -0,0 +1,147 @@
+from collections import deque
+
+from core.frozen_automata import FrozenAutomata
+
+# Operaciones de lenguaje soportadas por el producto
+INTERSECTION = 'intersection'
+UNION = 'union'
+DIFFERENCE = 'difference'
+PRODUCT_OPERATIONS = (INTERSECTION, UNION, DIFFERENCE)
+
+# Nombre del componente sumidero en los estados par materializados
+SINK_NAME = '∅'
+
+
+class LazyProduct:
+    """
+    Producto de dos AFD construido bajo demanda.
+
+    Los estados son pares ``(p, q)`` de índices de estado de cada operando, donde
+    ``None`` representa el sumidero implícito (transición ausente o símbolo que no
+    pertenece al alfabeto del operando). Solo se exploran los pares alcanzables
+    desde ``(p0, q0)``: ``accepts`` calcula y memoriza las transiciones que usa, y
+    ``materialize`` recorre únicamente la parte alcanzable del producto.
+    """
+    def __init__(self, left, right, operation):
+        """
+        :param left: Forma congelada (FrozenAutomata) del primer AFD
+        :param right: Forma congelada (FrozenAutomata) del segundo AFD
+        :param operation: 'intersection', 'union' o 'difference' (str)
+        :raises ValueError: Si algún operando no es determinista o la operación no es válida
+        """
+        if operation not in PRODUCT_OPERATIONS:
+            raise ValueError(f"Operación inválida: '{operation}'. Use una de {PRODUCT_OPERATIONS}")
+        if not left.is_deterministic() or not right.is_deterministic():
+            raise ValueError("El producto requiere autómatas deterministas (use determinize())")
+        self.left = left
+        self.right = right
+        self.operation = operation
+        self.alphabet = left.alphabet + tuple(symbol for symbol in right.alphabet
+                                              if symbol not in left.symbol_index)
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.alphabet)}
+        # Índice del símbolo del producto en el alfabeto de cada operando (None si no está)
+        self._left_symbols = [left.symbol_index.get(symbol) for symbol in self.alphabet]
+        self._right_symbols = [right.symbol_index.get(symbol) for symbol in self.alphabet]
+        self.initial_state = (left.initial_state, right.initial_state)
+        self._successors = {}
+
+    @staticmethod
+    def _component_step(frozen, state, symbol_id):
+        """Transición de un operando; None representa el sumidero"""
+        if state is None or symbol_id is None:
+            return None
+        dest_states = frozen.transitions[state][symbol_id]
+        return dest_states[0] if dest_states else None
+
+    def successor(self, pair, symbol_id):
+        """
+        Calcula (y memoriza) el par sucesor.
+
+        :param pair: Estado par (p, q)
+        :param symbol_id: Índice del símbolo en ``alphabet`` (int)
+        :return: Estado par siguiente
+        """
+        key = (pair, symbol_id)
+        result = self._successors.get(key)
+        if result is None:
+            result = (self._component_step(self.left, pair[0], self._left_symbols[symbol_id]),
+                      self._component_step(self.right, pair[1], self._right_symbols[symbol_id]))
+            self._successors[key] = result
+        return result
+
+    def is_accepting(self, pair):
+        """Indica si el par es de aceptación según la operación"""
+        in_left = pair[0] is not None and pair[0] in self.left.final_states
+        in_right = pair[1] is not None and pair[1] in self.right.final_states
+        if self.operation == INTERSECTION:
+            return in_left and in_right
+        if self.operation == UNION:
+            return in_left or in_right
+        return in_left and not in_right
+
+    def is_dead(self, pair):
+        """Indica si el par ya no puede aceptar ninguna continuación por la operación"""
+        if self.operation == INTERSECTION:
+            return pair[0] is None or pair[1] is None
+        if self.operation == UNION:
+            return pair[0] is None and pair[1] is None
+        return pair[0] is None
+
+    def accepts(self, input_string):
+        """
+        Evalúa una cadena recorriendo el producto bajo demanda.
+
+        :param input_string: Cadena de entrada
+        :return: True si la cadena pertenece al lenguaje resultante
+        :raises ValueError: Si aparece un símbolo fuera de ambos alfabetos
+        """
+        pair = self.initial_state
+        for symbol in input_string:
+            symbol_id = self.symbol_index.get(symbol)
+            if symbol_id is None:
+                raise ValueError(f"Símbolo '{symbol}' no está en el alfabeto")
+            pair = self.successor(pair, symbol_id)
+            if self.is_dead(pair):
+                return False
+        return self.is_accepting(pair)
+
+    def _pair_name(self, pair):
+        left = self.left.states[pair[0]] if pair[0] is not None else SINK_NAME
+        right = self.right.states[pair[1]] if pair[1] is not None else SINK_NAME
+        return f"({left},{right})"
+
+    def materialize(self):
+        """
+        Construye la parte alcanzable del producto.
+
+        Los pares muertos para la operación no se materializan, de modo que las
+        transiciones hacia ellos se omiten como en el resto del simulador.
+
+        :return: Instancia de FrozenAutomata con estados nombrados '(p,q)'
+        """
+        index = {self.initial_state: 0}
+        pairs = [self.initial_state]
+        rows = []
+        worklist = deque([self.initial_state])
+        while worklist:
+            pair = worklist.popleft()
+            row = []
+            for symbol_id in range(len(self.alphabet)):
+                dest = self.successor(pair, symbol_id)
+                if self.is_dead(dest):
+                    row.append(())
+                    continue
+                if dest not in index:
+                    index[dest] = len(pairs)
+                    pairs.append(dest)
+                    worklist.append(dest)
+                row.append((index[dest],))
+            rows.append(tuple(row))
+
+        return FrozenAutomata(
+            states=tuple(self._pair_name(pair) for pair in pairs),
+            alphabet=self.alphabet,
+            transitions=tuple(rows),
+            initial_state=0,
+            final_states=frozenset(i for i, pair in enumerate(pairs) if self.is_accepting(pair))
+        )
@@ -0,0 +1,327 @@
+"""
+Análisis estático de retroceso catastrófico en expresiones regulares.
+
+Un motor con retroceso (como ``re``) explora todas las formas de repartir la
+entrada entre las partes del patrón antes de fallar. El análisis recorre el AST
+(ver core.regex_parser) y busca las estructuras que multiplican esas formas:
+
+- Exponencial: un bucle sin límite cuyo cuerpo ``B`` es ambiguo, es decir, una
+  misma cadena no vacía se puede cubrir con una iteración o con dos
+  (``L(B)·L(B) ∩ L(B) ≠ ∅``, como en ``(a+)+`` o ``(\\w+\\s?)*``) o con dos
+  alternativas distintas del cuerpo (``(a|a)*``).
+- Polinómica: repeticiones sin límite consecutivas que pueden consumir los mismos
+  caracteres (``\\d+\\d+``, ``.*a.*``); con ``k`` de ellas el coste es O(n^k).
+
+Las intersecciones de lenguajes se deciden recorriendo el producto de dos AFD
+perezosos (ver core.regex_engine) sobre un alfabeto de caracteres
+representativos de las clases que intervienen, con un límite de estados; si se
+alcanza el límite se supone que hay solapamiento (resultado conservador).
+
+Uso desde la línea de comandos:
+    python -m core.regex_analyzer "(a+)+b" "\\d+-\\d+"
+"""
+import argparse
+import sys
+from collections import deque, namedtuple
+
+from core.regex_engine import AT_BEGIN, AT_END, AT_END_OR_NEWLINE, DEAD_STATE, LazyRegexDFA, Program
+from core.regex_parser import (Alternation, CharClass, Concat, Empty, Group, Repeat, format_node,
+                               iter_nodes, parse_regex)
+
+# Clases de complejidad, de menor a mayor
+COMPLEXITY_LINEAR = 'lineal'
+COMPLEXITY_POLYNOMIAL = 'polinómica'
+COMPLEXITY_EXPONENTIAL = 'exponencial'
+COMPLEXITY_ORDER = (COMPLEXITY_LINEAR, COMPLEXITY_POLYNOMIAL, COMPLEXITY_EXPONENTIAL)
+
+# Tipos de problema detectados
+NESTED_QUANTIFIER = 'nested_quantifier'
+AMBIGUOUS_ALTERNATION = 'ambiguous_alternation'
+AMBIGUOUS_REPETITION = 'ambiguous_repetition'
+OVERLAPPING_QUANTIFIERS = 'overlapping_quantifiers'
+
+# Un problema concreto: tipo, complejidad que provoca, fragmento del patrón y explicación
+RegexIssue = namedtuple('RegexIssue', ['kind', 'complexity', 'fragment', 'message'])
+# Resultado del análisis; ``degree`` es el exponente k de O(n^k) en el caso polinómico
+RegexAnalysis = namedtuple('RegexAnalysis', ['pattern', 'complexity', 'degree', 'issues'])
+
+# Un bucle acotado con al menos estas repeticiones se trata como uno sin límite
+LOOP_THRESHOLD = 10
+# Pares de estados explorados como máximo al decidir una intersección
+MAX_PRODUCT_STATES = 5000
+# En el análisis las anclas se consideran siempre satisfechas
+_ALL_FLAGS = AT_BEGIN | AT_END | AT_END_OR_NEWLINE
+# Caracteres representativos de las categorías y de las clases negadas
+_REPRESENTATIVES = 'aZ0_ \t\n-.!é٣\x00'
+
+
+def _is_loop(node):
+    return isinstance(node, Repeat) and (node.max is None or node.max >= LOOP_THRESHOLD)
+
+
+def _unwrap(node):
+    while isinstance(node, Group):
+        node = node.node
+    return node
+
+
+def _nullable(node):
+    """Indica si el nodo puede coincidir con la cadena vacía"""
+    if isinstance(node, (Empty,)):
+        return True
+    if isinstance(node, CharClass):
+        return False
+    if isinstance(node, Concat):
+        return all(_nullable(item) for item in node.items)
+    if isinstance(node, Alternation):
+        return any(_nullable(option) for option in node.options)
+    if isinstance(node, Repeat):
+        return node.min == 0 or _nullable(node.node)
+    if isinstance(node, Group):
+        return _nullable(node.node)
+    return True  # Anclas
+
+
+def has_nullable_loop(parsed):
+    """
+    Indica si el patrón tiene una repetición cuyo cuerpo puede coincidir con la
+    cadena vacía (como ``(a*)*``, ``(a|)+`` o ``(?:a?|b)*``). En esos bucles ``re``
+    aplica reglas propias a las iteraciones vacías, que dependen de su retroceso,
+    y el motor AFD puede informar otra coincidencia u otros grupos.
+
+    Args:
+        parsed (ParsedRegex): Resultado de parse_regex.
+
+    Returns:
+        bool: True si hay algún bucle anulable.
+    """
+    return any(isinstance(node, Repeat) and (node.max is None or node.max > 1) and _nullable(node.node)
+               for node in iter_nodes(parsed.root))
+
+
+def _witness_alphabet(*nodes):
+    """Caracteres candidatos a distinguir las clases de los nodos dados"""
+    chars = set(_REPRESENTATIVES)
+    for root in nodes:
+        for node in iter_nodes(root):
+            if isinstance(node, CharClass):
+                for item in node.items:
+                    if isinstance(item, str):
+                        continue
+                    for code in (item[0] - 1, item[0], item[1], item[1] + 1):
+                        if 0 <= code <= 0x10FFFF and not 0xD800 <= code <= 0xDFFF:
+                            chars.add(chr(code))
+    return sorted(chars)
+
+
+def _dfa_for(node):
+    program = Program()
+    program.start = program.add_pattern(node)
+    return LazyRegexDFA(program, program.start, longest=True, cache_size=MAX_PRODUCT_STATES)
+
+
+def languages_intersect(left, right, nonempty=True):
+    """
+    Decide si dos nodos del AST coinciden con alguna cadena en común.
+
+    Args:
+        left: Primer nodo.
+        right: Segundo nodo.
+        nonempty (bool): Si es True, ignora la cadena vacía.
+
+    Returns:
+        bool: True si hay una cadena común (o si se agotó el límite de exploración).
+    """
+    left_dfa, right_dfa = _dfa_for(left), _dfa_for(right)
+    alphabet = _witness_alphabet(left, right)
+    start = (left_dfa.start(_ALL_FLAGS), right_dfa.start(_ALL_FLAGS))
+    if not nonempty and left_dfa.matches[start[0]] and right_dfa.matches[start[1]]:
+        return True
+    seen = {start}
+    worklist = deque([start])
+    while worklist:
+        left_state, right_state = worklist.popleft()
+        for char in alphabet:
+            pair = (left_dfa.step(left_state, char, _ALL_FLAGS),
+                    right_dfa.step(right_state, char, _ALL_FLAGS))
+            if pair[0] == DEAD_STATE or pair[1] == DEAD_STATE:
+                continue
+            # Se comprueba antes de descartar los pares vistos: tras al menos un
+            # carácter se puede volver al par inicial, que nunca se comprobó
+            if left_dfa.matches[pair[0]] and right_dfa.matches[pair[1]]:
+                return True
+            if pair in seen:
+                continue
+            if len(seen) >= MAX_PRODUCT_STATES or left_dfa.resets or right_dfa.resets:
+                return True
+            seen.add(pair)
+            worklist.append(pair)
+    return False
+
+
+def _loop_issue(loop):
+    """Problema exponencial de un bucle con cuerpo ambiguo, o None"""
+    body = loop.node
+    fragment = format_node(loop)
+    for node in iter_nodes(body):
+        if isinstance(node, Alternation):
+            options = node.options
+            for i in range(len(options)):
+                for j in range(i + 1, len(options)):
+                    if languages_intersect(options[i], options[j]):
+                        return RegexIssue(
+                            AMBIGUOUS_ALTERNATION, COMPLEXITY_EXPONENTIAL, fragment,
+                            f"Las alternativas '{format_node(options[i])}' y '{format_node(options[j])}' "
+                            f"pueden coincidir con el mismo texto dentro de la repetición '{fragment}'."
+                        )
+    if not languages_intersect(Concat((body, body)), body):
+        return None
+    inner_loops = [node for node in iter_nodes(body) if node is not body and _is_loop(node)]
+    if inner_loops:
+        return RegexIssue(
+            NESTED_QUANTIFIER, COMPLEXITY_EXPONENTIAL, fragment,
+            f"Cuantificadores anidados: '{format_node(inner_loops[0])}' se repite dentro de "
+            f"'{fragment}', y el mismo texto puede repartirse entre las iteraciones de ambos "
+            f"de un número exponencial de formas."
+        )
+    return RegexIssue(
+        AMBIGUOUS_REPETITION, COMPLEXITY_EXPONENTIAL, fragment,
+        f"Repetición ambigua: el mismo texto puede cubrirse con una o con varias "
+        f"iteraciones de '{fragment}'."
+    )
+
+
+def _absorbable(gap, body):
+    """Indica si lo que separa dos repeticiones puede consumir texto del cuerpo repetido"""
+    return _nullable(gap) or languages_intersect(gap, Repeat(body, 1, None, True))
+
+
+def _overlap_chains(concat):
+    """
+    Cadenas máximas de repeticiones sin límite de una concatenación que pueden
+    consumir los mismos caracteres.
+
+    Returns:
+        list: Listas de nodos Repeat, cada una con al menos dos elementos.
+    """
+    items = [_unwrap(item) for item in concat.items]
+    chains = []
+    chain = []
+    previous = None
+    for index, item in enumerate(items):
+        if not _is_loop(item):
+            continue
+        if previous is not None:
+            prev_index, prev_loop = previous
+            gap = Concat(tuple(items[prev_index + 1:index]))
+            if languages_intersect(prev_loop.node, item.node) and _absorbable(gap, prev_loop.node):
+                if not chain:
+                    chain = [prev_loop]
+                chain.append(item)
+            else:
+                if len(chain) >= 2:
+                    chains.append(chain)
+                chain = []
+        previous = (index, item)
+    if len(chain) >= 2:
+        chains.append(chain)
+    return chains
+
+
+def analyze_parsed(parsed):
+    """
+    Analiza un patrón ya convertido en AST.
+
+    Args:
+        parsed (ParsedRegex): Resultado de parse_regex.
+
+    Returns:
+        RegexAnalysis: Complejidad, grado polinómico y problemas detectados.
+    """
+    issues = []
+    degree = 1
+    for node in iter_nodes(parsed.root):
+        if _is_loop(node):
+            issue = _loop_issue(node)
+            if issue is not None:
+                issues.append(issue)
+        elif isinstance(node, Concat):
+            for chain in _overlap_chains(node):
+                degree = max(degree, len(chain))
+                fragments = ', '.join(f"'{format_node(loop)}'" for loop in chain)
+                issues.append(RegexIssue(
+                    OVERLAPPING_QUANTIFIERS, COMPLEXITY_POLYNOMIAL,
+                    ''.join(format_node(loop) for loop in chain),
+                    f"Cuantificadores solapados: {fragments} pueden consumir los mismos "
+                    f"caracteres; si la coincidencia falla se prueban O(n^{len(chain)}) repartos."
+                ))
+
+    complexity = COMPLEXITY_LINEAR
+    for issue in issues:
+        if COMPLEXITY_ORDER.index(issue.complexity) > COMPLEXITY_ORDER.index(complexity):
+            complexity = issue.complexity
+    return RegexAnalysis(parsed.pattern, complexity,
+                         degree if complexity == COMPLEXITY_POLYNOMIAL else None, issues)
+
+
+def analyze_regex(pattern):
+    """
+    Analiza un patrón en busca de retroceso catastrófico.
+
+    Args:
+        pattern (str): Expresión regular.
+
+    Returns:
+        RegexAnalysis: Complejidad ('lineal', 'polinómica' o 'exponencial'), grado
+            polinómico (o None) y lista de RegexIssue.
+
+    Raises:
+        ValueError: Si el patrón es inválido o usa construcciones no soportadas.
+    """
+    return analyze_parsed(parse_regex(pattern))
+
+
+def describe_analysis(analysis):
+    """
+    Resume un análisis en líneas de texto legibles.
+
+    Args:
+        analysis (RegexAnalysis): Resultado del análisis.
+
+    Returns:
+        list: Líneas de texto.
+    """
+    complexity = analysis.complexity
+    if analysis.degree:
+        complexity += f" (O(n^{analysis.degree}))"
+    lines = [f"Análisis estático de retroceso: complejidad {complexity}."]
+    lines.extend(f"- {issue.message}" for issue in analysis.issues)
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m core.regex_analyzer',
+        description="Detecta patrones con retroceso exponencial o polinómico."
+    )
+    parser.add_argument('patterns', nargs='+', help="Expresiones regulares a analizar")
+    args = parser.parse_args(argv)
+
+    status = 0
+    for pattern in args.patterns:
+        print(pattern)
+        try:
+            analysis = analyze_regex(pattern)
+        except ValueError as e:
+            print(f"  Error: {e}", file=sys.stderr)
+            status = max(status, 2)
+            continue
+        for line in describe_analysis(analysis):
+            print(f"  {line}")
+        if analysis.complexity != COMPLEXITY_LINEAR:
+            status = max(status, 1)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Máquina virtual de retroceso instrumentada para expresiones regulares.
+
+Ejecuta el mismo programa de Thompson que el motor lineal (ver
+core.regex_engine) pero con la estrategia de ``re``: prueba cada posición de
+inicio y, dentro de ella, sigue la rama preferida de cada bifurcación guardando
+la alternativa en una pila para volver a ella si la coincidencia falla.
+
+Cada ejecución cuenta los intentos (posiciones de inicio probadas), los pasos
+(instrucciones ejecutadas), los avances de posición y los retrocesos, y se
+detiene al superar un presupuesto de pasos configurable, de modo que un patrón
+con retroceso catastrófico termina con ``budget_exceeded`` en lugar de bloquear
+el proceso. Las cifras muestran al autor del patrón por qué es lento.
+"""
+from collections import namedtuple
+
+from core.regex_engine import (ASSERT, CHAR, JMP, MATCH, SAVE, SPLIT, Program, RegexMatch,
+                               _anchor_holds, position_flags)
+from core.regex_parser import class_matches, parse_regex
+
+DEFAULT_STEP_BUDGET = 200000
+
+# Métricas de un intento (una posición de inicio)
+AttemptStats = namedtuple('AttemptStats', ['start', 'steps', 'advances', 'backtracks', 'matched'])
+# Resultado de una búsqueda: la coincidencia (o None) y sus métricas
+BacktrackResult = namedtuple('BacktrackResult', [
+    'match', 'steps', 'attempts', 'advances', 'backtracks', 'max_stack', 'budget_exceeded',
+    'attempt_stats'
+])
+
+
+class _BudgetExceeded(Exception):
+    pass
+
+
+class BacktrackingVM:
+    """
+    Intérprete con retroceso del programa de un patrón.
+
+    Los bucles ``*``/``+`` registran la posición en que empezó su última
+    iteración; si una iteración vuelve al bucle sin haber avanzado, se sale de
+    él (como hace ``re``), lo que evita ciclos infinitos con cuerpos que pueden
+    coincidir con la cadena vacía.
+    """
+    def __init__(self, pattern, step_budget=DEFAULT_STEP_BUDGET):
+        """
+        Args:
+            pattern (str): Expresión regular del subconjunto soportado.
+            step_budget (int): Número máximo de instrucciones ejecutadas por búsqueda.
+
+        Raises:
+            ValueError: Si el patrón es inválido, no soportado o el presupuesto no es positivo.
+        """
+        if step_budget < 1:
+            raise ValueError("El presupuesto de pasos debe ser al menos 1")
+        self.pattern = pattern
+        self.step_budget = step_budget
+        self.parsed = parse_regex(pattern)
+        self.group_count = self.parsed.group_count
+        self.program = Program.from_parsed(self.parsed)
+        instructions = self.program.instructions
+        # Ranuras: 2 por grupo (incluido el 0), lastindex y la última posición de cada bucle
+        self._lastindex_slot = 2 * self.group_count + 2
+        loops = [pc for pc, instruction in enumerate(instructions) if len(instruction) == 4]
+        self._loop_slots = {pc: self._lastindex_slot + 1 + k for k, pc in enumerate(loops)}
+        self._initial = (-1,) * self._lastindex_slot + (None,) + (-1,) * len(loops)
+
+    def _attempt(self, text, start, length, counters):
+        """
+        Ejecuta un intento anclado en ``start``.
+
+        Returns:
+            tuple: Ranuras de la coincidencia o None si el intento falla.
+
+        Raises:
+            _BudgetExceeded: Si se supera el presupuesto de pasos.
+        """
+        instructions = self.program.instructions
+        loop_slots = self._loop_slots
+        budget = self.step_budget
+        steps, advances, backtracks, max_stack = counters['steps'], 0, 0, counters['max_stack']
+        stack = [(self.program.start, start, self._initial)]
+        try:
+            while stack:
+                pc, position, slots = stack.pop()
+                while True:
+                    steps += 1
+                    if steps > budget:
+                        raise _BudgetExceeded()
+                    instruction = instructions[pc]
+                    op = instruction[0]
+                    if op == CHAR:
+                        if position < length and class_matches(instruction[1], text[position]):
+                            position += 1
+                            advances += 1
+                            pc = instruction[2]
+                            continue
+                        break
+                    if op == SPLIT:
+                        slot = loop_slots.get(pc)
+                        if slot is not None:
+                            if slots[slot] == position:
+                                # Iteración vacía: se sale del bucle
+                                pc = instruction[3]
+                                continue
+                            slots = slots[:slot] + (position,) + slots[slot + 1:]
+                        stack.append((instruction[2], position, slots))
+                        if len(stack) > max_stack:
+                            max_stack = len(stack)
+                        pc = instruction[1]
+                    elif op == JMP:
+                        pc = instruction[1]
+                    elif op == SAVE:
+                        slot = instruction[1]
+                        slots = slots[:slot] + (position,) + slots[slot + 1:]
+                        if slot % 2:
+                            last = self._lastindex_slot
+                            slots = slots[:last] + (slot // 2,) + slots[last + 1:]
+                        pc = instruction[2]
+                    elif op == ASSERT:
+                        if not _anchor_holds(instruction[1], position_flags(text, position, length)):
+                            break
+                        pc = instruction[2]
+                    elif op == MATCH:
+                        return slots[:self._lastindex_slot] + (slots[self._lastindex_slot], position)
+                if stack:
+                    backtracks += 1
+            return None
+        finally:
+            counters['attempt'] = (steps - counters['steps'], advances, backtracks)
+            counters['steps'] = steps
+            counters['advances'] += advances
+            counters['backtracks'] += backtracks
+            counters['max_stack'] = max_stack
+
+    def search(self, text, pos=0):
+        """
+        Busca la primera coincidencia probando cada posición de inicio.
+
+        Args:
+            text (str): Texto en el que buscar.
+            pos (int): Posición desde la que empezar.
+
+        Returns:
+            BacktrackResult: Coincidencia (RegexMatch o None) y métricas de la búsqueda.
+        """
+        length = len(text)
+        counters = {'steps': 0, 'advances': 0, 'backtracks': 0, 'max_stack': 0, 'attempt': None}
+        attempt_stats = []
+        match = None
+        exceeded = False
+        for start in range(pos, length + 1):
+            try:
+                result = self._attempt(text, start, length, counters)
+            except _BudgetExceeded:
+                exceeded = True
+            steps, advances, backtracks = counters['attempt']
+            attempt_stats.append(AttemptStats(start, steps, advances, backtracks,
+                                              not exceeded and result is not None))
+            if exceeded:
+                break
+            if result is not None:
+                end = result[-1]
+                spans = [(start, end)]
+                for index in range(1, self.group_count + 1):
+                    group_start, group_end = result[2 * index], result[2 * index + 1]
+                    spans.append((group_start, group_end) if group_end >= 0 and group_start >= 0
+                                 else (-1, -1))
+                match = RegexMatch(text, spans, result[-2], self.parsed.group_names)
+                break
+        return BacktrackResult(match, counters['steps'], len(attempt_stats), counters['advances'],
+                               counters['backtracks'], counters['max_stack'], exceeded, attempt_stats)
@@ -0,0 +1,262 @@
+"""
+Conversión de expresiones regulares en AFD mínimos del simulador de autómatas.
+
+El patrón se analiza (ver core.regex_parser) y se compila al programa de
+Thompson del motor lineal (ver core.regex_engine). Cada instrucción pasa a ser un
+estado de un AFN-ε de core.automata: las instrucciones CHAR se convierten en
+transiciones con los símbolos del alfabeto que pertenecen a su clase y el resto
+(bifurcaciones, saltos, capturas) en transiciones ε. Después
+``Automata.determinize`` explora solo los subconjuntos alcanzables, con las
+ε-clausuras precalculadas, y ``Automata.minimize`` aplica Hopcroft; los estados
+del resultado se renombran q0, q1, ... en orden de recorrido.
+
+El autómata acepta exactamente las cadenas del alfabeto con las que el patrón
+coincide completo (como ``re.fullmatch``). Las anclas se respetan: cada estado del
+AFN-ε lleva además el contexto de posición (si aún no se consumió ningún
+carácter y si ya se exigió el final del texto), de modo que ``^``, ``\\A``, ``$`` y
+``\\Z`` funcionan en cualquier lugar del patrón.
+
+Uso desde la línea de comandos:
+    python -m core.regex_compile "(a|b)*abb" -o abb.json
+"""
+import argparse
+import string
+import sys
+from collections import deque
+
+from core.automata import Automata
+from core.file_handler import AutomataFileHandler
+from core.frozen_automata import EPSILON
+from core.regex_engine import ASSERT, CHAR, JMP, MATCH, SAVE, Program
+from core.regex_parser import (ANCHOR_BEGIN, ANCHOR_END, CharClass, class_matches, iter_nodes,
+                               parse_regex)
+
+# Alfabeto añadido al derivado del patrón cuando este usa clases abiertas
+# (negadas, '.', \d, \w, \s), que no tienen un conjunto finito de caracteres propio
+DEFAULT_ALPHABET = string.ascii_letters + string.digits + string.punctuation + ' \t\n'
+# Tamaño máximo del alfabeto, derivado o explícito
+MAX_ALPHABET_SIZE = 1024
+# Estados máximos de la determinización
+MAX_DFA_STATES = 10000
+
+# Restricción de final del texto de un estado del AFN-ε
+_FREE = 0         # Sin restricción
+_END_OR_EOL = 1   # Se cumplió '$': solo queda el final o un '\n' final
+_END = 2          # Se cumplió '\Z' (o '$' tras el '\n' final): ya no se consume nada
+
+
+def derive_alphabet(parsed):
+    """
+    Alfabeto mínimo para un patrón: los caracteres de sus clases finitas y, si
+    usa clases abiertas, los de ``DEFAULT_ALPHABET``.
+
+    Args:
+        parsed (ParsedRegex): Resultado de parse_regex.
+
+    Returns:
+        list: Símbolos ordenados.
+
+    Raises:
+        ValueError: Si el alfabeto resultante supera ``MAX_ALPHABET_SIZE``.
+    """
+    symbols = set()
+    for node in iter_nodes(parsed.root):
+        if not isinstance(node, CharClass):
+            continue
+        if node.negated:
+            symbols.update(DEFAULT_ALPHABET)
+        for item in node.items:
+            if isinstance(item, str):
+                symbols.update(DEFAULT_ALPHABET)
+                continue
+            if len(symbols) + item[1] - item[0] + 1 > MAX_ALPHABET_SIZE:
+                raise ValueError(f"El patrón usa más de {MAX_ALPHABET_SIZE} símbolos; "
+                                 f"indique un alfabeto explícito")
+            symbols.update(chr(code) for code in range(item[0], item[1] + 1))
+    return sorted(symbols)
+
+
+def _check_alphabet(alphabet):
+    symbols = sorted(set(alphabet))
+    for symbol in symbols:
+        if not isinstance(symbol, str) or len(symbol) != 1:
+            raise ValueError(f"Símbolo inválido en el alfabeto: {symbol!r} (debe ser un carácter)")
+    if len(symbols) > MAX_ALPHABET_SIZE:
+        raise ValueError(f"El alfabeto supera el máximo de {MAX_ALPHABET_SIZE} símbolos")
+    return symbols
+
+
+def program_to_nfa(program, alphabet):
+    """
+    Convierte un programa de Thompson en un AFN-ε.
+
+    Cada estado del AFN-ε es una instrucción junto con su contexto de posición:
+    si todavía se está al inicio del texto (para ``^``/``\\A``) y la restricción
+    de final impuesta por ``$``/``\\Z``. Solo se crean los estados alcanzables.
+
+    Args:
+        program (Program): Programa con ``start`` definido.
+        alphabet (list): Símbolos del autómata.
+
+    Returns:
+        Automata: AFN-ε equivalente (coincidencia completa).
+    """
+    instructions = program.instructions
+    class_symbols = {}
+
+    def symbols_of(char_class):
+        symbols = class_symbols.get(char_class)
+        if symbols is None:
+            symbols = [symbol for symbol in alphabet if class_matches(char_class, symbol)]
+            class_symbols[char_class] = symbols
+        return symbols
+
+    names = {}
+    worklist = deque()
+
+    def name_of(node):
+        name = names.get(node)
+        if name is None:
+            name = f"p{len(names)}"
+            names[node] = name
+            worklist.append(node)
+        return name
+
+    start = name_of((program.start, True, _FREE))
+    transitions = {}
+    final_states = []
+    while worklist:
+        node = worklist.popleft()
+        pc, at_begin, end = node
+        instruction = instructions[pc]
+        op = instruction[0]
+        trans = {}
+        if op == CHAR:
+            if end == _FREE:
+                symbols = symbols_of(instruction[1])
+                if symbols:
+                    dest = name_of((instruction[2], False, _FREE))
+                    for symbol in symbols:
+                        trans[symbol] = [dest]
+            elif end == _END_OR_EOL and class_matches(instruction[1], '\n') and '\n' in alphabet:
+                trans['\n'] = [name_of((instruction[2], False, _END))]
+        elif op == MATCH:
+            final_states.append(names[node])
+        elif op == ASSERT:
+            kind = instruction[1]
+            if kind == ANCHOR_BEGIN:
+                if at_begin:
+                    trans[EPSILON] = [name_of((instruction[2], at_begin, end))]
+            elif kind == ANCHOR_END:
+                trans[EPSILON] = [name_of((instruction[2], at_begin, end or _END_OR_EOL))]
+            else:
+                trans[EPSILON] = [name_of((instruction[2], at_begin, _END))]
+        else:
+            # SPLIT, JMP y SAVE no consumen entrada; las capturas no afectan al lenguaje
+            if op == JMP:
+                targets = (instruction[1],)
+            elif op == SAVE:
+                targets = (instruction[2],)
+            else:
+                targets = instruction[1:3]
+            trans[EPSILON] = [name_of((target, at_begin, end)) for target in targets]
+        transitions[names[node]] = trans
+
+    return Automata(
+        states=list(names.values()),
+        alphabet=list(alphabet),
+        transitions=transitions,
+        initial_state=start,
+        final_states=final_states
+    )
+
+
+def rename_states(automata, prefix='q'):
+    """
+    Renombra los estados como q0, q1, ... en orden de recorrido en anchura desde
+    el estado inicial (los símbolos se visitan en el orden del alfabeto).
+
+    Args:
+        automata (Automata): Autómata a renombrar.
+        prefix (str): Prefijo de los nombres nuevos.
+
+    Returns:
+        Automata: Nuevo autómata con los estados renombrados.
+    """
+    index = {automata.initial_state: f"{prefix}0"}
+    worklist = deque([automata.initial_state])
+    while worklist:
+        state = worklist.popleft()
+        trans = automata.transitions.get(state, {})
+        for symbol in automata.alphabet:
+            for dest_state in trans.get(symbol, ()):
+                if dest_state not in index:
+                    index[dest_state] = f"{prefix}{len(index)}"
+                    worklist.append(dest_state)
+    for state in automata.states:
+        if state not in index:
+            index[state] = f"{prefix}{len(index)}"
+
+    ordered = sorted(index, key=lambda state: int(index[state][len(prefix):]))
+    final_states = set(automata.final_states)
+    return Automata(
+        states=[index[state] for state in ordered],
+        alphabet=list(automata.alphabet),
+        transitions={index[state]: {symbol: [index[dest] for dest in dest_states]
+                                    for symbol, dest_states in automata.transitions.get(state, {}).items()}
+                     for state in ordered},
+        initial_state=index[automata.initial_state],
+        final_states=[index[state] for state in ordered if state in final_states]
+    )
+
+
+def regex_to_automata(pattern, alphabet=None, max_states=MAX_DFA_STATES):
+    """
+    Compila una expresión regular en el AFD mínimo de su lenguaje.
+
+    Args:
+        pattern (str): Expresión regular del subconjunto soportado.
+        alphabet (iterable): Símbolos (caracteres) del autómata; si es None se
+            deriva del patrón con derive_alphabet.
+        max_states (int): Límite de estados de la determinización.
+
+    Returns:
+        Automata: AFD mínimo con estados q0..qn, que acepta las cadenas del
+            alfabeto con las que el patrón coincide completo.
+
+    Raises:
+        ValueError: Si el patrón es inválido o no soportado, el alfabeto no es
+            válido o la determinización supera ``max_states``.
+    """
+    parsed = parse_regex(pattern)
+    alphabet = derive_alphabet(parsed) if alphabet is None else _check_alphabet(alphabet)
+    nfa = program_to_nfa(Program.from_parsed(parsed), alphabet)
+    dfa = nfa.determinize(max_states=max_states).minimize()
+    return rename_states(dfa)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m core.regex_compile',
+        description="Convierte una expresión regular en un AFD mínimo."
+    )
+    parser.add_argument('pattern', help="Expresión regular")
+    parser.add_argument('-a', '--alphabet', help="Símbolos del alfabeto (por defecto, derivados del patrón)")
+    parser.add_argument('-o', '--output', help="Archivo JSON en el que guardar el AFD")
+    args = parser.parse_args(argv)
+
+    try:
+        automata = regex_to_automata(args.pattern, args.alphabet)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    print(f"AFD mínimo de '{args.pattern}': {len(automata.states)} estados, "
+          f"{len(automata.alphabet)} símbolos, finales {automata.final_states}")
+    if args.output:
+        AutomataFileHandler.save_automata_to_file(automata, args.output, name=args.pattern)
+        print(f"Guardado en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
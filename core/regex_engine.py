@@ -0,0 +1,744 @@
+"""
+Motor de expresiones regulares de tiempo lineal: NFA de Thompson + AFD perezoso.
+
+El patrón (ver core.regex_parser) se compila a un programa de instrucciones al
+estilo de Thompson/Pike y la búsqueda se hace en tres pasadas, ninguna de las
+cuales retrocede sobre la entrada:
+
+1. Un AFD construido bajo demanda recorre el texto hacia adelante y encuentra
+   dónde termina la coincidencia. Sus estados son listas *ordenadas* de hilos del
+   NFA, de modo que reproducen la preferencia de ``re`` (primera alternativa,
+   cuantificadores codiciosos o perezosos): al aparecer un hilo de aceptación se
+   descartan los de menor prioridad.
+2. Un segundo AFD perezoso, sobre el programa invertido, recorre el texto hacia
+   atrás desde ese final y encuentra el inicio más a la izquierda.
+3. Solo si el patrón tiene grupos de captura, una máquina de Pike recorre el
+   tramo de la coincidencia para obtener las posiciones de cada grupo.
+
+Cada paso del AFD cuesta una búsqueda en un diccionario una vez calculada la
+transición, y calcular una transición cuesta O(m) en el tamaño del programa, por
+lo que el peor caso es O(n·m) y patrones como ``(a+)+b`` no pueden bloquear el
+proceso. La caché de estados está acotada: al llenarse se vacía y se reconstruye
+bajo demanda.
+
+Diferencia conocida con ``re``: en bucles cuyo cuerpo puede coincidir con la
+cadena vacía (p. ej. ``((a)?)*``) las reglas de ``re`` para iteraciones vacías
+dependen de su retroceso, y la coincidencia o los grupos pueden diferir.
+"""
+from core.regex_parser import (ANCHOR_BEGIN, ANCHOR_END, Alternation, Anchor, CharClass, Concat,
+                               Empty, Group, Repeat, class_matches, parse_regex)
+
+# --- Instrucciones del programa ---
+# (CHAR, clase, siguiente) consume un carácter de la clase
+CHAR = 0
+# (SPLIT, preferida, alternativa) bifurca el hilo; la primera rama tiene prioridad.
+# Los bucles de ``*``/``+`` añaden un cuarto campo con su salida: si la clausura
+# vuelve al bucle sin haber consumido entrada, la iteración fue vacía y, como en
+# ``re``, se sale del bucle en lugar de descartar el hilo
+SPLIT = 1
+# (JMP, destino)
+JMP = 2
+# (SAVE, ranura, siguiente) guarda la posición actual en una ranura de captura
+SAVE = 3
+# (ASSERT, tipo de ancla, siguiente) continúa solo si el ancla se cumple aquí
+ASSERT = 4
+# (MATCH, etiqueta) acepta; la etiqueta identifica el patrón en un conjunto
+MATCH = 5
+
+# Banderas de contexto de una posición del texto, usadas por las anclas
+AT_BEGIN = 1
+AT_END = 2
+AT_END_OR_NEWLINE = 4
+# Banderas con las que toda ancla se cumple (cotas conservadoras)
+ANY_POSITION = AT_BEGIN | AT_END | AT_END_OR_NEWLINE
+
+# Clase que coincide con cualquier carácter, incluido el salto de línea
+ANY_CHAR = CharClass(True, ())
+
+# Tamaño máximo del programa compilado (las repeticiones acotadas se copian)
+MAX_PROGRAM_SIZE = 50000
+
+DEAD_STATE = 0
+
+
+def position_flags(text, position, length):
+    """
+    Banderas de contexto de una posición: inicio del texto, final del texto o
+    final antes de un salto de línea final (donde ``$`` también se cumple en ``re``).
+
+    Args:
+        text (str): Texto completo.
+        position (int): Posición entre caracteres (0..length).
+        length (int): Longitud del texto.
+
+    Returns:
+        int: Combinación de AT_BEGIN, AT_END y AT_END_OR_NEWLINE.
+    """
+    flags = AT_BEGIN if position == 0 else 0
+    if position == length:
+        flags |= AT_END | AT_END_OR_NEWLINE
+    elif position == length - 1 and text[position] == '\n':
+        flags |= AT_END_OR_NEWLINE
+    return flags
+
+
+def _anchor_holds(kind, flags):
+    if kind == ANCHOR_BEGIN:
+        return flags & AT_BEGIN
+    if kind == ANCHOR_END:
+        return flags & AT_END_OR_NEWLINE
+    return flags & AT_END
+
+
+class Program:
+    """
+    Programa de instrucciones del NFA de Thompson.
+
+    Atributos:
+        instructions: Lista de tuplas de instrucción
+        start: Índice de la primera instrucción del patrón anclado
+        search_start: Índice de entrada de la búsqueda no anclada, que antepone
+            un bucle ``.*?`` de mínima prioridad (None si no se pidió)
+    """
+    def __init__(self):
+        self.instructions = []
+        self.start = None
+        self.search_start = None
+
+    def emit(self, instruction):
+        if len(self.instructions) >= MAX_PROGRAM_SIZE:
+            raise ValueError(f"El patrón genera un autómata demasiado grande (más de "
+                             f"{MAX_PROGRAM_SIZE} instrucciones)")
+        self.instructions.append(instruction)
+        return len(self.instructions) - 1
+
+    def compile_node(self, node, next_pc, reverse=False):
+        """
+        Emite las instrucciones de un nodo del AST que continúan en ``next_pc``.
+
+        Args:
+            node: Nodo del AST.
+            next_pc (int): Instrucción a la que se salta tras el nodo.
+            reverse (bool): Si es True, compila el lenguaje invertido.
+
+        Returns:
+            int: Índice de la primera instrucción del nodo.
+        """
+        if isinstance(node, Empty):
+            return next_pc
+        if isinstance(node, CharClass):
+            return self.emit((CHAR, node, next_pc))
+        if isinstance(node, Anchor):
+            return self.emit((ASSERT, node.kind, next_pc))
+        if isinstance(node, Concat):
+            pc = next_pc
+            for item in (node.items if reverse else reversed(node.items)):
+                pc = self.compile_node(item, pc, reverse)
+            return pc
+        if isinstance(node, Alternation):
+            starts = [self.compile_node(option, next_pc, reverse) for option in node.options]
+            pc = starts[-1]
+            for start in reversed(starts[:-1]):
+                pc = self.emit((SPLIT, start, pc))
+            return pc
+        if isinstance(node, Group):
+            open_slot, close_slot = 2 * node.index, 2 * node.index + 1
+            if reverse:
+                open_slot, close_slot = close_slot, open_slot
+            pc = self.emit((SAVE, close_slot, next_pc))
+            pc = self.compile_node(node.node, pc, reverse)
+            return self.emit((SAVE, open_slot, pc))
+        if isinstance(node, Repeat):
+            return self._compile_repeat(node, next_pc, reverse)
+        raise ValueError(f"Nodo de expresión regular desconocido: {node!r}")
+
+    def _split(self, body, skip, greedy, loop_exit=None):
+        split = (SPLIT, body, skip) if greedy else (SPLIT, skip, body)
+        return split if loop_exit is None else split + (loop_exit,)
+
+    def _compile_repeat(self, node, next_pc, reverse):
+        pc = next_pc
+        if node.max is None:
+            # Bucle: SPLIT(cuerpo, salida) con el cuerpo volviendo al SPLIT
+            loop = self.emit(None)
+            body = self.compile_node(node.node, loop, reverse)
+            self.instructions[loop] = self._split(body, next_pc, node.greedy, loop_exit=next_pc)
+            pc = loop
+        else:
+            # Copias opcionales anidadas: (x(x(x)?)?)?
+            for _ in range(node.max - node.min):
+                body = self.compile_node(node.node, pc, reverse)
+                pc = self.emit(self._split(body, pc, node.greedy))
+        for _ in range(node.min):
+            pc = self.compile_node(node.node, pc, reverse)
+        return pc
+
+    def add_pattern(self, root, tag=0, reverse=False):
+        """
+        Compila un AST completo terminado en MATCH(tag).
+
+        Returns:
+            int: Índice de la primera instrucción del patrón.
+        """
+        match_pc = self.emit((MATCH, tag))
+        return self.compile_node(root, match_pc, reverse)
+
+    def add_search_loop(self, start):
+        """Antepone el bucle ``.*?`` de mínima prioridad para buscar en cualquier posición"""
+        loop = self.emit(None)
+        any_char = self.emit((CHAR, ANY_CHAR, loop))
+        self.instructions[loop] = (SPLIT, start, any_char)
+        return loop
+
+    @classmethod
+    def from_parsed(cls, parsed, reverse=False, search=False):
+        """
+        Compila un patrón analizado.
+
+        Args:
+            parsed (ParsedRegex): Resultado de parse_regex.
+            reverse (bool): Compila el lenguaje invertido (para buscar inicios hacia atrás).
+            search (bool): Añade el bucle de búsqueda no anclada.
+
+        Returns:
+            Program: Programa compilado.
+        """
+        program = cls()
+        program.start = program.add_pattern(parsed.root, reverse=reverse)
+        if search:
+            program.search_start = program.add_search_loop(program.start)
+        return program
+
+
+class LazyRegexDFA:
+    """
+    AFD construido bajo demanda sobre un programa de Thompson.
+
+    Cada estado es una tupla de índices de instrucciones CHAR/MATCH (los hilos
+    vivos tras la ε-clausura). Con ``longest=False`` la tupla conserva el orden de
+    prioridad y se corta tras el primer MATCH (semántica de ``re``); con
+    ``longest=True`` se ordena y no se corta (coincidencia más larga, usada en la
+    pasada inversa y en los conjuntos de patrones).
+    """
+    def __init__(self, program, start_pc, longest=False, cache_size=10000):
+        """
+        Args:
+            program (Program): Programa compilado.
+            start_pc (int): Instrucción inicial.
+            longest (bool): Semántica de coincidencia más larga en vez de prioridad.
+            cache_size (int): Número máximo de estados memorizados.
+        """
+        if cache_size < 2:
+            raise ValueError("El tamaño de la caché debe ser al menos 2")
+        self.instructions = program.instructions
+        self.start_pc = start_pc
+        self.longest = longest
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self.resets = 0
+        # Estructuras de la caché; se vacían en el sitio para que las referencias
+        # locales de los bucles de búsqueda sigan siendo válidas
+        self.states = []
+        self.state_ids = {}
+        self.transitions = []
+        self.matches = []
+        self._flagged = {}
+        self._starts = {}
+        self._reset_cache()
+
+    def _reset_cache(self):
+        self.states.clear()
+        self.state_ids.clear()
+        self.transitions.clear()
+        self.matches.clear()
+        self._flagged.clear()
+        self._starts.clear()
+        self._intern(())
+
+    def _intern(self, threads):
+        key = tuple(sorted(threads)) if self.longest else tuple(threads)
+        state = self.state_ids.get(key)
+        if state is None:
+            if len(self.states) >= self.cache_size:
+                self.resets += 1
+                self._reset_cache()
+            state = len(self.states)
+            self.state_ids[key] = state
+            self.states.append(key)
+            self.transitions.append({})
+            instructions = self.instructions
+            self.matches.append(frozenset(instructions[pc][1] for pc in key
+                                          if instructions[pc][0] == MATCH))
+        return state
+
+    def _closure(self, pc, flags, threads, seen, skip_match=False):
+        """
+        Añade a ``threads`` los hilos alcanzables desde ``pc`` sin consumir
+        entrada, en orden de prioridad. Con ``skip_match`` los MATCH se
+        descartan (prohíbe la coincidencia vacía en esa posición).
+
+        Returns:
+            bool: True si se alcanzó un MATCH con semántica de prioridad (los
+                hilos siguientes quedan descartados).
+        """
+        instructions = self.instructions
+        stack = [pc]
+        while stack:
+            pc = stack.pop()
+            instruction = instructions[pc]
+            # Las capturas no influyen en la coincidencia: un SAVE se atraviesa sin
+            # marcarlo, de modo que la prioridad y la salida de los bucles son las
+            # mismas que las del patrón sin grupos
+            while instruction[0] == SAVE:
+                pc = instruction[2]
+                instruction = instructions[pc]
+            if pc in seen:
+                if len(instruction) == 4:
+                    stack.append(instruction[3])
+                continue
+            seen.add(pc)
+            op = instruction[0]
+            if op == SPLIT:
+                stack.append(instruction[2])
+                stack.append(instruction[1])
+            elif op == JMP:
+                stack.append(instruction[1])
+            elif op == ASSERT:
+                if _anchor_holds(instruction[1], flags):
+                    stack.append(instruction[2])
+            else:
+                if op == MATCH and skip_match:
+                    continue
+                threads.append(pc)
+                if op == MATCH and not self.longest:
+                    return True
+        return False
+
+    def start(self, flags, skip_match=False):
+        """
+        Estado inicial para una posición con las banderas de contexto dadas.
+
+        Args:
+            flags (int): Banderas de contexto de la posición.
+            skip_match (bool): Si es True, no se admite coincidencia vacía en la posición.
+
+        Returns:
+            int: Identificador del estado.
+        """
+        key = (flags, skip_match)
+        state = self._starts.get(key)
+        if state is None:
+            threads = []
+            self._closure(self.start_pc, flags, threads, set(), skip_match)
+            state = self._intern(threads)
+            self._starts[key] = state
+        return state
+
+    def step(self, state, char, flags=0):
+        """
+        Transición de un estado con un carácter; ``flags`` describe la posición
+        que queda tras consumirlo.
+
+        Returns:
+            int: Identificador del estado siguiente (DEAD_STATE si no hay hilos).
+        """
+        if flags:
+            key = (state, char, flags)
+            result = self._flagged.get(key)
+        else:
+            result = self.transitions[state].get(char)
+        if result is not None:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        instructions = self.instructions
+        threads = []
+        seen = set()
+        for pc in self.states[state]:
+            instruction = instructions[pc]
+            if instruction[0] == MATCH:
+                if not self.longest:
+                    break
+                continue
+            if class_matches(instruction[1], char):
+                if self._closure(instruction[2], flags, threads, seen):
+                    break
+        resets = self.resets
+        result = self._intern(threads)
+        if self.resets == resets:
+            if flags:
+                self._flagged[(state, char, flags)] = result
+            else:
+                self.transitions[state][char] = result
+        return result
+
+    def cache_info(self):
+        """
+        Estadísticas de la caché.
+
+        Returns:
+            dict: 'hits', 'misses', 'states', 'max_states' y 'resets'.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'states': len(self.states),
+            'max_states': self.cache_size,
+            'resets': self.resets
+        }
+
+
+class RegexMatch:
+    """
+    Resultado de una búsqueda, con la misma interfaz básica que ``re.Match``.
+    """
+    def __init__(self, string, spans, lastindex=None, group_names=None):
+        """
+        Args:
+            string (str): Texto en el que se buscó.
+            spans (list): (inicio, fin) por grupo, con (-1, -1) si no participó.
+            lastindex (int): Índice del último grupo cerrado o None.
+            group_names (dict): Nombre de grupo -> índice.
+        """
+        self.string = string
+        self._spans = spans
+        self.lastindex = lastindex
+        self.group_names = group_names or {}
+
+    def _index(self, group):
+        index = self.group_names.get(group, group)
+        if not isinstance(index, int) or not 0 <= index < len(self._spans):
+            raise IndexError("no such group")
+        return index
+
+    def span(self, group=0):
+        return self._spans[self._index(group)]
+
+    def start(self, group=0):
+        return self.span(group)[0]
+
+    def end(self, group=0):
+        return self.span(group)[1]
+
+    def group(self, *groups):
+        if len(groups) > 1:
+            return tuple(self.group(group) for group in groups)
+        start, end = self.span(groups[0] if groups else 0)
+        return self.string[start:end] if start >= 0 else None
+
+    def groups(self, default=None):
+        return tuple(self.group(i) if self._spans[i][0] >= 0 else default
+                     for i in range(1, len(self._spans)))
+
+    def groupdict(self, default=None):
+        return {name: (self.group(index) if self._spans[index][0] >= 0 else default)
+                for name, index in self.group_names.items()}
+
+    def __getitem__(self, group):
+        return self.group(group)
+
+    def __repr__(self):
+        return f"<RegexMatch span={self.span()!r}, match={self.group()!r}>"
+
+
+class RegexEngine:
+    """
+    Expresión regular compilada para el motor de tiempo lineal.
+    """
+    def __init__(self, pattern, cache_size=10000):
+        """
+        Args:
+            pattern (str): Expresión regular del subconjunto soportado.
+            cache_size (int): Estados memorizados por cada AFD perezoso.
+
+        Raises:
+            ValueError: Si el patrón es inválido o usa construcciones no soportadas.
+        """
+        self.pattern = pattern
+        self.parsed = parse_regex(pattern)
+        self.group_count = self.parsed.group_count
+        self.group_names = self.parsed.group_names
+        self.program = Program.from_parsed(self.parsed, search=True)
+        self.reverse_program = Program.from_parsed(self.parsed, reverse=True)
+        self.forward_dfa = LazyRegexDFA(self.program, self.program.search_start, cache_size=cache_size)
+        self.reverse_dfa = LazyRegexDFA(self.reverse_program, self.reverse_program.start,
+                                        longest=True, cache_size=cache_size)
+        self.cache_size = cache_size
+        self._viable_dfa = None
+
+    def _find_end(self, text, pos, length, allow_empty=True):
+        """
+        Pasada hacia adelante.
+
+        Returns:
+            tuple: (final de la coincidencia o -1, posición en la que se detuvo la pasada)
+        """
+        dfa = self.forward_dfa
+        transitions = dfa.transitions
+        matches = dfa.matches
+        state = dfa.start(position_flags(text, pos, length), not allow_empty)
+        last_end = pos if matches[state] else -1
+        plain_limit = length - 2
+        i = pos
+        for i in range(pos, length):
+            char = text[i]
+            if i < plain_limit:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = dfa.step(state, char)
+                else:
+                    dfa.hits += 1
+            else:
+                next_state = dfa.step(state, char, position_flags(text, i + 1, length))
+            state = next_state
+            if state == DEAD_STATE:
+                break
+            if matches[state]:
+                last_end = i + 1
+        else:
+            i = length
+        return last_end, i
+
+    def _find_start(self, text, pos, end, length):
+        """Pasada hacia atrás desde ``end``: inicio más a la izquierda de la coincidencia"""
+        dfa = self.reverse_dfa
+        transitions = dfa.transitions
+        matches = dfa.matches
+        state = dfa.start(position_flags(text, end, length))
+        best = end if matches[state] else -1
+        plain_limit = length - 1
+        for i in range(end - 1, pos - 1, -1):
+            char = text[i]
+            if 0 < i < plain_limit:
+                next_state = transitions[state].get(char)
+                if next_state is None:
+                    next_state = dfa.step(state, char)
+                else:
+                    dfa.hits += 1
+            else:
+                next_state = dfa.step(state, char, position_flags(text, i, length))
+            state = next_state
+            if state == DEAD_STATE:
+                break
+            if matches[state]:
+                best = i
+        return best
+
+    def _viable_start_dfa(self):
+        """
+        AFD perezoso de los prefijos invertidos del patrón: el programa invertido
+        con una entrada que salta a cualquiera de sus instrucciones CHAR/MATCH.
+        Se construye la primera vez que se necesita.
+        """
+        if self._viable_dfa is None:
+            program = Program.from_parsed(self.parsed, reverse=True)
+            entries = [pc for pc, instruction in enumerate(program.instructions)
+                       if instruction[0] in (CHAR, MATCH)]
+            entry = entries[-1]
+            for pc in reversed(entries[:-1]):
+                entry = program.emit((SPLIT, pc, entry))
+            self._viable_dfa = LazyRegexDFA(program, entry, longest=True, cache_size=self.cache_size)
+        return self._viable_dfa
+
+    def earliest_viable_start(self, text, pos, end):
+        """
+        Menor posición ``s >= pos`` tal que ``text[s:end]`` puede ser el comienzo
+        de una coincidencia que siga más allá de ``end``. Las anclas se dan por
+        cumplidas, así que la cota es conservadora: ninguna posición posterior a
+        la devuelta puede iniciar una coincidencia que empiece antes.
+
+        Args:
+            text (str): Texto.
+            pos (int): Primera posición candidata.
+            end (int): Posición hasta la que se conoce el texto.
+
+        Returns:
+            int: La posición (``end`` si ningún prefijo sigue vivo).
+        """
+        dfa = self._viable_start_dfa()
+        matches = dfa.matches
+        state = dfa.start(ANY_POSITION)
+        best = end
+        for i in range(end - 1, pos - 1, -1):
+            state = dfa.step(state, text[i], ANY_POSITION)
+            if state == DEAD_STATE:
+                break
+            if matches[state]:
+                best = i
+        return best
+
+    def _add_thread(self, threads, seen, pc, captures, position, flags):
+        """
+        ε-clausura de la máquina de Pike, propagando las capturas de cada hilo.
+
+        Un camino que vuelve a una instrucción ya visitada en esta posición (una
+        iteración vacía de un bucle) no se descarta: sigue una vez más en modo de
+        salida, en el que los bucles ya visitados solo pueden salir. Así la
+        iteración vacía cuenta, como en ``re``, y sus capturas pasan al resto del
+        patrón. Cada instrucción se visita a lo sumo dos veces (claves ``pc`` y
+        ``~pc`` en ``seen``).
+        """
+        instructions = self.program.instructions
+        stack = [(pc, captures, False)]
+        while stack:
+            pc, captures, exiting = stack.pop()
+            instruction = instructions[pc]
+            if instruction[0] == SAVE:
+                # Los SAVE no se marcan como vistos (igual que en LazyRegexDFA._closure)
+                slot = instruction[1]
+                updated = list(captures)
+                updated[slot] = position
+                if slot % 2:
+                    # La última ranura registra el último grupo cerrado (lastindex)
+                    updated[-1] = slot // 2
+                stack.append((instruction[2], tuple(updated), exiting))
+                continue
+            key = ~pc if exiting else pc
+            if key in seen:
+                if not exiting:
+                    stack.append((pc, captures, True))
+                continue
+            seen.add(key)
+            op = instruction[0]
+            if op == SPLIT:
+                if exiting and len(instruction) == 4 and pc in seen:
+                    stack.append((instruction[3], captures, True))
+                    continue
+                stack.append((instruction[2], captures, exiting))
+                stack.append((instruction[1], captures, exiting))
+            elif op == JMP:
+                stack.append((instruction[1], captures, exiting))
+            elif op == ASSERT:
+                if _anchor_holds(instruction[1], flags):
+                    stack.append((instruction[2], captures, exiting))
+            elif not (exiting and pc in seen):
+                threads.append((pc, captures))
+
+    def _captures(self, text, start, end, length):
+        """
+        Máquina de Pike anclada en ``start``: posiciones de los grupos de captura
+        del hilo de mayor prioridad que termina exactamente en ``end`` (el final
+        ya decidido por los AFD).
+        """
+        instructions = self.program.instructions
+        initial = (-1,) * (2 * self.group_count + 2) + (None,)
+        threads = []
+        self._add_thread(threads, set(), self.program.start, initial, start,
+                         position_flags(text, start, length))
+        matched = None
+        position = start
+        while threads:
+            char = text[position] if position < end else None
+            next_threads = []
+            seen = set()
+            flags = position_flags(text, position + 1, length) if char is not None else 0
+            for pc, captures in threads:
+                instruction = instructions[pc]
+                if instruction[0] == MATCH:
+                    if position == end:
+                        matched = captures
+                        break
+                    continue
+                if char is not None and class_matches(instruction[1], char):
+                    self._add_thread(next_threads, seen, instruction[2], captures,
+                                     position + 1, flags)
+            threads = next_threads
+            position += 1
+        return matched
+
+    def search(self, text, pos=0):
+        """
+        Busca la primera coincidencia con la preferencia de ``re.search``.
+
+        Args:
+            text (str): Texto en el que buscar.
+            pos (int): Posición desde la que empezar.
+
+        Returns:
+            RegexMatch: La coincidencia, o None si no hay ninguna.
+        """
+        return self._search(text, pos, len(text))[0]
+
+    def _search(self, text, pos, length, allow_empty=True):
+        """
+        Busca la primera coincidencia desde ``pos``.
+
+        Args:
+            allow_empty (bool): Si es False, no se admite una coincidencia vacía en ``pos``.
+
+        Returns:
+            tuple: (RegexMatch o None, posición en la que se detuvo la pasada hacia adelante)
+        """
+        end, stop = self._find_end(text, pos, length, allow_empty)
+        if end < 0:
+            return None, stop
+        start = self._find_start(text, pos, end, length)
+        spans = [(start, end)]
+        lastindex = None
+        if self.group_count:
+            captures = self._captures(text, start, end, length)
+            for index in range(1, self.group_count + 1):
+                group_start, group_end = captures[2 * index], captures[2 * index + 1]
+                spans.append((group_start, group_end) if group_end >= 0 else (-1, -1))
+            lastindex = captures[-1]
+        return RegexMatch(text, spans, lastindex, self.group_names), stop
+
+    def finditer(self, text, pos=0):
+        """
+        Recorre las coincidencias no solapadas, como ``re.finditer``: tras una
+        coincidencia vacía, la siguiente no puede ser vacía en la misma posición.
+
+        Args:
+            text (str): Texto en el que buscar.
+            pos (int): Posición desde la que empezar.
+
+        Yields:
+            RegexMatch: Cada coincidencia, de izquierda a derecha.
+        """
+        length = len(text)
+        allow_empty = True
+        while pos <= length:
+            match = self._search(text, pos, length, allow_empty)[0]
+            if match is None:
+                return
+            yield match
+            start, pos = match.span()
+            allow_empty = pos != start
+
+    def is_match(self, text):
+        """
+        Indica si el patrón aparece en el texto, deteniéndose en la primera
+        posición donde se sabe que hay coincidencia (solo la pasada hacia adelante).
+        """
+        dfa = self.forward_dfa
+        length = len(text)
+        state = dfa.start(position_flags(text, 0, length))
+        if dfa.matches[state]:
+            return True
+        for i, char in enumerate(text):
+            state = dfa.step(state, char, position_flags(text, i + 1, length) if i >= length - 2 else 0)
+            if state == DEAD_STATE:
+                return False
+            if dfa.matches[state]:
+                return True
+        return False
+
+    def cache_info(self):
+        """Estadísticas de las cachés de los AFD hacia adelante e inverso"""
+        return {'forward': self.forward_dfa.cache_info(), 'reverse': self.reverse_dfa.cache_info()}
+
+
+def compile_regex(pattern, cache_size=10000):
+    """
+    Compila un patrón para el motor de tiempo lineal.
+
+    Args:
+        pattern (str): Expresión regular.
+        cache_size (int): Estados memorizados por cada AFD perezoso.
+
+    Returns:
+        RegexEngine: Patrón compilado.
+    """
+    return RegexEngine(pattern, cache_size)
@@ -1,22 +1,53 @@
 import re
 
+from core.regex_analyzer import COMPLEXITY_LINEAR, analyze_regex, describe_analysis, has_nullable_loop
+from core.regex_backtrack import DEFAULT_STEP_BUDGET, BacktrackingVM
+from core.regex_compile import regex_to_automata
+from core.regex_engine import RegexEngine
+from core.regex_stream import DEFAULT_CHUNK_SIZE, MatchIndex, find_all
+
+# Motores de coincidencia disponibles
+ENGINE_RE = 're'    # Módulo re de Python (retroceso; soporta toda su sintaxis)
+ENGINE_DFA = 'dfa'  # NFA de Thompson + AFD perezoso: tiempo lineal, subconjunto de la sintaxis
+ENGINE_AUTO = 'auto'  # 're' salvo que el análisis estático detecte retroceso catastrófico
+ENGINE_BACKTRACK = 'backtrack'  # VM de retroceso instrumentada con presupuesto de pasos
+ENGINES = (ENGINE_RE, ENGINE_DFA, ENGINE_AUTO, ENGINE_BACKTRACK)
+
+# Intentos (posiciones de inicio) detallados como máximo en la traza de validación
+MAX_TRACE_ATTEMPTS = 10
+
 class RegexSimulator:
     """
     Clase para simular y explicar patrones de expresiones regulares.
     Proporciona información sobre coincidencias completas, grupos capturados
     y una explicación componente a componente del patrón regex.
     """
-    def __init__(self, pattern: str, text: str):
+    def __init__(self, pattern: str, text: str, engine: str = ENGINE_RE,
+                 step_budget: int = DEFAULT_STEP_BUDGET):
         """
         Inicializa el simulador con un patrón regex y un texto de entrada.
 
         Args:
             pattern (str): La expresión regular a simular.
             text (str): El texto en el que buscar coincidencias.
+            engine (str): Motor de coincidencia: 're', 'dfa' o 'auto'. El motor 'dfa'
+                garantiza tiempo O(n·m) incluso con patrones como '(a+)+b'; 'auto'
+                usa 're' y solo desvía a 'dfa' los patrones que el análisis
+                estático clasifica como polinómicos o exponenciales. El motor
+                'backtrack' usa la VM de retroceso instrumentada.
+            step_budget (int): Pasos máximos de la VM de retroceso, que también mide
+                la traza de validación; al superarlos la búsqueda se detiene.
         """
+        if engine not in ENGINES:
+            raise ValueError(f"Motor inválido: '{engine}'. Use uno de {ENGINES}")
         self.pattern = pattern
         self.text = text
+        self.engine = engine
+        self.step_budget = step_budget
+        self.engine_used = None # Motor realmente usado en la última simulación
+        self.analysis = None # Resultado del análisis estático de retroceso (RegexAnalysis)
         self.match = None
+        self.backtrack_result = None # Métricas de la VM de retroceso (BacktrackResult)
         self.explanations = [] # Almacena las explicaciones paso a paso del regex (del patrón)
         self.validation_trace = [] # Almacena la traza de validación (del texto)
 
@@ -32,26 +63,117 @@ class RegexSimulator:
         """
         self.explanations = []
         self.validation_trace = []
+        self.backtrack_result = None
         try:
+            self.engine_used = self._select_engine()
             # Intentar encontrar la primera coincidencia del patrón en el texto
-            self.match = re.search(self.pattern, self.text)
+            engine = None
+            if self.engine_used == ENGINE_DFA:
+                engine = RegexEngine(self.pattern)
+                self.match = engine.search(self.text)
+            elif self.engine_used == ENGINE_BACKTRACK:
+                self.backtrack_result = BacktrackingVM(self.pattern, self.step_budget).search(self.text)
+                self.match = self.backtrack_result.match
+            else:
+                self.match = re.search(self.pattern, self.text)
             # Generar explicaciones del patrón regex. Esto se hace incluso si no hay coincidencia.
             self._generate_regex_explanations()
+            if self.analysis is not None and self.analysis.complexity != COMPLEXITY_LINEAR:
+                self.explanations.extend(describe_analysis(self.analysis))
+                if self.engine == ENGINE_AUTO:
+                    self.explanations.append(
+                        "Se usó el motor AFD de tiempo lineal para evitar el retroceso catastrófico."
+                    )
+            if engine is not None and has_nullable_loop(engine.parsed):
+                self.explanations.append(
+                    "El resultado proviene del motor AFD: en un bucle que admite la cadena vacía, "
+                    "'re' aplica reglas propias a las iteraciones vacías, así que la coincidencia "
+                    "y los grupos pueden diferir de los de 're'."
+                )
 
-            if self.match:
-                # Si hay una coincidencia, generar la traza de validación
-                self._generate_validation_trace()
-            else:
-                self.validation_trace.append("Paso 1: Se intentó buscar el patrón en el texto. No se encontró ninguna coincidencia.")
+            self._generate_validation_trace()
 
             return True
-        except re.error as e:
-            # Capturar errores si el patrón regex es inválido
+        except (re.error, ValueError) as e:
+            # Capturar errores si el patrón regex es inválido (o no soportado por el motor 'dfa')
             self.explanations.append(f"Error en el patrón de expresión regular: {e}")
             self.validation_trace.append(f"Error en el patrón de expresión regular: {e}. No se pudo realizar la validación.")
             self.match = None # Asegurarse de que no haya coincidencia si hay un error en el patrón
             return False
 
+    def _select_engine(self) -> str:
+        """
+        Analiza estáticamente el patrón antes de ejecutarlo y decide el motor.
+
+        Returns:
+            str: 're', 'dfa' o 'backtrack'.
+        """
+        try:
+            self.analysis = analyze_regex(self.pattern)
+        except ValueError:
+            # Fuera del subconjunto analizable: solo 're' puede ejecutarlo (o reportar el error)
+            self.analysis = None
+        if self.engine != ENGINE_AUTO:
+            return self.engine
+        if self.analysis is not None and self.analysis.complexity != COMPLEXITY_LINEAR:
+            return ENGINE_DFA
+        return ENGINE_RE
+
+    def find_all(self, source=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Recorre de forma perezosa todas las coincidencias no solapadas del patrón.
+
+        Args:
+            source: None para buscar en ``self.text``; si no, ruta de un archivo
+                (proyectado con mmap) u objeto con ``read``, leído por bloques.
+            chunk_size (int): Tamaño de cada bloque leído.
+
+        Yields:
+            tuple: (start, end, groups) de cada coincidencia.
+
+        Raises:
+            ValueError: Si se busca en un archivo o flujo con un patrón fuera del
+                subconjunto del motor de tiempo lineal.
+        """
+        if source is not None:
+            for match in find_all(self.pattern, source, chunk_size):
+                yield match.start, match.end, match.groups
+            return
+        try:
+            matches = RegexEngine(self.pattern).finditer(self.text)
+        except ValueError:
+            # Fuera del subconjunto soportado: solo 're' puede ejecutarlo (o reportar el error)
+            matches = re.finditer(self.pattern, self.text)
+        for match in matches:
+            yield match.start(), match.end(), match.groups()
+
+    def index_matches(self, source=None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> MatchIndex:
+        """
+        Indexa las posiciones de todas las coincidencias (ver find_all) sin
+        conservar los objetos de coincidencia.
+
+        Returns:
+            MatchIndex: Posiciones en arreglos array('q'); ``span(n)`` da la n-ésima.
+        """
+        return MatchIndex.from_matches(self.find_all(source, chunk_size))
+
+    def to_automata(self, alphabet=None):
+        """
+        Convierte el patrón en el AFD mínimo de su lenguaje (coincidencia completa),
+        listo para dibujarse con AutomataGraph, guardarse con AutomataFileHandler
+        o simularse con la tabla compilada de ``Automata.compile``.
+
+        Args:
+            alphabet (iterable): Símbolos del autómata; por defecto se derivan del patrón.
+
+        Returns:
+            Automata: AFD mínimo con estados q0..qn.
+
+        Raises:
+            ValueError: Si el patrón no pertenece al subconjunto soportado.
+        """
+        return regex_to_automata(self.pattern, alphabet)
+
     def get_full_match_info(self) -> dict:
         """
         Obtiene información sobre la coincidencia completa, si existe.
@@ -125,40 +247,95 @@ class RegexSimulator:
 
     def _generate_validation_trace(self):
         """
-        Genera una traza simplificada de cómo la expresión regular validó el texto,
-        enfocándose en la coincidencia completa y los grupos capturados.
+        Genera la traza de validación del texto con las métricas reales de la VM
+        de retroceso: intentos, pasos, avances de posición y retrocesos.
+        Si el patrón queda fuera del subconjunto que la VM ejecuta, genera una
+        traza simplificada basada solo en la coincidencia.
         """
         self.validation_trace.append("--- Traza de Validación del Texto ---")
-        if self.match:
-            full_match_string = self.match.group(0)
-            start_idx = self.match.start()
-            end_idx = self.match.end()
+        if self.backtrack_result is None and self.analysis is not None:
+            self.backtrack_result = BacktrackingVM(self.pattern, self.step_budget).search(self.text)
+        if self.backtrack_result is None:
+            self._generate_simple_trace()
+            return
 
+        result = self.backtrack_result
+        self.validation_trace.append(
+            f"Paso 1: Se inició la búsqueda del patrón '{self.pattern}' con retroceso "
+            f"(presupuesto: {self.step_budget} pasos)."
+        )
+        interrupted = result.attempt_stats[-1] if result.budget_exceeded else None
+        for stats in result.attempt_stats[:MAX_TRACE_ATTEMPTS]:
+            if stats is interrupted:
+                outcome = "interrumpido"
+            else:
+                outcome = "coincidencia" if stats.matched else "sin coincidencia"
             self.validation_trace.append(
-                f"Paso 1: Se inició la búsqueda del patrón '{self.pattern}' en la cadena de entrada."
+                f"  Intento en el índice {stats.start}: {stats.steps} pasos, {stats.advances} avances, "
+                f"{stats.backtracks} retrocesos ({outcome})."
             )
+        if result.attempts > MAX_TRACE_ATTEMPTS:
+            self.validation_trace.append(f"  ... y {result.attempts - MAX_TRACE_ATTEMPTS} intentos más.")
+        costliest = max(result.attempt_stats, key=lambda stats: stats.steps)
+        self.validation_trace.append(
+            f"Paso 2: Total: {result.attempts} intentos, {result.steps} pasos, {result.advances} avances "
+            f"y {result.backtracks} retrocesos (profundidad máxima de la pila: {result.max_stack}). "
+            f"El intento más costoso empezó en el índice {costliest.start} ({costliest.steps} pasos)."
+        )
+        if result.budget_exceeded:
             self.validation_trace.append(
-                f"Paso 2: Se encontró una coincidencia completa: '{full_match_string}' "
-                f"desde el índice {start_idx} hasta el {end_idx-1} (parte de la cadena: '{self.text[start_idx:end_idx]}')."
+                f"Paso 3: Se superó el presupuesto de {self.step_budget} pasos en el intento del índice "
+                f"{interrupted.start}; la búsqueda con retroceso se detuvo. "
+                f"El patrón provoca retroceso catastrófico con este texto."
             )
+        self._append_match_steps(3 if not result.budget_exceeded else 4)
+        self.validation_trace.append("Validación finalizada.")
 
-            # Iterar sobre los grupos capturados para detallar la validación
-            if self.match.lastindex:
-                for i in range(1, self.match.lastindex + 1):
-                    group_string = self.match.group(i)
-                    group_start = self.match.start(i)
-                    group_end = self.match.end(i)
-                    self.validation_trace.append(
-                        f"Paso {i+2}: El Grupo {i} del patrón coincidió con: '{group_string}' "
-                        f"desde el índice {group_start} hasta el {group_end-1}."
-                    )
-            else:
+    def _generate_simple_trace(self):
+        """
+        Genera una traza simplificada de cómo la expresión regular validó el texto,
+        enfocándose en la coincidencia completa y los grupos capturados.
+        """
+        self.validation_trace.append(
+            f"Paso 1: Se inició la búsqueda del patrón '{self.pattern}' en la cadena de entrada."
+        )
+        self._append_match_steps(2)
+        self.validation_trace.append("Validación finalizada.")
+
+    def _append_match_steps(self, step):
+        """
+        Añade a la traza la coincidencia completa y los grupos capturados.
+
+        Args:
+            step (int): Número del primer paso a añadir.
+        """
+        if not self.match:
+            self.validation_trace.append(
+                f"Paso {step}: No se encontró ninguna coincidencia del patrón en la cadena de entrada."
+            )
+            return
+        full_match_string = self.match.group(0)
+        start_idx = self.match.start()
+        end_idx = self.match.end()
+        self.validation_trace.append(
+            f"Paso {step}: Se encontró una coincidencia completa: '{full_match_string}' "
+            f"desde el índice {start_idx} hasta el {end_idx-1} (parte de la cadena: '{self.text[start_idx:end_idx]}')."
+        )
+
+        # Iterar sobre los grupos capturados para detallar la validación
+        if self.match.lastindex:
+            for i in range(1, self.match.lastindex + 1):
+                group_string = self.match.group(i)
+                group_start = self.match.start(i)
+                group_end = self.match.end(i)
                 self.validation_trace.append(
-                    "Paso 3: El patrón no contiene grupos de captura, o no se capturaron grupos en esta coincidencia."
+                    f"Paso {step + i}: El Grupo {i} del patrón coincidió con: '{group_string}' "
+                    f"desde el índice {group_start} hasta el {group_end-1}."
                 )
-            self.validation_trace.append("Validación finalizada.")
         else:
-            self.validation_trace.append("Paso 1: No se encontró ninguna coincidencia del patrón en la cadena de entrada.")
+            self.validation_trace.append(
+                f"Paso {step + 1}: El patrón no contiene grupos de captura, o no se capturaron grupos en esta coincidencia."
+            )
 
 
     def _parse_regex_components(self, pattern: str) -> list:
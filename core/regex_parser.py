@@ -0,0 +1,482 @@
+"""
+Analizador sintáctico del subconjunto de expresiones regulares soportado por los
+motores propios del simulador (ver core.regex_engine).
+
+El patrón se convierte en un árbol de sintaxis abstracta (AST) de tuplas con
+nombre, inmutables y hashables, de modo que los motores y los análisis pueden
+memorizar resultados por nodo.
+
+Subconjunto soportado (con la misma sintaxis que el módulo ``re``):
+    - Literales y escapes (``\\.``, ``\\n``, ``\\t``, ``\\xhh``, ``\\uhhhh``...)
+    - ``.`` (cualquier carácter excepto el salto de línea)
+    - Clases ``[...]`` y ``[^...]`` con rangos y ``\\d \\w \\s \\D \\W \\S``
+    - Grupos de captura ``(...)``, con nombre ``(?P<nombre>...)`` y sin captura ``(?:...)``
+    - Alternativa ``|``
+    - Cuantificadores ``* + ? {n} {n,} {,m} {n,m}`` y sus versiones perezosas (``*?``...)
+    - Anclas ``^ $ \\A \\Z``
+
+Las construcciones que no pueden resolverse con un autómata finito (referencias
+inversas, búsquedas hacia adelante/atrás) o que aún no se soportan (``\\b``,
+banderas en línea) producen un ValueError.
+"""
+from collections import namedtuple
+
+# --- Nodos del AST ---
+# Cadena vacía
+Empty = namedtuple('Empty', [])
+# Un carácter de una clase: ``items`` es una tupla ordenada de rangos (inicio, fin)
+# de puntos de código y de categorías ('d', 'w', 's'); ``negated`` invierte la clase
+CharClass = namedtuple('CharClass', ['negated', 'items'])
+Concat = namedtuple('Concat', ['items'])
+Alternation = namedtuple('Alternation', ['options'])
+# ``max`` es None para repeticiones sin límite; ``greedy`` es False en ``*?``, ``+?``...
+Repeat = namedtuple('Repeat', ['node', 'min', 'max', 'greedy'])
+# Grupo de captura número ``index`` (el grupo 0 es la coincidencia completa)
+Group = namedtuple('Group', ['node', 'index'])
+# Aserción de ancho cero: 'begin' (^, \A), 'end' ($) o 'end_abs' (\Z)
+Anchor = namedtuple('Anchor', ['kind'])
+
+# Resultado del análisis: raíz del AST, número de grupos y nombre -> índice
+ParsedRegex = namedtuple('ParsedRegex', ['pattern', 'root', 'group_count', 'group_names'])
+
+ANCHOR_BEGIN = 'begin'
+ANCHOR_END = 'end'
+ANCHOR_END_ABS = 'end_abs'
+
+# Número máximo de repeticiones aceptado en ``{n,m}``: cada repetición se copia
+# en el autómata, así que límites enormes lo harían crecer sin control
+MAX_REPEAT = 1000
+
+DOT = CharClass(True, ((ord('\n'), ord('\n')),))
+
+_CATEGORY_ESCAPES = {
+    'd': (False, 'd'), 'D': (True, 'd'),
+    'w': (False, 'w'), 'W': (True, 'w'),
+    's': (False, 's'), 'S': (True, 's'),
+}
+_CONTROL_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'f': '\f', 'v': '\v', 'a': '\a', '0': '\0'}
+
+
+def literal(char):
+    """
+    Clase de un único carácter.
+
+    Args:
+        char (str): Carácter literal.
+
+    Returns:
+        CharClass: Nodo que coincide solo con ``char``.
+    """
+    code = ord(char)
+    return CharClass(False, ((code, code),))
+
+
+def class_matches(char_class, char):
+    """
+    Indica si un carácter pertenece a una clase.
+
+    Las categorías siguen la semántica Unicode de ``re``: ``\\d`` son dígitos
+    decimales, ``\\w`` alfanuméricos o '_' y ``\\s`` espacios en blanco.
+
+    Args:
+        char_class (CharClass): Clase a evaluar.
+        char (str): Carácter de la entrada.
+
+    Returns:
+        bool: True si el carácter pertenece a la clase.
+    """
+    code = ord(char)
+    for item in char_class.items:
+        if item == 'd':
+            found = char.isdecimal()
+        elif item == 'w':
+            found = char.isalnum() or char == '_'
+        elif item == 's':
+            found = char.isspace()
+        else:
+            found = item[0] <= code <= item[1]
+        if found:
+            return not char_class.negated
+    return char_class.negated
+
+
+def _is_number(text):
+    return text.isascii() and text.isdigit()
+
+
+def _merge_items(ranges, categories):
+    """Ordena y fusiona los rangos solapados o contiguos de una clase"""
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return tuple(merged) + tuple(sorted(set(categories)))
+
+
+class _Parser:
+    """Analizador descendente recursivo; ``position`` apunta al siguiente carácter"""
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.position = 0
+        self.group_count = 0
+        self.group_names = {}
+
+    def error(self, message, position=None):
+        position = self.position if position is None else position
+        return ValueError(f"{message} (posición {position})")
+
+    def peek(self):
+        return self.pattern[self.position] if self.position < len(self.pattern) else None
+
+    def next(self):
+        char = self.peek()
+        if char is None:
+            raise self.error("Fin inesperado del patrón")
+        self.position += 1
+        return char
+
+    def parse(self):
+        root = self.parse_alternation()
+        if self.position < len(self.pattern):
+            # Solo un ')' sin pareja detiene la alternativa antes del final
+            raise self.error("Paréntesis de cierre sin apertura")
+        return root
+
+    def parse_alternation(self):
+        options = [self.parse_concat()]
+        while self.peek() == '|':
+            self.position += 1
+            options.append(self.parse_concat())
+        return options[0] if len(options) == 1 else Alternation(tuple(options))
+
+    def parse_concat(self):
+        items = []
+        while self.peek() is not None and self.peek() not in '|)':
+            atom = self.parse_atom()
+            items.append(self.parse_quantifiers(atom))
+        if not items:
+            return Empty()
+        return items[0] if len(items) == 1 else Concat(tuple(items))
+
+    def parse_quantifiers(self, atom):
+        quantified = False
+        while True:
+            start = self.position
+            bounds = self.parse_quantifier()
+            if bounds is None:
+                return atom
+            if quantified:
+                raise self.error("Repetición múltiple", start)
+            if isinstance(atom, Anchor):
+                raise self.error("Nada que repetir", start)
+            greedy = True
+            if self.peek() == '?':
+                self.position += 1
+                greedy = False
+            atom = Repeat(atom, bounds[0], bounds[1], greedy)
+            quantified = True
+
+    def parse_quantifier(self):
+        """Devuelve (mínimo, máximo) si hay un cuantificador en la posición actual"""
+        char = self.peek()
+        if char == '*':
+            self.position += 1
+            return 0, None
+        if char == '+':
+            self.position += 1
+            return 1, None
+        if char == '?':
+            self.position += 1
+            return 0, 1
+        if char != '{':
+            return None
+        # Como en ``re``, una llave que no forma un cuantificador válido es un literal
+        end = self.pattern.find('}', self.position)
+        if end == -1:
+            return None
+        content = self.pattern[self.position + 1:end]
+        low, comma, high = content.partition(',')
+        if not (_is_number(low) or (comma and not low)) or (high and not _is_number(high)):
+            return None
+        if not comma and not low:
+            return None
+        minimum = int(low) if low else 0
+        maximum = minimum if not comma else (int(high) if high else None)
+        if maximum is not None and maximum < minimum:
+            raise self.error("Mínimo mayor que el máximo en el cuantificador")
+        if max(minimum, maximum or 0) > MAX_REPEAT:
+            raise self.error(f"Repetición demasiado grande (máximo {MAX_REPEAT})")
+        self.position = end + 1
+        return minimum, maximum
+
+    def parse_atom(self):
+        start = self.position
+        char = self.next()
+        if char == '(':
+            return self.parse_group(start)
+        if char == '[':
+            return self.parse_class(start)
+        if char == '.':
+            return DOT
+        if char == '^':
+            return Anchor(ANCHOR_BEGIN)
+        if char == '$':
+            return Anchor(ANCHOR_END)
+        if char == '\\':
+            return self.parse_escape(in_class=False)
+        if char in '*+?':
+            raise self.error("Nada que repetir", start)
+        if char == '{' and self.parse_quantifier_at(start) is not None:
+            raise self.error("Nada que repetir", start)
+        return literal(char)
+
+    def parse_quantifier_at(self, position):
+        saved = self.position
+        self.position = position
+        try:
+            return self.parse_quantifier()
+        finally:
+            self.position = saved
+
+    def parse_group(self, start):
+        index = None
+        if self.peek() == '?':
+            self.position += 1
+            kind = self.next()
+            if kind == ':':
+                pass
+            elif kind == 'P' and self.peek() == '<':
+                self.position += 1
+                end = self.pattern.find('>', self.position)
+                name = self.pattern[self.position:end] if end != -1 else ''
+                if not name.isidentifier():
+                    raise self.error("Nombre de grupo inválido")
+                if name in self.group_names:
+                    raise self.error(f"Nombre de grupo repetido '{name}'")
+                self.position = end + 1
+                self.group_count += 1
+                index = self.group_count
+                self.group_names[name] = index
+            else:
+                raise self.error(f"Construcción '(?{kind}' no soportada por el motor", start)
+        else:
+            self.group_count += 1
+            index = self.group_count
+
+        node = self.parse_alternation()
+        if self.peek() != ')':
+            raise self.error("Paréntesis sin cerrar", start)
+        self.position += 1
+        return Group(node, index) if index is not None else node
+
+    def parse_escape(self, in_class):
+        start = self.position - 1
+        char = self.next()
+        if char in _CATEGORY_ESCAPES:
+            negated, category = _CATEGORY_ESCAPES[char]
+            return CharClass(negated, (category,))
+        if char in _CONTROL_ESCAPES and not (char == '0' and self.peek() is not None
+                                             and self.peek().isdigit()):
+            return literal(_CONTROL_ESCAPES[char])
+        if char in 'xuU':
+            digits = {'x': 2, 'u': 4, 'U': 8}[char]
+            code = self.pattern[self.position:self.position + digits]
+            if len(code) != digits or any(c not in '0123456789abcdefABCDEF' for c in code):
+                raise self.error(f"Escape '\\{char}' incompleto", start)
+            self.position += digits
+            return literal(chr(int(code, 16)))
+        if not in_class and char in 'AZ':
+            return Anchor(ANCHOR_BEGIN if char == 'A' else ANCHOR_END_ABS)
+        if char == 'b' and in_class:
+            return literal('\b')
+        if char.isdigit():
+            raise self.error("Las referencias inversas no son soportadas por el motor", start)
+        if char.isalnum():
+            raise self.error(f"Escape '\\{char}' no soportado por el motor", start)
+        return literal(char)
+
+    def parse_class(self, start):
+        negated = False
+        if self.peek() == '^':
+            negated = True
+            self.position += 1
+        ranges = []
+        categories = []
+        first = True
+        while True:
+            char = self.peek()
+            if char is None:
+                raise self.error("Conjunto de caracteres sin cerrar", start)
+            if char == ']' and not first:
+                self.position += 1
+                break
+            first = False
+            low = self.parse_class_member()
+            is_range = (self.peek() == '-' and self.position + 1 < len(self.pattern)
+                        and self.pattern[self.position + 1] != ']')
+            if isinstance(low, str):
+                if is_range:
+                    raise self.error("Rango de caracteres inválido")
+                categories.append(low)
+                continue
+            if is_range:
+                self.position += 1
+                high = self.parse_class_member()
+                if isinstance(high, str):
+                    raise self.error("Rango de caracteres inválido")
+                if high < low:
+                    raise self.error("Rango de caracteres invertido")
+                ranges.append((low, high))
+            else:
+                ranges.append((low, low))
+
+        if len(categories) == 1 and not ranges:
+            # Una sola categoría: se conserva su propia negación (p. ej. [\D] o [^\W])
+            category = categories[0]
+            return CharClass(negated != category.isupper(), (category.lower(),))
+        if any(category.swapcase() in categories for category in categories):
+            # Una categoría junto a su negación (p. ej. [\s\S]) cubre todos los caracteres
+            return CharClass(not negated, ())
+        if any(category.isupper() for category in categories):
+            raise self.error("Las categorías negadas dentro de un conjunto no son soportadas por el motor")
+        return CharClass(negated, _merge_items(ranges, categories))
+
+    def parse_class_member(self):
+        """Devuelve el punto de código de un miembro o la letra de una categoría"""
+        char = self.next()
+        if char != '\\':
+            return ord(char)
+        escape = self.parse_escape(in_class=True)
+        if escape.items[0] in ('d', 'w', 's'):
+            category = escape.items[0]
+            return category.upper() if escape.negated else category
+        return escape.items[0][0]
+
+
+def parse_regex(pattern):
+    """
+    Convierte un patrón en su AST.
+
+    Args:
+        pattern (str): Expresión regular.
+
+    Returns:
+        ParsedRegex: Patrón, raíz del AST, número de grupos de captura y mapeo
+            de nombres de grupo a su índice.
+
+    Raises:
+        ValueError: Si el patrón es inválido o usa construcciones no soportadas.
+    """
+    parser = _Parser(pattern)
+    root = parser.parse()
+    return ParsedRegex(pattern, root, parser.group_count, dict(parser.group_names))
+
+
+def iter_nodes(node):
+    """
+    Recorre un subárbol del AST en preorden.
+
+    Args:
+        node: Raíz del subárbol (por ejemplo, ``ParsedRegex.root``).
+
+    Yields:
+        El propio nodo y todos sus descendientes.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, (Group, Repeat)):
+            stack.append(node.node)
+        elif isinstance(node, Concat):
+            stack.extend(reversed(node.items))
+        elif isinstance(node, Alternation):
+            stack.extend(reversed(node.options))
+
+
+_SPECIAL_CHARS = set('.^$*+?{}[]()|\\')
+_CLASS_SPECIAL_CHARS = set(']\\^-[')
+_FORMAT_ESCAPES = {'\n': '\\n', '\t': '\\t', '\r': '\\r', '\f': '\\f', '\v': '\\v', '\a': '\\a', '\0': '\\0'}
+
+
+def _format_char(code, special):
+    char = chr(code)
+    if char in _FORMAT_ESCAPES:
+        return _FORMAT_ESCAPES[char]
+    if char in special:
+        return '\\' + char
+    if not char.isprintable():
+        return f'\\x{code:02x}' if code < 0x100 else f'\\U{code:08x}'
+    return char
+
+
+def _format_class(char_class):
+    items = char_class.items
+    if char_class == DOT:
+        return '.'
+    if not char_class.negated and len(items) == 1 and not isinstance(items[0], str) \
+            and items[0][0] == items[0][1]:
+        return _format_char(items[0][0], _SPECIAL_CHARS)
+    if len(items) == 1 and isinstance(items[0], str):
+        return '\\' + (items[0].upper() if char_class.negated else items[0])
+    if not items:
+        # Clase universal o vacía
+        return '[\\s\\S]' if char_class.negated else '[^\\s\\S]'
+    parts = []
+    for item in items:
+        if isinstance(item, str):
+            parts.append('\\' + item)
+        elif item[0] == item[1]:
+            parts.append(_format_char(item[0], _CLASS_SPECIAL_CHARS))
+        else:
+            parts.append(_format_char(item[0], _CLASS_SPECIAL_CHARS) + '-'
+                         + _format_char(item[1], _CLASS_SPECIAL_CHARS))
+    return '[' + ('^' if char_class.negated else '') + ''.join(parts) + ']'
+
+
+def format_node(node):
+    """
+    Convierte un nodo del AST de vuelta a sintaxis de expresión regular.
+
+    Los grupos con nombre se escriben como grupos numerados y la numeración de
+    los grupos se conserva solo si se formatea el patrón completo.
+
+    Args:
+        node: Nodo del AST.
+
+    Returns:
+        str: Fragmento de patrón equivalente.
+    """
+    if isinstance(node, Empty):
+        return ''
+    if isinstance(node, CharClass):
+        return _format_class(node)
+    if isinstance(node, Anchor):
+        return {ANCHOR_BEGIN: '^', ANCHOR_END: '$', ANCHOR_END_ABS: '\\Z'}[node.kind]
+    if isinstance(node, Group):
+        return '(' + format_node(node.node) + ')'
+    if isinstance(node, Alternation):
+        return '|'.join(format_node(option) for option in node.options)
+    if isinstance(node, Concat):
+        return ''.join('(?:' + format_node(item) + ')' if isinstance(item, Alternation)
+                       else format_node(item) for item in node.items)
+    if isinstance(node, Repeat):
+        body = format_node(node.node)
+        if isinstance(node.node, (Concat, Alternation, Repeat, Empty)):
+            body = '(?:' + body + ')'
+        if (node.min, node.max) == (0, None):
+            quantifier = '*'
+        elif (node.min, node.max) == (1, None):
+            quantifier = '+'
+        elif (node.min, node.max) == (0, 1):
+            quantifier = '?'
+        elif node.max is None:
+            quantifier = f'{{{node.min},}}'
+        elif node.min == node.max:
+            quantifier = f'{{{node.min}}}'
+        else:
+            quantifier = f'{{{node.min},{node.max}}}'
+        return body + quantifier + ('' if node.greedy else '?')
+    raise ValueError(f"Nodo de expresión regular desconocido: {node!r}")
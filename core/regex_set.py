@@ -0,0 +1,283 @@
+"""
+Búsqueda simultánea de un conjunto de expresiones regulares en una sola pasada.
+
+Los patrones que son literales puros (sin clases, cuantificadores ni anclas) se
+buscan con un autómata de Aho–Corasick. El resto se compila en un único programa
+de Thompson (ver core.regex_engine): cada patrón termina en su propio
+``MATCH(tag)`` con el índice del patrón y todos cuelgan de una bifurcación común
+precedida del bucle de búsqueda no anclada. Un AFD perezoso con semántica de
+coincidencia más larga conserva todos los hilos, así que cada estado sabe qué
+patrones acaban de coincidir.
+
+Ambos autómatas avanzan juntos sobre el texto, carácter a carácter, y la pasada
+se detiene en cuanto se conoce el primer final de todos los patrones. El inicio
+de cada coincidencia se obtiene después: para un literal, restando su longitud;
+para una expresión regular, recorriendo hacia atrás el AFD de su patrón invertido
+desde el final encontrado.
+"""
+from collections import deque, namedtuple
+
+from core.regex_engine import DEAD_STATE, SPLIT, LazyRegexDFA, Program, position_flags
+from core.regex_parser import CharClass, Concat, Group, parse_regex
+
+# Coincidencia de un patrón del conjunto: índice del patrón y posiciones [start, end)
+SetMatch = namedtuple('SetMatch', ['pattern', 'start', 'end'])
+
+
+def _literal_text(node):
+    """Texto de un nodo que es un literal puro no vacío, o None"""
+    while isinstance(node, Group):
+        node = node.node
+    if isinstance(node, CharClass):
+        if node.negated or len(node.items) != 1 or isinstance(node.items[0], str):
+            return None
+        low, high = node.items[0]
+        return chr(low) if low == high else None
+    if isinstance(node, Concat):
+        parts = [_literal_text(item) for item in node.items]
+        if not parts or None in parts:
+            return None
+        return ''.join(parts)
+    return None
+
+
+class AhoCorasick:
+    """
+    Autómata de Aho–Corasick para buscar varias palabras a la vez.
+
+    Los nodos del trie se numeran desde 0 (la raíz). Cada nodo guarda sus
+    transiciones en un diccionario, su enlace de fallo y las palabras que
+    terminan en él, incluidas las heredadas por los enlaces de fallo.
+    """
+    def __init__(self, keywords):
+        """
+        Args:
+            keywords (list): Pares (identificador, palabra) con palabras no vacías.
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+        for key, word in keywords:
+            node = 0
+            for char in word:
+                next_node = self.goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto)
+                    self.goto[node][char] = next_node
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                node = next_node
+            self.output[node] += ((key, len(word)),)
+
+        # Enlaces de fallo en anchura: el de un hijo es el destino del fallo del padre
+        worklist = deque(self.goto[0].values())
+        while worklist:
+            node = worklist.popleft()
+            for char, child in self.goto[node].items():
+                worklist.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.output[child] += self.output[self.fail[child]]
+
+    def step(self, node, char):
+        """
+        Transición del autómata.
+
+        Returns:
+            int: Nodo siguiente.
+        """
+        goto = self.goto
+        while node and char not in goto[node]:
+            node = self.fail[node]
+        return goto[node].get(char, 0)
+
+    def iter_matches(self, text):
+        """
+        Recorre todas las apariciones de las palabras, incluidas las solapadas.
+
+        Yields:
+            tuple: (identificador, inicio, fin) en orden de posición final.
+        """
+        node = 0
+        for i, char in enumerate(text):
+            node = self.step(node, char)
+            for key, size in self.output[node]:
+                yield key, i + 1 - size, i + 1
+
+
+class RegexSet:
+    """
+    Conjunto de expresiones regulares compiladas en un único autómata.
+
+    Para cada patrón presente, ``search`` informa de la coincidencia que termina
+    antes en el texto (con el inicio más a la izquierda entre las que terminan
+    ahí); puede diferir del ``span`` de ``re.search`` para ese patrón, que
+    prefiere el inicio más a la izquierda.
+    """
+    def __init__(self, patterns, cache_size=10000):
+        """
+        Args:
+            patterns (list): Expresiones regulares del subconjunto soportado; el
+                identificador de cada una es su índice en la lista.
+            cache_size (int): Estados memorizados por cada AFD perezoso.
+
+        Raises:
+            ValueError: Si algún patrón es inválido o usa construcciones no
+                soportadas (el mensaje indica su índice).
+        """
+        self.patterns = list(patterns)
+        self.cache_size = cache_size
+        self.parsed = []
+        for index, pattern in enumerate(self.patterns):
+            try:
+                self.parsed.append(parse_regex(pattern))
+            except ValueError as e:
+                raise ValueError(f"Patrón {index} ('{pattern}'): {e}") from None
+
+        literals = []
+        self.regex_ids = []
+        for index, parsed in enumerate(self.parsed):
+            text = _literal_text(parsed.root)
+            if text is not None:
+                literals.append((index, text))
+            else:
+                self.regex_ids.append(index)
+        self.literal_ids = [index for index, _ in literals]
+        self.literals = AhoCorasick(literals) if literals else None
+
+        self.dfa = None
+        if self.regex_ids:
+            program = Program()
+            starts = [program.add_pattern(self.parsed[index].root, tag=index)
+                      for index in self.regex_ids]
+            start = starts[-1]
+            for pattern_start in reversed(starts[:-1]):
+                start = program.emit((SPLIT, pattern_start, start))
+            program.start = start
+            program.search_start = program.add_search_loop(start)
+            self.dfa = LazyRegexDFA(program, program.search_start, longest=True, cache_size=cache_size)
+        self._reverse_dfas = {}
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def _reverse_dfa(self, index):
+        """AFD perezoso del patrón invertido, construido la primera vez que se necesita"""
+        dfa = self._reverse_dfas.get(index)
+        if dfa is None:
+            program = Program.from_parsed(self.parsed[index], reverse=True)
+            dfa = LazyRegexDFA(program, program.start, longest=True, cache_size=self.cache_size)
+            self._reverse_dfas[index] = dfa
+        return dfa
+
+    def _find_start(self, index, text, end, length):
+        """Pasada hacia atrás desde ``end``: inicio más a la izquierda de la coincidencia"""
+        dfa = self._reverse_dfa(index)
+        state = dfa.start(position_flags(text, end, length))
+        best = end if dfa.matches[state] else -1
+        for i in range(end - 1, -1, -1):
+            state = dfa.step(state, text[i], position_flags(text, i, length) if i in (0, length - 1) else 0)
+            if state == DEAD_STATE:
+                break
+            if dfa.matches[state]:
+                best = i
+        return best
+
+    def _first_ends(self, text, stop_on_first=False):
+        """
+        Pasada única hacia adelante.
+
+        Returns:
+            dict: {patrón: (inicio o None, fin)} con el primer final de cada
+                patrón presente; el inicio solo se conoce para los literales.
+        """
+        length = len(text)
+        found = {}
+        pending = len(self.patterns)
+        literals = self.literals
+        dfa = self.dfa
+        node = 0
+        if dfa is not None:
+            state = dfa.start(position_flags(text, 0, length))
+            for index in dfa.matches[state]:
+                found[index] = (None, 0)
+            pending -= len(found)
+        if pending and not (stop_on_first and found):
+            plain_limit = length - 2
+            goto = fail = output = transitions = matches = None
+            if literals is not None:
+                goto, fail, output = literals.goto, literals.fail, literals.output
+            if dfa is not None:
+                transitions, matches = dfa.transitions, dfa.matches
+            for i, char in enumerate(text):
+                if goto is not None:
+                    while node and char not in goto[node]:
+                        node = fail[node]
+                    node = goto[node].get(char, 0)
+                    for index, size in output[node]:
+                        if index not in found:
+                            found[index] = (i + 1 - size, i + 1)
+                            pending -= 1
+                if transitions is not None:
+                    next_state = transitions[state].get(char) if i < plain_limit else None
+                    if next_state is None:
+                        next_state = dfa.step(state, char, position_flags(text, i + 1, length)
+                                              if i >= plain_limit else 0)
+                    else:
+                        dfa.hits += 1
+                    state = next_state
+                    for index in matches[state]:
+                        if index not in found:
+                            found[index] = (None, i + 1)
+                            pending -= 1
+                if not pending or (stop_on_first and found):
+                    break
+        return found
+
+    def matches(self, text):
+        """
+        Patrones que aparecen en el texto.
+
+        Args:
+            text (str): Texto en el que buscar.
+
+        Returns:
+            list: Índices ordenados de los patrones con alguna coincidencia.
+        """
+        return sorted(self._first_ends(text))
+
+    def is_match(self, text):
+        """Indica si algún patrón aparece en el texto (se detiene en el primero)"""
+        return bool(self._first_ends(text, stop_on_first=True))
+
+    def search(self, text):
+        """
+        Busca todos los patrones en una sola pasada sobre el texto.
+
+        Args:
+            text (str): Texto en el que buscar.
+
+        Returns:
+            list: SetMatch(pattern, start, end) de cada patrón presente, ordenados
+                por índice de patrón.
+        """
+        length = len(text)
+        result = []
+        for index, (start, end) in sorted(self._first_ends(text).items()):
+            if start is None:
+                start = self._find_start(index, text, end, length)
+            result.append(SetMatch(index, start, end))
+        return result
+
+    def cache_info(self):
+        """Estadísticas del AFD de la unión y tamaño del autómata de literales"""
+        return {
+            'union': self.dfa.cache_info() if self.dfa is not None else None,
+            'literal_nodes': len(self.literals.goto) if self.literals is not None else 0,
+            'regex_patterns': len(self.regex_ids),
+            'literal_patterns': len(self.literal_ids)
+        }
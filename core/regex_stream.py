@@ -0,0 +1,257 @@
+"""
+Búsqueda de todas las coincidencias en archivos grandes o flujos por bloques.
+
+El texto se lee por bloques (de un archivo proyectado en memoria con mmap o de
+cualquier objeto con ``read``) y se decodifica de forma incremental, de modo que
+solo se mantiene en memoria una ventana del texto. Sobre la ventana se ejecuta
+el motor de tiempo lineal (ver core.regex_engine), que indica hasta dónde tuvo
+que mirar para decidir cada coincidencia:
+
+- Si la pasada terminó antes del final de la ventana, la coincidencia es
+  definitiva y se emite.
+- Si llegó al final (la coincidencia podría alargarse, o un ``$`` depende de lo
+  que venga después), se lee el bloque siguiente y se repite la búsqueda. Las
+  coincidencias que cruzan el límite entre bloques se encuentran así completas.
+
+Si aún no hay ninguna coincidencia, la ventana se recorta hasta el primer
+carácter que todavía puede iniciar una (ver
+``RegexEngine.earliest_viable_start``); el texto anterior ya no puede formar
+parte de ninguna coincidencia y se descarta. Cuando la ventana conservada es
+grande, se leen bloques hasta duplicarla antes de repetir la búsqueda, así que
+el trabajo total sigue siendo lineal en el tamaño del texto.
+
+Las posiciones son índices de carácter en el texto decodificado completo.
+``MatchIndex`` guarda las posiciones de todas las coincidencias en dos arreglos
+``array('q')`` (8 bytes por posición) en lugar de conservar los objetos de
+coincidencia.
+"""
+import codecs
+import mmap
+import os
+from array import array
+from collections import namedtuple
+
+from core.regex_engine import RegexEngine
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Coincidencia de la búsqueda por bloques: posiciones absolutas y textos de los grupos
+StreamMatch = namedtuple('StreamMatch', ['start', 'end', 'groups'])
+
+
+def iter_file_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Recorre un archivo proyectado en memoria, decodificándolo por bloques.
+
+    Args:
+        file_path (str): Ruta del archivo.
+        chunk_size (int): Bytes por bloque.
+        encoding (str): Codificación del archivo.
+
+    Yields:
+        str: Bloques de texto decodificado (un carácter multibyte partido entre
+            bloques se completa con el bloque siguiente).
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(file_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                for offset in range(0, size, chunk_size):
+                    chunk = decoder.decode(mapping[offset:offset + chunk_size])
+                    if chunk:
+                        yield chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def iter_stream_chunks(stream, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Recorre un flujo con método ``read`` (de texto o binario) por bloques.
+
+    Yields:
+        str: Bloques de texto.
+    """
+    decoder = None
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if isinstance(chunk, bytes):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)()
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    if decoder is not None:
+        tail = decoder.decode(b'', final=True)
+        if tail:
+            yield tail
+
+
+def _chunks_of(source, chunk_size, encoding):
+    if isinstance(source, (str, os.PathLike)):
+        return iter_file_chunks(source, chunk_size, encoding)
+    if hasattr(source, 'read'):
+        return iter_stream_chunks(source, chunk_size, encoding)
+    return iter(source)
+
+
+def find_all(pattern, source, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Recorre de forma perezosa todas las coincidencias no solapadas de un patrón
+    (con las mismas reglas que ``re.finditer``) en un archivo o flujo.
+
+    Args:
+        pattern (str | RegexEngine): Expresión regular del subconjunto soportado o
+            patrón ya compilado.
+        source: Ruta de un archivo (se proyecta con mmap), objeto con ``read`` o
+            iterable de bloques de texto.
+        chunk_size (int): Tamaño de cada bloque leído.
+        encoding (str): Codificación de los archivos y flujos binarios.
+
+    Yields:
+        StreamMatch: (start, end, groups) con posiciones absolutas.
+
+    Raises:
+        ValueError: Si el patrón es inválido o el tamaño de bloque no es positivo.
+    """
+    if chunk_size < 1:
+        raise ValueError("El tamaño de bloque debe ser positivo")
+    engine = pattern if isinstance(pattern, RegexEngine) else RegexEngine(pattern)
+    chunks = _chunks_of(source, chunk_size, encoding)
+
+    buffer = ''
+    base = 0  # Posición absoluta de buffer[0]
+    pos = 0   # Posición de búsqueda dentro de buffer
+    allow_empty = True
+    eof = False
+    while True:
+        length = len(buffer)
+        if not eof and pos >= length - 2:
+            match, stop = None, length
+        else:
+            match, stop = engine._search(buffer, pos, length, allow_empty)
+        # Las banderas de las dos últimas posiciones (``$``) dependen del texto siguiente
+        if eof or stop < length - 2:
+            if match is None:
+                return
+            start, end = match.span()
+            yield StreamMatch(base + start, base + end, match.groups())
+            allow_empty = end != start
+            pos = end
+            if pos > chunk_size:
+                # Se conserva un carácter antes de pos para que '^' no se cumpla allí
+                buffer = buffer[pos - 1:]
+                base += pos - 1
+                pos = 1
+            continue
+
+        if match is not None:
+            keep = pos
+        else:
+            # Las dos últimas posiciones se conservan siempre: sus banderas aún no se conocen
+            keep = min(engine.earliest_viable_start(buffer, pos, length), max(pos, length - 2))
+        if keep > pos:
+            allow_empty = True
+        cut = keep - 1 if keep > 0 else 0
+        buffer = buffer[cut:]
+        base += cut
+        pos = keep - cut
+        # Se lee al menos hasta duplicar lo conservado: cada nueva pasada sobre la
+        # ventana cuesta lo mismo que el texto leído desde la anterior
+        retained = len(buffer)
+        parts = [buffer]
+        while True:
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+                break
+            parts.append(chunk)
+            retained -= len(chunk)
+            if retained <= 0:
+                break
+        buffer = ''.join(parts)
+
+
+class MatchIndex:
+    """
+    Índice compacto de las posiciones de una serie de coincidencias.
+
+    Guarda los inicios y finales en arreglos ``array('q')``, de modo que se puede
+    saltar a la coincidencia N sin conservar los objetos de coincidencia.
+    """
+    def __init__(self):
+        self.starts = array('q')
+        self.ends = array('q')
+
+    @classmethod
+    def from_matches(cls, matches):
+        """
+        Construye el índice consumiendo un iterable de coincidencias.
+
+        Args:
+            matches: Iterable de StreamMatch, RegexMatch o pares (start, end).
+
+        Returns:
+            MatchIndex: Índice con las posiciones en el orden recibido.
+        """
+        index = cls()
+        for match in matches:
+            if hasattr(match, 'span'):
+                index.append(*match.span())
+            else:
+                index.append(match[0], match[1])
+        return index
+
+    def append(self, start, end):
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, n):
+        return self.starts[n], self.ends[n]
+
+    def __iter__(self):
+        return zip(self.starts, self.ends)
+
+    def span(self, n):
+        """
+        Posiciones de la coincidencia ``n`` (admite índices negativos).
+
+        Returns:
+            tuple: (start, end).
+        """
+        return self.starts[n], self.ends[n]
+
+    def find(self, position):
+        """
+        Primera coincidencia que termina después de ``position`` (búsqueda binaria).
+
+        Args:
+            position (int): Posición absoluta en el texto.
+
+        Returns:
+            int: Número de la coincidencia, o len(self) si no hay ninguna.
+        """
+        low, high = 0, len(self.ends)
+        while low < high:
+            middle = (low + high) // 2
+            if self.ends[middle] <= position:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+def build_match_index(pattern, source, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+    """
+    Indexa todas las coincidencias de un patrón en un archivo o flujo.
+
+    Returns:
+        MatchIndex: Posiciones de las coincidencias.
+    """
+    return MatchIndex.from_matches(find_all(pattern, source, chunk_size, encoding))
@@ -1,13 +1,24 @@
-from core.automata import Automata
+from core.automata import Automata, TRACE_FULL, TRACE_LEVELS
 
 class AutomataSimulator:
-    def __init__(self, automata=None):
+    def __init__(self, automata=None, trace_level=TRACE_FULL):
+        """
+        :param automata: Autómata a simular (Automata o None)
+        :param trace_level: Nivel de traza: 'none', 'summary' o 'full' (str).
+            Se propaga al autómata cargado.
+        """
+        if trace_level not in TRACE_LEVELS:
+            raise ValueError(f"Nivel de traza inválido: '{trace_level}'. Use uno de {TRACE_LEVELS}")
+        self.trace_level = trace_level
         self.automata = automata
+        if self.automata:
+            self.automata.set_trace_level(trace_level)
         self.simulation_history = []
         
     def load_automata(self, automata):
         """Carga un autómata para simular"""
         self.automata = automata
+        self.automata.set_trace_level(self.trace_level)
         self.reset_simulation()
         
     def reset_simulation(self):
@@ -19,29 +30,57 @@ class AutomataSimulator:
     def step_simulation(self, symbol):
         """
         Realiza un paso de simulación y guarda el historial
+
+        El diccionario del paso tiene la misma forma en todos los niveles de traza;
+        con 'none' y 'summary' su lista de transiciones está vacía y el paso no se
+        guarda en ``simulation_history``.
         
         :return: Dict con información del paso
         """
         if not self.automata:
             raise ValueError("No hay autómata cargado")
             
+        from_states = self.automata.current_states
         current_states, transitions = self.automata.step(symbol)
-        
         step_info = {
             'symbol': symbol,
-            'from_states': self.automata.history[-1]['from_states'],
+            'from_states': from_states,
             'to_states': current_states,
             'transitions': transitions,
             'is_accepted': self.automata.is_accepted()
         }
         
-        self.simulation_history.append(step_info)
+        if self.trace_level == TRACE_FULL:
+            self.simulation_history.append(step_info)
         return step_info
         
     def simulate_string(self, input_string):
-        """Simula una cadena completa"""
+        """
+        Simula una cadena completa
+
+        :return: Lista con la información de cada paso (ver step_simulation)
+        """
         self.reset_simulation()
         results = []
         for symbol in input_string:
             results.append(self.step_simulation(symbol))
-        return results
\ No newline at end of file
+        return results
+
+    def accepts(self, input_string):
+        """
+        Evalúa una cadena sin construir la información de cada paso.
+
+        La evaluación se detiene en cuanto todos los estados actuales están muertos.
+
+        :return: True si la cadena es aceptada
+        """
+        if not self.automata:
+            raise ValueError("No hay autómata cargado")
+        self.simulation_history = []
+        return self.automata.simulate(input_string)
+
+    def get_state_trace(self):
+        """Secuencia de conjuntos de estados registrada con el nivel 'summary'"""
+        if not self.automata:
+            raise ValueError("No hay autómata cargado")
+        return self.automata.get_state_trace()
@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import scrolledtext, messagebox
-from core.regex_logic import RegexSimulator
+from core.regex_logic import RegexSimulator, ENGINE_RE, ENGINE_DFA, ENGINE_AUTO, ENGINE_BACKTRACK
 
 class RegexSimulatorApp:
     def __init__(self, master: tk.Toplevel):
@@ -44,6 +44,21 @@ class RegexSimulatorApp:
         # Ejemplo de texto por defecto (ahora una sola cadena)
         self.text_input.insert(0, "123-456-7890")
 
+        # Selección del motor: el AFD de tiempo lineal no se bloquea con patrones patológicos.
+        # En modo automático el análisis estático desvía a él los patrones peligrosos.
+        self.engine_var = tk.StringVar(value=ENGINE_AUTO)
+        engine_frame = tk.Frame(self.input_frame)
+        engine_frame.pack(anchor="w", pady=(5, 0))
+        tk.Label(engine_frame, text="Motor:").pack(side="left")
+        tk.Radiobutton(engine_frame, text="Automático", variable=self.engine_var,
+                       value=ENGINE_AUTO).pack(side="left")
+        tk.Radiobutton(engine_frame, text="re (retroceso)", variable=self.engine_var,
+                       value=ENGINE_RE).pack(side="left")
+        tk.Radiobutton(engine_frame, text="AFD (tiempo lineal)", variable=self.engine_var,
+                       value=ENGINE_DFA).pack(side="left")
+        tk.Radiobutton(engine_frame, text="Retroceso medido", variable=self.engine_var,
+                       value=ENGINE_BACKTRACK).pack(side="left")
+
         self.simulate_button = tk.Button(self.input_frame, text="Simular Expresión Regular",
                                          command=self.run_simulation,
                                          bg="#4CAF50", fg="white", activebackground="#45a049",
@@ -76,7 +91,7 @@ class RegexSimulatorApp:
         text = self.text_input.get().strip()
 
         # Instanciar la lógica del simulador
-        simulator = RegexSimulator(pattern, text)
+        simulator = RegexSimulator(pattern, text, engine=self.engine_var.get())
         success = simulator.run_simulation()
 
         # Limpiar resultados anteriores en la GUI
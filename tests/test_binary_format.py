@@ -0,0 +1,60 @@
+"""
+Formato binario proyectable en memoria (core.binary_format).
+
+Ejecutar desde la raíz del repositorio:
+    python -m pytest tests
+"""
+import os
+import struct
+import tempfile
+import unittest
+
+from core import binary_format
+from core.file_handler import AutomataFileHandler
+
+
+class LoadCompiledTest(unittest.TestCase):
+    def setUp(self):
+        automata = AutomataFileHandler.load_automata_from_file('examples/ejemplo_automata.json')
+        self.data = bytearray(binary_format.dump_automata(automata))
+        self.reader = binary_format._Reader(bytes(self.data))
+        self.reader.read_names()
+        self.reader.int32_array(self.reader.num_finals)
+        self.reader.int32_array(self.reader.num_states * (self.reader.num_symbols + 1) + 1)
+        self.reader.int32_array(self.reader.num_targets)
+        self.table_start = self.reader.position
+        self.stride = max(self.reader.num_symbols, 1)
+
+    def load(self, data):
+        fd, path = tempfile.mkstemp(suffix='.autb')
+        with os.fdopen(fd, 'wb') as file:
+            file.write(data)
+        self.addCleanup(os.remove, path)
+        return binary_format.load_compiled(path)
+
+    def test_round_trip(self):
+        compiled = self.load(bytes(self.data))
+        automata = binary_format.load_automata(bytes(self.data))
+        self.assertEqual(len(compiled.states), len(automata.states))
+        self.assertEqual(list(compiled.states), automata.states)
+        self.assertEqual(compiled.states[-1], automata.states[-1])
+        for text in ['', 'a', 'ab', 'abab', 'bba']:
+            try:
+                expected = automata.simulate(text)
+            except ValueError:
+                continue
+            self.assertEqual(compiled.accepts(text), expected, text)
+
+    def test_entries_out_of_range(self):
+        limit = (self.reader.num_states + 1) * self.stride
+        for entry in [-self.stride, limit, limit + self.stride, 1 if self.stride > 1 else None]:
+            if entry is None:
+                continue
+            data = bytearray(self.data)
+            struct.pack_into('<i', data, self.table_start, entry)
+            with self.assertRaises(ValueError, msg=entry):
+                self.load(bytes(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Análisis estático de retroceso catastrófico (core.regex_analyzer).
+
+Ejecutar desde la raíz del repositorio:
+    python -m pytest tests
+"""
+import unittest
+
+from core.regex_analyzer import (COMPLEXITY_EXPONENTIAL, COMPLEXITY_LINEAR, COMPLEXITY_POLYNOMIAL,
+                                 analyze_regex, has_nullable_loop, languages_intersect)
+from core.regex_logic import ENGINE_AUTO, ENGINE_DFA, RegexSimulator
+from core.regex_parser import parse_regex
+
+
+def _root(pattern):
+    return parse_regex(pattern).root
+
+
+class LanguagesIntersectTest(unittest.TestCase):
+    def test_start_state_loop(self):
+        # El AFD de 'a*' vuelve a su estado inicial: la intersección no es vacía
+        self.assertTrue(languages_intersect(_root('a*'), _root('a*')))
+        self.assertTrue(languages_intersect(_root('(ab)*'), _root('(?:ab)+')))
+
+    def test_disjoint_languages(self):
+        self.assertFalse(languages_intersect(_root('a+'), _root('b+')))
+        self.assertFalse(languages_intersect(_root('a*'), _root('b*')))
+
+    def test_empty_string(self):
+        self.assertFalse(languages_intersect(_root('a*'), _root('b*'), nonempty=True))
+        self.assertTrue(languages_intersect(_root('a*'), _root('b*'), nonempty=False))
+
+
+class NullableLoopTest(unittest.TestCase):
+    def test_with_and_without_groups(self):
+        for pattern in ['(a?|b)*', '(?:a?|b)*', '(a*)*b', '(a|)+']:
+            self.assertTrue(has_nullable_loop(parse_regex(pattern)), pattern)
+        for pattern in ['(a|b)*', 'a*b*', '(a?){1}', '(?:ab)+']:
+            self.assertFalse(has_nullable_loop(parse_regex(pattern)), pattern)
+
+
+class AnalyzeRegexTest(unittest.TestCase):
+    def assert_complexity(self, patterns, complexity):
+        for pattern in patterns:
+            self.assertEqual(analyze_regex(pattern).complexity, complexity, pattern)
+
+    def test_nested_quantifiers(self):
+        self.assert_complexity(['(a*)*b', '(a*)+b', '(.*)*z', '(a+)+b', '(a|aa)+b',
+                                '^(\\w+\\s?)*$'], COMPLEXITY_EXPONENTIAL)
+
+    def test_overlapping_quantifiers(self):
+        self.assert_complexity(['\\d+\\d+', '.*a.*'], COMPLEXITY_POLYNOMIAL)
+
+    def test_linear_patterns(self):
+        self.assert_complexity(['abc', '(ab)*c', 'a*b*', '(a|b)*c', '\\d+-\\d+'], COMPLEXITY_LINEAR)
+
+    def test_auto_engine_avoids_backtracking(self):
+        simulator = RegexSimulator('(a*)*b', 'a' * 40, engine=ENGINE_AUTO)
+        self.assertTrue(simulator.run_simulation())
+        self.assertEqual(simulator.engine_used, ENGINE_DFA)
+        self.assertIsNone(simulator.match)
+
+
+if __name__ == '__main__':
+    unittest.main()
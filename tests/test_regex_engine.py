@@ -0,0 +1,93 @@
+"""
+Paridad del motor AFD (core.regex_engine) con el módulo ``re``.
+
+Ejecutar desde la raíz del repositorio:
+    python -m pytest tests
+    python -m unittest discover tests
+"""
+import random
+import re
+import unittest
+
+from core.regex_analyzer import has_nullable_loop
+from core.regex_engine import RegexEngine
+
+# Patrones sin grupos dentro de bucles anulables: spans, grupos y lastindex deben coincidir
+PATTERNS = [
+    'abc', 'a|b|c', '(a|ab)(c|bcd)', '(a+)+b', '(a|aa)+b', '(\\w+\\s?)*$', '(\\d+)-(\\d+)',
+    '^(a)(b)?c', '(a+?)(a*)', '((a)|b)+', '(?:(a)|(b))*c', 'a{2,3}(b{1,2})', '(x|xy)(z|yz)?',
+    '(ab|a)(bc|c)', '\\s*(\\w+)\\s*$', '(a|b)*?b', '^$', '(?:ab)+(c)', '(\\d{1,3})\\.?',
+]
+TEXTS = ['', 'a', 'ab', 'abc', 'aab', 'aaab', 'abcd', 'xyz', 'ab bc', '12-34', 'a\n', 'abbc',
+         'aaaaaaaaaaaaaaaaaaaac', 'abab c', '192.168', 'xyyz']
+
+# Átomos y cuantificadores del generador aleatorio (cuerpos de bucle nunca vacíos)
+_ATOMS = ['a', 'b', 'c', '.', '[ab]', '[^a]', '\\d', '\\s', '\\w', '(a)', '(b|c)', '(?:ab)']
+_QUANTIFIERS = ['*', '+', '?', '{2}', '{1,3}', '*?', '+?', '??']
+
+
+def _random_pattern(rng, depth=0):
+    roll = rng.random()
+    if depth > 3 or roll < 0.3:
+        return rng.choice(_ATOMS)
+    if roll < 0.55:
+        return _random_pattern(rng, depth + 1) + _random_pattern(rng, depth + 1)
+    if roll < 0.7:
+        return '(' + _random_pattern(rng, depth + 1) + '|' + _random_pattern(rng, depth + 1) + ')'
+    return '(' + _random_pattern(rng, depth + 1) + ')' + rng.choice(_QUANTIFIERS)
+
+
+def _summary(match, groups):
+    if match is None:
+        return None
+    return match.span(), [match.span(index) for index in range(1, groups + 1)], match.lastindex
+
+
+class RegexEngineParityTest(unittest.TestCase):
+    def assert_parity(self, pattern, text):
+        expected = re.compile(pattern)
+        engine = RegexEngine(pattern)
+        self.assertEqual(_summary(engine.search(text), expected.groups),
+                         _summary(expected.search(text), expected.groups),
+                         f"search({pattern!r}, {text!r})")
+        self.assertEqual([_summary(match, expected.groups) for match in engine.finditer(text)],
+                         [_summary(match, expected.groups) for match in expected.finditer(text)],
+                         f"finditer({pattern!r}, {text!r})")
+
+    def test_fixed_patterns(self):
+        for pattern in PATTERNS:
+            for text in TEXTS:
+                self.assert_parity(pattern, text)
+
+    def test_random_patterns_without_nullable_loops(self):
+        rng = random.Random(2024)
+        checked = 0
+        while checked < 300:
+            pattern = _random_pattern(rng)
+            engine = RegexEngine(pattern)
+            if has_nullable_loop(engine.parsed):
+                continue
+            checked += 1
+            for _ in range(5):
+                text = ''.join(rng.choice('abc1 \n') for _ in range(rng.randint(0, 10)))
+                self.assert_parity(pattern, text)
+
+    def test_empty_iteration_of_nullable_loop(self):
+        # La última iteración vacía del bucle fija el grupo, como en re
+        for pattern, text in [('(a*)*b', 'aab'), ('(x*)*y', 'xxy'), ('(a?)*', 'aa'),
+                              ('(a|)+b', 'aab'), ('(a*)+b', 'aab')]:
+            self.assert_parity(pattern, text)
+
+    def test_groups_do_not_change_the_match(self):
+        # Los grupos solo informan posiciones: el mismo patrón sin grupos da los mismos intervalos
+        for pattern, text in [('(a?|b)*', 'ab'), ('(a?|b)*', 'abba'), ('((a)|b?)*c', 'abc'),
+                              ('(a*)*b', 'aab'), ('(x?|(a))*b', 'aab')]:
+            plain = RegexEngine(re.sub(r'\((?!\?)', '(?:', pattern))
+            engine = RegexEngine(pattern)
+            self.assertEqual([match.span() for match in engine.finditer(text)],
+                             [match.span() for match in plain.finditer(text)], pattern)
+        self.assertEqual(RegexEngine('(a?|b)*').search('ab').span(), re.search('(a?|b)*', 'ab').span())
+
+
+if __name__ == '__main__':
+    unittest.main()